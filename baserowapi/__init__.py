@@ -1,3 +1,12 @@
+import logging
+
 from .baserow import Baserow
+from .cassette import Cassette
+from .metrics import RequestEvent, RequestMetrics
+from .multipart import MultipartStream
+from .upload_cache import UploadCache
 from .models import *
 from .validators.filter_validator import FilterValidator
+
+# The package only emits log records; handlers are configured by the application.
+logging.getLogger(__name__).addHandler(logging.NullHandler())
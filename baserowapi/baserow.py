@@ -1,9 +1,25 @@
 import requests
 import logging
-from typing import IO, Union, Dict, Optional, Any
+import os
+import re
+import shutil
+import time
+import hashlib
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from typing import IO, Union, Dict, Optional, Any, Callable, List
 from baserowapi.models.table import Table
+from baserowapi.models.batch_result import BatchResult, BatchFailure
 import urllib.parse
-from baserowapi.exceptions import BaserowHTTPError
+from baserowapi.cassette import Cassette
+from baserowapi.exceptions import (
+    BaserowAPIError,
+    BaserowHTTPError,
+    FileDownloadError,
+)
+from baserowapi.metrics import RequestEvent
+from baserowapi.multipart import MultipartStream, StreamSource
+from baserowapi.upload_cache import UploadCache, content_hash
 
 
 class Baserow:
@@ -29,13 +45,23 @@ class Baserow:
         503: "Service unavailable at {url}. The server could not process your request in time.",
     }
 
+    # HTTP status codes of transient server errors, for which uploads are retried.
+    RETRY_STATUS_CODES = (429, 500, 502, 503, 504)
+
+    # Baserow names user files '<unique>_<sha256>.<extension>'.
+    FILE_NAME_SHA256 = re.compile(r"_([0-9a-f]{64})(?:\.|$)")
+
     def __init__(
         self,
         url: str = "https://api.baserow.io",
         token: Optional[str] = None,
-        logging_level: int = logging.WARNING,
+        logging_level: Union[int, str, None] = None,
         log_file: Optional[str] = None,
         batch_size: int = 10,
+        on_request: Optional[Callable[[RequestEvent], None]] = None,
+        cassette: Optional[Cassette] = None,
+        pool_size: int = 10,
+        upload_cache: Optional[UploadCache] = None,
     ) -> None:
         """
         Initialize a Baserow client.
@@ -44,12 +70,24 @@ class Baserow:
         :type url: str
         :param token: The authentication token. Defaults to None.
         :type token: str, optional
-        :param logging_level: The logging level. Defaults to logging.WARNING.
-        :type logging_level: int
-        :param log_file: The path to a log file. Defaults to None.
+        :param logging_level: The level of the 'baserowapi' logger. Defaults to None, which
+                              leaves the logging setup untouched.
+        :type logging_level: int or str, optional
+        :param log_file: The path to a log file for the messages of the package. Defaults to None.
         :type log_file: str, optional
         :param batch_size: The default batch size for operations. Defaults to 10.
         :type batch_size: int
+        :param on_request: A hook called with a RequestEvent after every API request. Defaults to None.
+        :type on_request: Callable[[RequestEvent], None], optional
+        :param cassette: A cassette to record API exchanges to, or to replay them from instead of
+                         contacting the server. Defaults to None.
+        :type cassette: Cassette, optional
+        :param pool_size: The maximum number of pooled connections per host, which bounds the
+                          concurrency of parallel requests. Defaults to 10.
+        :type pool_size: int
+        :param upload_cache: A cache of uploaded file contents. Files whose content is cached are
+                             not uploaded again. Defaults to None.
+        :type upload_cache: UploadCache, optional
         """
         self.url = url
         self.token = token
@@ -59,27 +97,59 @@ class Baserow:
         }
         self.session = requests.Session()
         self.session.headers.update(self.headers)
-        self.configure_logging(logging_level, log_file)
+        adapter = requests.adapters.HTTPAdapter(
+            pool_connections=pool_size, pool_maxsize=pool_size
+        )
+        self.session.mount("http://", adapter)
+        self.session.mount("https://", adapter)
+        if logging_level is not None or log_file is not None:
+            self.configure_logging(logging_level, log_file)
         self.batch_size = batch_size
-
-    def configure_logging(self, level: int, log_file: Optional[str]) -> None:
+        self.request_hooks: List[Callable[[RequestEvent], None]] = []
+        self._request_context = threading.local()
+        if on_request is not None:
+            self.add_request_hook(on_request)
+        self.cassette = cassette
+        self.upload_cache = upload_cache
+
+    def configure_logging(
+        self, level: Union[int, str, None] = None, log_file: Optional[str] = None
+    ) -> None:
         """
         Configure logging for the Baserow client.
 
-        :param level: The logging level.
-        :type level: int
+        Only the 'baserowapi' package logger is changed, and only as requested: the level is set
+        if given, and a log file handler is attached if a path is given. A console handler is
+        attached only if the application has not configured the root logger, so records are
+        not printed twice. Calling this again replaces the handlers added by a previous call.
+
+        :param level: The logging level. Defaults to None, which keeps the current level.
+        :type level: int or str, optional
         :param log_file: The path to a log file. If provided, logs will also be written to this file.
         :type log_file: str, optional
         """
-        handlers = [logging.StreamHandler()]
+        package_logger = logging.getLogger("baserowapi")
+        for handler in list(package_logger.handlers):
+            if getattr(handler, "_baserowapi_configured", False):
+                package_logger.removeHandler(handler)
+                handler.close()
+
+        handlers: List[logging.Handler] = []
+        if not logging.getLogger().handlers:
+            handlers.append(logging.StreamHandler())
         if log_file:
             handlers.append(logging.FileHandler(log_file))
 
-        logging.basicConfig(
-            level=level,
-            format="%(asctime)s - %(name)s - %(levelname)s - %(message)s",
-            handlers=handlers,
+        formatter = logging.Formatter(
+            "%(asctime)s - %(name)s - %(levelname)s - %(message)s"
         )
+        for handler in handlers:
+            handler.setFormatter(formatter)
+            handler._baserowapi_configured = True
+            package_logger.addHandler(handler)
+
+        if level is not None:
+            package_logger.setLevel(level)
 
     def __repr__(self) -> str:
         """
@@ -90,6 +160,78 @@ class Baserow:
         """
         return f"Baserow client for base url {self.url}"
 
+    def add_request_hook(self, hook: Callable[[RequestEvent], None]) -> None:
+        """
+        Register a hook called with a RequestEvent after every API request.
+
+        Hooks receive the method, endpoint template, status code, transferred bytes and latency
+        of each request, e.g. to feed a :class:`baserowapi.metrics.RequestMetrics` aggregator.
+        Exceptions raised by hooks are logged and ignored.
+
+        :param hook: The callable to register.
+        :type hook: Callable[[RequestEvent], None]
+        """
+        self.request_hooks.append(hook)
+
+    def remove_request_hook(self, hook: Callable[[RequestEvent], None]) -> None:
+        """
+        Unregister a previously registered request hook.
+
+        :param hook: The callable to remove.
+        :type hook: Callable[[RequestEvent], None]
+        :raises ValueError: If the hook is not registered.
+        """
+        self.request_hooks.remove(hook)
+
+    def _emit_request_event(self, event: RequestEvent) -> None:
+        """
+        Pass a RequestEvent to all registered hooks.
+
+        :param event: The event describing the finished request.
+        :type event: RequestEvent
+        """
+        logger = logging.getLogger(__name__)
+        for hook in self.request_hooks:
+            try:
+                hook(event)
+            except Exception as e:
+                logger.warning(f"Request hook {hook!r} failed: {e}")
+
+    def queue_task(self, fn: Callable[..., Any]) -> Callable[..., Any]:
+        """
+        Wrap a task submitted to an executor so its first request reports the queue wait.
+
+        The time between this call and the start of the task is passed as ``queued`` to the
+        RequestEvent of the first API request the task makes, e.g.
+        ``executor.submit(client.queue_task(fetch), page)``.
+
+        :param fn: The task making API requests.
+        :type fn: Callable[..., Any]
+        :return: A callable taking the same arguments as the task.
+        :rtype: Callable[..., Any]
+        """
+        submitted = time.perf_counter()
+
+        def task(*args: Any, **kwargs: Any) -> Any:
+            self._request_context.queued = time.perf_counter() - submitted
+            try:
+                return fn(*args, **kwargs)
+            finally:
+                self._request_context.queued = 0.0
+
+        return task
+
+    def _take_queued(self) -> float:
+        """
+        Return the queue wait of the current task once, see `queue_task`.
+
+        :return: The queue wait in seconds, or 0.0 if it was already reported.
+        :rtype: float
+        """
+        queued = getattr(self._request_context, "queued", 0.0)
+        self._request_context.queued = 0.0
+        return queued
+
     def get_table(self, table_id: int) -> Table:
         """
         Retrieve a table instance based on its ID.
@@ -101,6 +243,407 @@ class Baserow:
         """
         return Table(table_id, self)
 
+    def upload_file(
+        self,
+        source: Union[str, os.PathLike, StreamSource],
+        retries: int = 0,
+        file_name: Optional[str] = None,
+        size: Optional[int] = None,
+        progress: Optional[Callable[[int, Optional[int]], None]] = None,
+    ) -> Dict[str, Any]:
+        """
+        Upload a file to the user files of Baserow.
+
+        The file is streamed as a multipart body in chunks, so it is never loaded into memory as
+        a whole. Sources of unknown size, like generators, are sent with chunked transfer encoding.
+
+        :param source: The path of a local file, a readable binary file-like object, bytes, or an
+                       iterable of bytes chunks.
+        :type source: Union[str, os.PathLike, bytes, IO[bytes], Iterable[bytes]]
+        :param retries: How often to retry after a connection error or a transient server error.
+                        Only paths, bytes and seekable file objects can be retried. Defaults to 0.
+        :type retries: int
+        :param file_name: The file name stored in Baserow. Defaults to the name of the file, or
+                          'upload' if the source has no name.
+        :type file_name: str, optional
+        :param size: The size of the file, to send a Content-Length for sources of unknown size.
+        :type size: int, optional
+        :param progress: Called with the number of bytes sent so far and the total size, or None
+                         if the size is unknown.
+        :type progress: Callable[[int, Optional[int]], None], optional
+        :return: The file object returned by Baserow, to be used as a value of a file field. If
+                 the client has an upload cache and the content was uploaded before, the cached
+                 file object is returned without uploading the file again.
+        :rtype: dict[str, Any]
+        :raises BaserowHTTPError: If Baserow rejects the file, or a transient error persists.
+        :raises OSError: If the file cannot be read.
+        """
+        logger = logging.getLogger(__name__)
+        if isinstance(source, (str, os.PathLike)):
+            with open(source, "rb") as f:
+                return self.upload_file(
+                    f,
+                    retries=retries,
+                    file_name=file_name or os.path.basename(source),
+                    size=size,
+                    progress=progress,
+                )
+
+        if file_name is None:
+            name = getattr(source, "name", None)
+            file_name = os.path.basename(name) if isinstance(name, str) else "upload"
+
+        sha256 = None
+        if self.upload_cache is not None:
+            sha256 = content_hash(source)
+            cached = sha256 and self.upload_cache.get(self.url, sha256, file_name)
+            if cached:
+                logger.debug("Reusing cached upload of %s (%s).", file_name, sha256)
+                return cached
+
+        stream = MultipartStream(source, file_name, size=size, progress=progress)
+        attempt = 0
+        while True:
+            try:
+                response = self.make_api_request(
+                    "/api/user-files/upload-file/",
+                    method="POST",
+                    data=stream,
+                    retries=attempt,
+                )
+                break
+            except Exception as e:
+                transient = (
+                    e.status_code in self.RETRY_STATUS_CODES
+                    if isinstance(e, BaserowHTTPError)
+                    else not isinstance(e, BaserowAPIError)
+                )
+                if not transient or attempt >= retries or not stream.rewindable:
+                    raise
+                attempt += 1
+                delay = 0.5 * 2 ** (attempt - 1)
+                logger.warning(
+                    "Upload of %s failed (%s). Retry %d of %d in %.1fs.",
+                    file_name,
+                    e,
+                    attempt,
+                    retries,
+                    delay,
+                )
+                time.sleep(delay)
+                stream.rewind()
+
+        # Only cache descriptors whose content-derived name confirms the local hash.
+        if sha256 and isinstance(response, dict):
+            match = self.FILE_NAME_SHA256.search(response.get("name") or "")
+            if match and match.group(1) == sha256:
+                self.upload_cache.put(self.url, sha256, response)
+        return response
+
+    def upload_files(
+        self,
+        file_paths: List[Union[str, os.PathLike, StreamSource]],
+        max_workers: int = 4,
+        retries: int = 2,
+    ) -> BatchResult:
+        """
+        Upload files to the user files of Baserow in parallel.
+
+        Every file is uploaded and retried independently, so a failing file does not abort the
+        others. The number of concurrent uploads is bounded by ``max_workers`` and the uploads
+        share the pooled connections of the client session.
+
+        :param file_paths: The paths of the files to upload. File objects and other sources
+                           accepted by `upload_file` can be mixed in.
+        :type file_paths: list
+        :param max_workers: The maximum number of concurrent uploads. Defaults to 4.
+        :type max_workers: int
+        :param retries: How often to retry each file after a connection error or a transient
+                        server error. Defaults to 2.
+        :type retries: int
+        :return: The file objects returned by Baserow in input order, and a BatchFailure
+                 for every file that could not be uploaded.
+        :rtype: BatchResult
+        """
+        logger = logging.getLogger(__name__)
+        if not file_paths:
+            return BatchResult()
+
+        with ThreadPoolExecutor(max_workers=max(1, max_workers)) as executor:
+            futures = [
+                executor.submit(self.queue_task(self.upload_file), file_path, retries)
+                for file_path in file_paths
+            ]
+
+        result = BatchResult()
+        for index, (file_path, future) in enumerate(zip(file_paths, futures)):
+            error = future.exception()
+            if error is None:
+                result.succeeded.append(future.result())
+            else:
+                logger.warning(f"Failed to upload file {file_path}: {error}")
+                result.failures.append(BatchFailure(index, file_path, error))
+        return result
+
+    def download_file(
+        self,
+        file_obj: Dict[str, Any],
+        target_path: str,
+        retries: int = 2,
+        cache_dir: Optional[str] = None,
+        overwrite: bool = False,
+    ) -> str:
+        """
+        Download a Baserow file object to a local path.
+
+        The file is written to '<target_path>.part' first. If a download is interrupted, the next
+        attempt continues the partial file with an HTTP Range request. The finished file is checked
+        against the size of the file object and against the SHA-256 hash contained in its Baserow
+        name before it is moved into place. An existing target file that passes these checks is
+        not downloaded again.
+
+        :param file_obj: A file object as found in the value of a file field.
+        :type file_obj: dict[str, Any]
+        :param target_path: The local path to write the file to.
+        :type target_path: str
+        :param retries: How often to retry after a connection error or a transient server error.
+                        Defaults to 2.
+        :type retries: int
+        :param cache_dir: A directory of previously downloaded files, stored by their Baserow name.
+                          Files found there are copied instead of downloaded, and downloaded files
+                          are added to it. Defaults to None.
+        :type cache_dir: str, optional
+        :param overwrite: If True, an existing target file that does not match the file object is
+                          replaced. Defaults to False.
+        :type overwrite: bool
+        :return: The target path.
+        :rtype: str
+        :raises FileExistsError: If a different file exists at the target path and overwrite is False.
+        :raises FileDownloadError: If the downloaded file does not match the file object.
+        :raises BaserowHTTPError: If the server returns an error response.
+        """
+        logger = logging.getLogger(__name__)
+        if os.path.exists(target_path):
+            if self._is_same_file(target_path, file_obj):
+                logger.debug("File %s is already downloaded.", target_path)
+                return target_path
+            if not overwrite:
+                raise FileExistsError(
+                    f"A different file already exists at {target_path}."
+                )
+
+        cached_path = os.path.join(cache_dir, file_obj["name"]) if cache_dir else None
+        if cached_path and self._is_same_file(cached_path, file_obj):
+            logger.debug("Copying %s from the download cache.", file_obj["name"])
+            shutil.copyfile(cached_path, target_path)
+            return target_path
+
+        partial_path = f"{target_path}.part"
+        resumed = os.path.exists(partial_path)
+        attempt = 0
+        while True:
+            try:
+                self._download_to(file_obj["url"], partial_path, retries=attempt)
+                if resumed and not self._is_same_file(partial_path, file_obj):
+                    # The partial file came from a different file, start over once.
+                    logger.warning(
+                        "Discarding partial download %s that does not match.",
+                        partial_path,
+                    )
+                    os.remove(partial_path)
+                    resumed = False
+                    continue
+                break
+            except (requests.exceptions.RequestException, BaserowHTTPError) as e:
+                transient = not isinstance(e, BaserowHTTPError) or (
+                    e.status_code in self.RETRY_STATUS_CODES
+                )
+                if not transient or attempt >= retries:
+                    raise
+                attempt += 1
+                delay = 0.5 * 2 ** (attempt - 1)
+                logger.warning(
+                    "Download of %s failed (%s). Retry %d of %d in %.1fs.",
+                    file_obj["url"],
+                    e,
+                    attempt,
+                    retries,
+                    delay,
+                )
+                time.sleep(delay)
+
+        if not self._is_same_file(partial_path, file_obj):
+            os.remove(partial_path)
+            raise FileDownloadError(
+                f"Downloaded file {file_obj['name']} does not match its size or hash."
+            )
+        os.replace(partial_path, target_path)
+
+        if cached_path:
+            os.makedirs(cache_dir, exist_ok=True)
+            shutil.copyfile(target_path, f"{cached_path}.tmp")
+            os.replace(f"{cached_path}.tmp", cached_path)
+        return target_path
+
+    def download_files(
+        self,
+        file_objs: List[Dict[str, Any]],
+        directory_path: str,
+        max_workers: int = 4,
+        retries: int = 2,
+        cache_dir: Optional[str] = None,
+        overwrite: bool = False,
+    ) -> BatchResult:
+        """
+        Download Baserow file objects to a local directory in parallel.
+
+        Files are stored under their visible name. File objects with the same Baserow name refer
+        to the same content and are downloaded once. If different files share a visible name,
+        the later ones get the first characters of their Baserow name appended.
+
+        :param file_objs: File objects as found in the values of file fields.
+        :type file_objs: list[dict[str, Any]]
+        :param directory_path: The directory to download the files to. It is created if needed.
+        :type directory_path: str
+        :param max_workers: The maximum number of concurrent downloads. Defaults to 4.
+        :type max_workers: int
+        :param retries: How often to retry each file after a connection error or a transient
+                        server error. Defaults to 2.
+        :type retries: int
+        :param cache_dir: A directory of previously downloaded files, see `download_file`.
+        :type cache_dir: str, optional
+        :param overwrite: If True, existing local files that do not match are replaced.
+        :type overwrite: bool
+        :return: The local paths of the distinct files, and a BatchFailure for every file that
+                 could not be downloaded. The index of a failure refers to the distinct files.
+        :rtype: BatchResult
+        """
+        logger = logging.getLogger(__name__)
+        os.makedirs(directory_path, exist_ok=True)
+
+        unique_files: Dict[str, Dict[str, Any]] = {}
+        for file_obj in file_objs:
+            unique_files.setdefault(file_obj["name"], file_obj)
+
+        target_paths = []
+        used_names = set()
+        for name, file_obj in unique_files.items():
+            file_name = file_obj.get("visible_name") or name
+            if file_name in used_names:
+                stem, extension = os.path.splitext(file_name)
+                file_name = f"{stem}_{name[:8]}{extension}"
+            used_names.add(file_name)
+            target_paths.append(os.path.join(directory_path, file_name))
+
+        with ThreadPoolExecutor(max_workers=max(1, max_workers)) as executor:
+            futures = [
+                executor.submit(
+                    self.queue_task(self.download_file),
+                    file_obj,
+                    target_path,
+                    retries,
+                    cache_dir,
+                    overwrite,
+                )
+                for file_obj, target_path in zip(unique_files.values(), target_paths)
+            ]
+
+        result = BatchResult()
+        for index, (file_obj, future) in enumerate(zip(unique_files.values(), futures)):
+            error = future.exception()
+            if error is None:
+                result.succeeded.append(future.result())
+            else:
+                logger.warning(f"Failed to download file {file_obj['name']}: {error}")
+                result.failures.append(BatchFailure(index, file_obj, error))
+        return result
+
+    def _download_to(self, url: str, partial_path: str, retries: int = 0) -> None:
+        """
+        Download a URL to a partial file, continuing it if it already has content.
+
+        Like API requests, every download attempt is reported to the request hooks.
+
+        :param url: The URL of the file.
+        :type url: str
+        :param partial_path: The path of the partial file.
+        :type partial_path: str
+        :param retries: The number of previous attempts, reported to the request hooks.
+        :type retries: int
+        :raises BaserowHTTPError: If the server returns an error response.
+        """
+        offset = os.path.getsize(partial_path) if os.path.exists(partial_path) else 0
+        # Media URLs may point to an object store, which must not receive the database token.
+        headers = {"Authorization": None, "Content-Type": None}
+        if offset:
+            headers["Range"] = f"bytes={offset}-"
+
+        queued = self._take_queued()
+        started = time.perf_counter()
+        status_code = None
+        received = 0
+        error = None
+        try:
+            with self.session.get(
+                url, headers=headers, stream=True, timeout=30
+            ) as response:
+                status_code = response.status_code
+                if response.status_code == 416:
+                    # The partial file is not a prefix of the file, start over.
+                    os.remove(partial_path)
+                    raise BaserowHTTPError(503, f"Restarting download of {url}.")
+                if response.status_code >= 400:
+                    raise BaserowHTTPError(
+                        response.status_code, f"Failed to download {url}."
+                    )
+                mode = "ab" if response.status_code == 206 else "wb"
+                with open(partial_path, mode) as f:
+                    for chunk in response.iter_content(chunk_size=65536):
+                        f.write(chunk)
+                        received += len(chunk)
+        except Exception as e:
+            error = e
+            raise
+        finally:
+            if self.request_hooks:
+                self._emit_request_event(
+                    RequestEvent(
+                        "GET",
+                        url,
+                        status_code=status_code,
+                        bytes_received=received,
+                        latency=time.perf_counter() - started,
+                        retries=retries,
+                        queued=queued,
+                        error=error,
+                    )
+                )
+
+    def _is_same_file(self, path: str, file_obj: Dict[str, Any]) -> bool:
+        """
+        Check a local file against the size and the SHA-256 hash of a Baserow file object.
+
+        :param path: The path of the local file.
+        :type path: str
+        :param file_obj: The Baserow file object.
+        :type file_obj: dict[str, Any]
+        :return: True if the local file exists and matches.
+        :rtype: bool
+        """
+        if not os.path.isfile(path):
+            return False
+        size = file_obj.get("size")
+        if size is not None and os.path.getsize(path) != size:
+            return False
+        match = self.FILE_NAME_SHA256.search(file_obj.get("name", ""))
+        if match:
+            digest = hashlib.sha256()
+            with open(path, "rb") as f:
+                for chunk in iter(lambda: f.read(1024 * 1024), b""):
+                    digest.update(chunk)
+            return digest.hexdigest() == match.group(1)
+        return True
+
     def make_api_request(
         self,
         endpoint: str,
@@ -109,6 +652,8 @@ class Baserow:
         headers: Optional[Dict[str, str]] = None,
         timeout: int = 10,
         files: Optional[Dict[str, IO[bytes]]] = None,
+        retries: int = 0,
+        queued: Optional[float] = None,
     ) -> Any:
         """
         Make an API request to the specified endpoint.
@@ -117,17 +662,25 @@ class Baserow:
         :type endpoint: str
         :param method: The HTTP method to use, by default "GET".
         :type method: str
-        :param data: The data payload to send with the request, by default None.
-        :type data: dict, optional
+        :param data: The data payload to send with the request, by default None. A
+                     MultipartStream is sent as a streamed multipart body.
+        :type data: dict or MultipartStream, optional
         :param headers: Additional headers to send with the request, by default None.
         :type headers: dict, optional
         :param timeout: The maximum number of seconds to wait for the server response, by default 10.
         :type timeout: int
         :param files: Files to be sent with the request, by default None.
         :type files: dict, optional
+        :param retries: The number of previous attempts of this request, reported to the
+                        request hooks. By default 0.
+        :type retries: int
+        :param queued: The seconds the request waited before it was sent, reported to the
+                       request hooks. By default the queue wait of the task, see `queue_task`.
+        :type queued: float, optional
         :return: The parsed response data.
         :rtype: Any
-        :raises BaserowHTTPError: If the response status code is in the defined ERROR_MESSAGES.
+        :raises BaserowHTTPError: If the response status code indicates an error. The error detail
+                                  returned by Baserow is available as ``detail``.
         """
         logger = logging.getLogger(__name__)
 
@@ -140,14 +693,61 @@ class Baserow:
 
         combined_headers = self.get_combined_headers(headers)
 
-        response = self.perform_request(
-            method, url, combined_headers, data, timeout, files
-        )
+        if queued is None:
+            queued = self._take_queued()
+        started = time.perf_counter()
+        try:
+            if self.cassette is not None and self.cassette.mode == "replay":
+                response = self.cassette.play(method, url, data, files)
+            else:
+                response = self.perform_request(
+                    method, url, combined_headers, data, timeout, files
+                )
+                if self.cassette is not None:
+                    self.cassette.record(method, url, data, files, response)
+        except Exception as e:
+            if self.request_hooks:
+                self._emit_request_event(
+                    RequestEvent(
+                        method,
+                        url,
+                        latency=time.perf_counter() - started,
+                        retries=retries,
+                        queued=queued,
+                        error=e,
+                    )
+                )
+            raise
+
+        if self.request_hooks:
+            body = response.request.body if response.request is not None else None
+            self._emit_request_event(
+                RequestEvent(
+                    method,
+                    url,
+                    status_code=response.status_code,
+                    bytes_sent=(
+                        len(body)
+                        if isinstance(body, (bytes, str))
+                        else getattr(body, "bytes_sent", 0)
+                    ),
+                    bytes_received=len(response.content),
+                    latency=time.perf_counter() - started,
+                    retries=retries,
+                    queued=queued,
+                )
+            )
 
-        if response.status_code in self.ERROR_MESSAGES:
-            error_message = self.ERROR_MESSAGES[response.status_code].format(url=url)
-            logger.error(error_message)
-            raise BaserowHTTPError(response.status_code, error_message)
+        if response.status_code >= 400:
+            error_message = self.ERROR_MESSAGES.get(
+                response.status_code, "HTTP error at {url}."
+            ).format(url=url)
+            try:
+                detail = response.json()
+            except ValueError:
+                detail = response.text or None
+            logger.error(f"{error_message} Detail: {detail}")
+            raise BaserowHTTPError(response.status_code, error_message, detail)
 
         return self.parse_response(response, method, url)
 
@@ -184,46 +784,52 @@ class Baserow:
         :type url: str
         :param headers: Headers to send with the request.
         :type headers: dict
-        :param data: The data payload to send with the request.
-        :type data: dict, optional
+        :param data: The data payload to send with the request. A MultipartStream is sent as
+                     a streamed multipart body.
+        :type data: dict or MultipartStream, optional
         :param timeout: The maximum number of seconds to wait for the server response.
         :type timeout: int
         :param files: The files to send with the request, if any. The dictionary keys are
                       the form field names, and the values are the file data.
         :type files: dict, optional
-        :return: The server's response to the request.
+        :return: The server's response to the request, including error responses.
         :rtype: requests.Response
-        :raises requests.exceptions.HTTPError: If the response status code is in the defined ERROR_MESSAGES.
         :raises requests.exceptions.Timeout: If the request times out.
         :raises requests.exceptions.RequestException: For other request-related exceptions like connectivity issues.
         :raises Exception: For any other unexpected exceptions.
         """
         logger = logging.getLogger(__name__)
         try:
-            logger.debug(f"Making API request to: {url}")
-            logger.debug(f"Request method: {method}")
-            logger.debug(f"Request payload: {data}")
+            logger.debug("Making API request to: %s", url)
+            logger.debug("Request method: %s", method)
+            logger.debug("Request payload: %s", data)
 
             if files:
-                upload_session = requests.Session()
-                logger.debug(f"API file upload request: {files}")
-                headers.pop("Content-Type", None)
-                logger.debug(f"Files being uploaded: {files}")
-                logger.debug(f"Headers being sent: {headers}")
-                response = upload_session.request(
+                logger.debug("API file upload request: %s", files)
+                # requests sets the multipart Content-Type, drop the JSON one of the session.
+                headers = {**headers, "Content-Type": None}
+                logger.debug("Files being uploaded: %s", files)
+                logger.debug("Headers being sent: %s", headers)
+                response = self.session.request(
                     method="POST",
                     url=url,
                     headers=headers,
                     files=files,
                     timeout=timeout,
                 )
+            elif isinstance(data, MultipartStream):
+                response = self.session.request(
+                    method=method,
+                    url=url,
+                    headers={**headers, "Content-Type": data.content_type},
+                    data=data,
+                    timeout=timeout,
+                )
             else:
                 response = self.session.request(
                     method=method, url=url, headers=headers, json=data, timeout=timeout
                 )
 
-            response.raise_for_status()
-
         except requests.exceptions.Timeout:
             logger.error(f"Request to {url} timed out.")
             raise
@@ -231,7 +837,7 @@ class Baserow:
             logger.error(
                 f"Unexpected error occurred while making a request to {url}: {e}"
             )
-            logger.debug(f"Request payload: {data}")
+            logger.debug("Request payload: %s", data)
             raise Exception(
                 f"Unexpected error occurred while making a request to {url}: {e}"
             )
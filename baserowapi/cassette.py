@@ -0,0 +1,262 @@
+import hashlib
+import json
+import logging
+import mmap
+import os
+import struct
+import threading
+import urllib.parse
+from typing import IO, Any, Dict, List, Optional, Tuple, Union
+
+import requests
+
+from baserowapi.exceptions import CassetteError
+
+MAGIC = b"BASEROWCASSETTE1\n"
+_HEADER_SIZE = struct.Struct("<I")
+
+
+def request_key(
+    method: str,
+    url: str,
+    data: Optional[Any] = None,
+    files: Optional[Dict[str, IO[bytes]]] = None,
+) -> str:
+    """
+    Build the key that identifies a request in a cassette.
+
+    The scheme and host of the URL are ignored, so a cassette recorded against one server
+    can be replayed with a client configured for another one.
+
+    :param method: The HTTP method.
+    :type method: str
+    :param url: The URL or endpoint of the request.
+    :type url: str
+    :param data: The JSON payload of the request.
+    :type data: Any, optional
+    :param files: The files sent with the request. Only their names are part of the key.
+    :type files: dict, optional
+    :return: The request key.
+    :rtype: str
+    """
+    parsed = urllib.parse.urlparse(url)
+    endpoint = parsed._replace(scheme="", netloc="").geturl()
+    body = json.dumps(data, sort_keys=True, default=str)
+    if files:
+        names = {key: getattr(f, "name", key) for key, f in files.items()}
+        body += json.dumps(names, sort_keys=True, default=str)
+    digest = hashlib.blake2b(body.encode(), digest_size=8).hexdigest()
+    return f"{method.upper()} {endpoint} {digest}"
+
+
+class Cassette:
+    """
+    Records the HTTP exchanges of a Baserow client to a file and replays them without network access.
+
+    In 'record' mode every response received by `Baserow.make_api_request` is appended to the
+    cassette file. In 'replay' mode the file is memory-mapped and responses are served from it
+    instead of the server. Identical requests are answered in the order they were recorded;
+    once the recorded responses are used up, the last one is repeated, so recorded workloads
+    can be replayed any number of times, e.g. by a benchmark.
+
+    Each record is stored as a 4-byte header length, a JSON header and the raw response body.
+
+    :ivar path: The path of the cassette file.
+    :vartype path: str
+    :ivar mode: Either 'record' or 'replay'.
+    :vartype mode: str
+    """
+
+    MODES = ("record", "replay")
+
+    def __init__(self, path: Union[str, os.PathLike], mode: str = "replay") -> None:
+        """
+        Initialize a Cassette and open its file.
+
+        :param path: The path of the cassette file.
+        :type path: str or os.PathLike
+        :param mode: 'record' to overwrite the file with new exchanges, 'replay' to serve
+                     recorded exchanges. Defaults to 'replay'.
+        :type mode: str
+        :raises ValueError: If the mode is not supported.
+        :raises CassetteError: If the file to replay is missing or not a cassette.
+        """
+        if mode not in self.MODES:
+            raise ValueError(
+                f"Unsupported cassette mode '{mode}'. Use one of {self.MODES}."
+            )
+        self.path = os.fspath(path)
+        self.mode = mode
+        self.logger = logging.getLogger(__name__)
+        self._file: Optional[IO[bytes]] = None
+        self._mmap: Optional[mmap.mmap] = None
+        self._index: Dict[str, List[Tuple[Dict[str, Any], int, int]]] = {}
+        self._positions: Dict[str, int] = {}
+        self._lock = threading.Lock()
+
+        if mode == "record":
+            self._file = open(self.path, "wb")
+            self._file.write(MAGIC)
+        else:
+            self._load()
+
+    def __repr__(self) -> str:
+        """
+        Provide a string representation of the Cassette.
+
+        :return: A string including the path and mode of the cassette.
+        :rtype: str
+        """
+        return f"Cassette({self.path!r}, mode={self.mode!r})"
+
+    def __enter__(self) -> "Cassette":
+        return self
+
+    def __exit__(self, *exc_info: Any) -> None:
+        self.close()
+
+    def __len__(self) -> int:
+        """
+        The number of recorded exchanges available for replay.
+
+        :return: The number of exchanges.
+        :rtype: int
+        """
+        return sum(len(records) for records in self._index.values())
+
+    def _load(self) -> None:
+        """
+        Memory-map the cassette file and index its records by request key.
+        """
+        try:
+            with open(self.path, "rb") as f:
+                size = os.fstat(f.fileno()).st_size
+                if size < len(MAGIC):
+                    raise CassetteError(f"{self.path} is not a cassette file.")
+                self._mmap = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        except FileNotFoundError:
+            raise CassetteError(f"Cassette file {self.path} does not exist.")
+
+        if self._mmap[: len(MAGIC)] != MAGIC:
+            self._mmap.close()
+            raise CassetteError(f"{self.path} is not a cassette file.")
+
+        position = len(MAGIC)
+        while position + _HEADER_SIZE.size <= len(self._mmap):
+            (header_size,) = _HEADER_SIZE.unpack_from(self._mmap, position)
+            position += _HEADER_SIZE.size
+            try:
+                header = json.loads(self._mmap[position : position + header_size])
+            except ValueError:
+                header = {"body_size": len(self._mmap)}
+            position += header_size
+            body_size = header["body_size"]
+            if position + body_size > len(self._mmap):
+                self.logger.warning(
+                    "Discarding incomplete record at the end of cassette %s.", self.path
+                )
+                break
+            self._index.setdefault(header["key"], []).append(
+                (header, position, body_size)
+            )
+            position += body_size
+
+    def record(
+        self,
+        method: str,
+        url: str,
+        data: Optional[Any],
+        files: Optional[Dict[str, IO[bytes]]],
+        response: requests.Response,
+    ) -> None:
+        """
+        Append an exchange to the cassette.
+
+        :param method: The HTTP method of the request.
+        :type method: str
+        :param url: The URL of the request.
+        :type url: str
+        :param data: The JSON payload of the request.
+        :type data: Any, optional
+        :param files: The files sent with the request.
+        :type files: dict, optional
+        :param response: The response received from the server.
+        :type response: requests.Response
+        :raises CassetteError: If the cassette is not in record mode or already closed.
+        """
+        if self._file is None:
+            raise CassetteError(f"{self!r} is not recording.")
+        body = response.content or b""
+        header = json.dumps(
+            {
+                "key": request_key(method, url, data, files),
+                "status_code": response.status_code,
+                "content_type": response.headers.get("Content-Type"),
+                "body_size": len(body),
+            }
+        ).encode()
+        with self._lock:
+            self._file.write(_HEADER_SIZE.pack(len(header)) + header + body)
+            self._file.flush()
+
+    def play(
+        self,
+        method: str,
+        url: str,
+        data: Optional[Any] = None,
+        files: Optional[Dict[str, IO[bytes]]] = None,
+    ) -> requests.Response:
+        """
+        Serve the recorded response for a request.
+
+        :param method: The HTTP method of the request.
+        :type method: str
+        :param url: The URL of the request.
+        :type url: str
+        :param data: The JSON payload of the request.
+        :type data: Any, optional
+        :param files: The files sent with the request.
+        :type files: dict, optional
+        :return: A response built from the recorded exchange.
+        :rtype: requests.Response
+        :raises CassetteError: If the cassette is not in replay mode or the request was not recorded.
+        """
+        if self._mmap is None:
+            raise CassetteError(f"{self!r} is not replaying.")
+        key = request_key(method, url, data, files)
+        records = self._index.get(key)
+        if not records:
+            raise CassetteError(
+                f"No recorded response for request '{key}' in {self.path}."
+            )
+
+        with self._lock:
+            position = self._positions.get(key, 0)
+            self._positions[key] = position + 1
+        header, offset, size = records[min(position, len(records) - 1)]
+
+        response = requests.Response()
+        response.status_code = header["status_code"]
+        response._content = self._mmap[offset : offset + size]
+        if header["content_type"]:
+            response.headers["Content-Type"] = header["content_type"]
+        response.url = url
+        response.encoding = "utf-8"
+        return response
+
+    def rewind(self) -> None:
+        """
+        Start serving every request from its first recorded response again.
+        """
+        self._positions = {}
+
+    def close(self) -> None:
+        """
+        Close the cassette file.
+        """
+        if self._file is not None:
+            self._file.close()
+            self._file = None
+        if self._mmap is not None:
+            self._mmap.close()
+            self._mmap = None
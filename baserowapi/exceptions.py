@@ -1,3 +1,5 @@
+from typing import Any, List, Optional
+
 # baserow client exceptions
 
 class BaserowAPIError(Exception):
@@ -9,15 +11,18 @@ class BaserowAPIError(Exception):
 class BaserowHTTPError(BaserowAPIError):
     """Exception raised for HTTP errors."""
 
-    def __init__(self, status_code: int, message: str):
+    def __init__(self, status_code: int, message: str, detail: Any = None):
         """
         :param status_code: The HTTP status code.
         :type status_code: int
         :param message: The error message.
         :type message: str
+        :param detail: The error body returned by the server, parsed from JSON when possible.
+        :type detail: Any, optional
         """
         self.status_code = status_code
         self.message = message
+        self.detail = detail
         super().__init__(self.message)
 
     def __str__(self) -> str:
@@ -25,9 +30,23 @@ class BaserowHTTPError(BaserowAPIError):
         :return: The string representation of the error.
         :rtype: str
         """
+        if self.detail:
+            return f"HTTP {self.status_code}: {self.message} Detail: {self.detail}"
         return f"HTTP {self.status_code}: {self.message}"
 
 
+class CassetteError(BaserowAPIError):
+    """Raised when a cassette cannot record or replay a request."""
+
+    pass
+
+
+class FileDownloadError(BaserowAPIError):
+    """Raised when a downloaded file does not match the size or hash of the Baserow file."""
+
+    pass
+
+
 # row exceptions
 
 class RowError(Exception):
@@ -62,25 +81,49 @@ class RowMoveError(RowError):
 
 # table exceptions
 
+class BatchOperationError(BaserowAPIError):
+    """Base class for errors raised by batch operations that may have partially succeeded."""
+
+    def __init__(
+        self,
+        message: str,
+        failed_offset: Optional[int] = None,
+        completed_offsets: Optional[List[int]] = None,
+    ):
+        """
+        :param message: The error message.
+        :type message: str
+        :param failed_offset: The position in the input of the first item of the chunk that failed.
+        :type failed_offset: int, optional
+        :param completed_offsets: The input positions of the first items of the chunks that were
+                                  committed before the failure, including earlier runs resumed
+                                  from a checkpoint.
+        :type completed_offsets: list[int], optional
+        """
+        self.failed_offset = failed_offset
+        self.completed_offsets = completed_offsets or []
+        super().__init__(message)
+
+
 class RowFetchError(BaserowAPIError):
     """Raised when fetching rows fails."""
 
     pass
 
 
-class RowAddError(BaserowAPIError):
+class RowAddError(BatchOperationError):
     """Raised when adding rows fails."""
 
     pass
 
 
-class RowUpdateError(BaserowAPIError):
+class RowUpdateError(BatchOperationError):
     """Raised when updating rows fails."""
 
     pass
 
 
-class RowDeleteError(BaserowAPIError):
+class RowDeleteError(BatchOperationError):
     """Raised when deleting rows fails."""
 
     pass
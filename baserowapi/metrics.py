@@ -0,0 +1,436 @@
+import random
+import re
+import threading
+from typing import Any, Dict, List, Optional, Tuple
+
+_ID_SEGMENT = re.compile(r"/\d+(?=/|$)")
+
+
+def endpoint_template(url: str) -> str:
+    """
+    Reduce a request URL to its endpoint template, e.g. '/api/database/rows/table/{id}/'.
+
+    The scheme, host and query string are dropped and numeric path segments are replaced
+    with '{id}', so requests to the same endpoint can be aggregated.
+
+    :param url: The request URL or endpoint.
+    :type url: str
+    :return: The endpoint template.
+    :rtype: str
+    """
+    path = url.split("?", 1)[0]
+    if "://" in path:
+        path = "/" + path.split("://", 1)[1].partition("/")[2]
+    return _ID_SEGMENT.sub("/{id}", path)
+
+
+class RequestEvent:
+    """
+    Describes a single API request made by the Baserow client.
+
+    :ivar method: The HTTP method.
+    :vartype method: str
+    :ivar endpoint: The endpoint template, with ids replaced by '{id}'.
+    :vartype endpoint: str
+    :ivar url: The full request URL.
+    :vartype url: str
+    :ivar status_code: The HTTP status code, or None if no response was received.
+    :vartype status_code: int, optional
+    :ivar bytes_sent: The size of the request body in bytes.
+    :vartype bytes_sent: int
+    :ivar bytes_received: The size of the response body in bytes.
+    :vartype bytes_received: int
+    :ivar latency: The time between sending the request and receiving the response, in seconds.
+    :vartype latency: float
+    :ivar retries: The number of times the request was retried.
+    :vartype retries: int
+    :ivar queued: The time the request waited before it was sent, in seconds.
+    :vartype queued: float
+    :ivar error: The exception raised for the request, if any.
+    :vartype error: Exception, optional
+    """
+
+    def __init__(
+        self,
+        method: str,
+        url: str,
+        status_code: Optional[int] = None,
+        bytes_sent: int = 0,
+        bytes_received: int = 0,
+        latency: float = 0.0,
+        retries: int = 0,
+        queued: float = 0.0,
+        error: Optional[Exception] = None,
+    ) -> None:
+        """
+        Initialize a RequestEvent.
+
+        :param method: The HTTP method.
+        :param url: The full request URL.
+        :param status_code: The HTTP status code, or None if no response was received.
+        :param bytes_sent: The size of the request body in bytes.
+        :param bytes_received: The size of the response body in bytes.
+        :param latency: The request latency in seconds.
+        :param retries: The number of retries.
+        :param queued: The time spent waiting before the request was sent, in seconds.
+        :param error: The exception raised for the request, if any.
+        """
+        self.method = method
+        self.url = url
+        self.endpoint = endpoint_template(url)
+        self.status_code = status_code
+        self.bytes_sent = bytes_sent
+        self.bytes_received = bytes_received
+        self.latency = latency
+        self.retries = retries
+        self.queued = queued
+        self.error = error
+
+    def __repr__(self) -> str:
+        """
+        Provide a string representation of the RequestEvent.
+
+        :return: A string with the method, endpoint, status and latency.
+        :rtype: str
+        """
+        return (
+            f"RequestEvent({self.method} {self.endpoint} status={self.status_code} "
+            f"latency={self.latency * 1000:.1f}ms)"
+        )
+
+    @property
+    def is_error(self) -> bool:
+        """
+        Whether the request failed, either without a response or with an HTTP error status.
+
+        :return: True if the request failed.
+        :rtype: bool
+        """
+        return self.error is not None or (
+            self.status_code is not None and self.status_code >= 400
+        )
+
+
+class _EndpointStats:
+    """
+    Running statistics for one method and endpoint template.
+    """
+
+    def __init__(self, max_samples: int) -> None:
+        """
+        :param max_samples: The number of latency samples kept for percentiles.
+        :type max_samples: int
+        """
+        self.max_samples = max_samples
+        self.count = 0
+        self.errors = 0
+        self.bytes_sent = 0
+        self.bytes_received = 0
+        self.total_latency = 0.0
+        self.total_queued = 0.0
+        self.retries = 0
+        self.latencies: List[float] = []
+
+    def add(self, event: RequestEvent) -> None:
+        """
+        :param event: The event to add to the statistics.
+        :type event: RequestEvent
+        """
+        self.count += 1
+        self.errors += event.is_error
+        self.bytes_sent += event.bytes_sent
+        self.bytes_received += event.bytes_received
+        self.total_latency += event.latency
+        self.total_queued += event.queued
+        self.retries += event.retries
+
+        # Reservoir sampling keeps the percentile estimate unbiased with bounded memory
+        if len(self.latencies) < self.max_samples:
+            self.latencies.append(event.latency)
+        else:
+            slot = random.randrange(self.count)
+            if slot < self.max_samples:
+                self.latencies[slot] = event.latency
+
+
+def _percentile(samples: List[float], percent: float) -> Optional[float]:
+    """
+    Compute a percentile of the samples using linear interpolation.
+
+    :param samples: The latency samples.
+    :type samples: list[float]
+    :param percent: The percentile, between 0 and 100.
+    :type percent: float
+    :return: The percentile, or None if there are no samples.
+    :rtype: float, optional
+    """
+    if not samples:
+        return None
+    ordered = sorted(samples)
+    position = (len(ordered) - 1) * percent / 100
+    lower = int(position)
+    upper = min(lower + 1, len(ordered) - 1)
+    return ordered[lower] + (ordered[upper] - ordered[lower]) * (position - lower)
+
+
+class RequestMetrics:
+    """
+    Aggregates RequestEvents into counts, latency percentiles, byte totals and error rates.
+
+    An instance can be passed directly as a request hook:
+
+    .. code-block:: python
+
+        metrics = RequestMetrics()
+        client = Baserow(token="mytoken", on_request=metrics)
+        ...
+        print(metrics.summary())
+    """
+
+    def __init__(self, max_samples: int = 10000) -> None:
+        """
+        Initialize a RequestMetrics aggregator.
+
+        :param max_samples: The number of latency samples kept per endpoint for percentiles.
+        :type max_samples: int
+        """
+        self.max_samples = max_samples
+        self._stats: Dict[Tuple[str, str], _EndpointStats] = {}
+        self._lock = threading.Lock()
+
+    def __call__(self, event: RequestEvent) -> None:
+        """
+        Record a RequestEvent.
+
+        :param event: The event to record.
+        :type event: RequestEvent
+        """
+        key = (event.method, event.endpoint)
+        with self._lock:
+            stats = self._stats.get(key)
+            if stats is None:
+                stats = self._stats[key] = _EndpointStats(self.max_samples)
+            stats.add(event)
+
+    def reset(self) -> None:
+        """
+        Discard all recorded statistics.
+        """
+        with self._lock:
+            self._stats = {}
+
+    def _select(
+        self, method: Optional[str], endpoint: Optional[str]
+    ) -> List[_EndpointStats]:
+        """
+        :return: The statistics matching the method and endpoint, None matching everything.
+        :rtype: list[_EndpointStats]
+        """
+        return [
+            stats
+            for (stats_method, stats_endpoint), stats in self._stats.items()
+            if (method is None or stats_method == method)
+            and (endpoint is None or stats_endpoint == endpoint)
+        ]
+
+    def count(
+        self, method: Optional[str] = None, endpoint: Optional[str] = None
+    ) -> int:
+        """
+        The number of recorded requests, optionally restricted to a method and endpoint template.
+
+        :param method: Only count requests with this HTTP method.
+        :type method: str, optional
+        :param endpoint: Only count requests to this endpoint template.
+        :type endpoint: str, optional
+        :return: The number of requests.
+        :rtype: int
+        """
+        with self._lock:
+            return sum(stats.count for stats in self._select(method, endpoint))
+
+    def error_rate(
+        self, method: Optional[str] = None, endpoint: Optional[str] = None
+    ) -> float:
+        """
+        The fraction of failed requests, optionally restricted to a method and endpoint template.
+
+        :param method: Only consider requests with this HTTP method.
+        :type method: str, optional
+        :param endpoint: Only consider requests to this endpoint template.
+        :type endpoint: str, optional
+        :return: The error rate between 0 and 1, or 0 if nothing was recorded.
+        :rtype: float
+        """
+        with self._lock:
+            selected = self._select(method, endpoint)
+            count = sum(stats.count for stats in selected)
+            errors = sum(stats.errors for stats in selected)
+        return errors / count if count else 0.0
+
+    def percentile(
+        self,
+        percent: float,
+        method: Optional[str] = None,
+        endpoint: Optional[str] = None,
+    ) -> Optional[float]:
+        """
+        A latency percentile in seconds, optionally restricted to a method and endpoint template.
+
+        :param percent: The percentile to compute, between 0 and 100.
+        :type percent: float
+        :param method: Only consider requests with this HTTP method.
+        :type method: str, optional
+        :param endpoint: Only consider requests to this endpoint template.
+        :type endpoint: str, optional
+        :return: The latency percentile, or None if nothing was recorded.
+        :rtype: float, optional
+        """
+        with self._lock:
+            samples = [
+                latency
+                for stats in self._select(method, endpoint)
+                for latency in stats.latencies
+            ]
+        return _percentile(samples, percent)
+
+    def summary(self) -> Dict[str, Dict[str, Any]]:
+        """
+        Summarize the statistics of every method and endpoint template.
+
+        :return: A dictionary keyed by 'METHOD endpoint' with counts, error rate, byte totals,
+                 retries, mean queue time and latency percentiles in seconds.
+        :rtype: dict[str, dict[str, Any]]
+        """
+        with self._lock:
+            items = list(self._stats.items())
+            return {
+                f"{method} {endpoint}": {
+                    "count": stats.count,
+                    "errors": stats.errors,
+                    "error_rate": stats.errors / stats.count,
+                    "bytes_sent": stats.bytes_sent,
+                    "bytes_received": stats.bytes_received,
+                    "retries": stats.retries,
+                    "mean_latency": stats.total_latency / stats.count,
+                    "mean_queued": stats.total_queued / stats.count,
+                    "p50": _percentile(stats.latencies, 50),
+                    "p90": _percentile(stats.latencies, 90),
+                    "p99": _percentile(stats.latencies, 99),
+                }
+                for (method, endpoint), stats in items
+            }
+
+
+class PrometheusMetrics:
+    """
+    Request hook exporting client metrics through the optional ``prometheus_client`` package.
+
+    Exposes ``baserow_requests_total``, ``baserow_request_errors_total``,
+    ``baserow_request_latency_seconds`` and ``baserow_request_bytes_total``,
+    labelled by method and endpoint template.
+    """
+
+    def __init__(self, registry: Any = None, namespace: str = "baserow") -> None:
+        """
+        Initialize the Prometheus metrics.
+
+        :param registry: The prometheus_client registry. Defaults to the global registry.
+        :param namespace: The prefix of the metric names.
+        :raises ImportError: If prometheus_client is not installed.
+        """
+        try:
+            import prometheus_client
+        except ImportError as e:
+            raise ImportError(
+                "PrometheusMetrics requires the 'prometheus_client' package."
+            ) from e
+
+        kwargs = {"registry": registry} if registry is not None else {}
+        labels = ["method", "endpoint"]
+        self.requests = prometheus_client.Counter(
+            f"{namespace}_requests_total", "Baserow API requests.", labels, **kwargs
+        )
+        self.errors = prometheus_client.Counter(
+            f"{namespace}_request_errors_total",
+            "Failed Baserow API requests.",
+            labels,
+            **kwargs,
+        )
+        self.latency = prometheus_client.Histogram(
+            f"{namespace}_request_latency_seconds",
+            "Baserow API request latency.",
+            labels,
+            **kwargs,
+        )
+        self.bytes = prometheus_client.Counter(
+            f"{namespace}_request_bytes_total",
+            "Bytes transferred by Baserow API requests.",
+            labels + ["direction"],
+            **kwargs,
+        )
+
+    def __call__(self, event: RequestEvent) -> None:
+        """
+        Record a RequestEvent.
+
+        :param event: The event to record.
+        :type event: RequestEvent
+        """
+        self.requests.labels(event.method, event.endpoint).inc()
+        if event.is_error:
+            self.errors.labels(event.method, event.endpoint).inc()
+        self.latency.labels(event.method, event.endpoint).observe(event.latency)
+        self.bytes.labels(event.method, event.endpoint, "sent").inc(event.bytes_sent)
+        self.bytes.labels(event.method, event.endpoint, "received").inc(
+            event.bytes_received
+        )
+
+
+class OpenTelemetryMetrics:
+    """
+    Request hook exporting client metrics through the optional ``opentelemetry-api`` package.
+    """
+
+    def __init__(self, meter: Any = None) -> None:
+        """
+        Initialize the OpenTelemetry instruments.
+
+        :param meter: An OpenTelemetry meter. Defaults to the meter of this module.
+        :raises ImportError: If opentelemetry-api is not installed.
+        """
+        try:
+            from opentelemetry import metrics
+        except ImportError as e:
+            raise ImportError(
+                "OpenTelemetryMetrics requires the 'opentelemetry-api' package."
+            ) from e
+
+        meter = meter or metrics.get_meter(__name__)
+        self.requests = meter.create_counter(
+            "baserow.requests", description="Baserow API requests."
+        )
+        self.errors = meter.create_counter(
+            "baserow.request.errors", description="Failed Baserow API requests."
+        )
+        self.latency = meter.create_histogram(
+            "baserow.request.duration", unit="s", description="Request latency."
+        )
+        self.bytes = meter.create_counter(
+            "baserow.request.bytes", unit="By", description="Bytes transferred."
+        )
+
+    def __call__(self, event: RequestEvent) -> None:
+        """
+        Record a RequestEvent.
+
+        :param event: The event to record.
+        :type event: RequestEvent
+        """
+        attributes = {"http.method": event.method, "endpoint": event.endpoint}
+        self.requests.add(1, attributes)
+        if event.is_error:
+            self.errors.add(1, attributes)
+        self.latency.record(event.latency, attributes)
+        self.bytes.add(event.bytes_sent, {**attributes, "direction": "sent"})
+        self.bytes.add(event.bytes_received, {**attributes, "direction": "received"})
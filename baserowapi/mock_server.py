@@ -0,0 +1,932 @@
+import copy
+import hashlib
+import json
+import logging
+import re
+import threading
+import time
+import urllib.parse
+import uuid
+from datetime import datetime, timezone
+from decimal import Decimal, InvalidOperation
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+READ_ONLY_FIELD_TYPES = {
+    "formula",
+    "count",
+    "rollup",
+    "lookup",
+    "created_on",
+    "last_modified",
+    "created_by",
+    "last_modified_by",
+    "uuid",
+    "autonumber",
+}
+
+
+class MockAPIError(Exception):
+    """
+    An error response of the mock server, serialized like the errors of the Baserow API.
+    """
+
+    def __init__(self, status_code: int, error: str, detail: Any = "") -> None:
+        """
+        Initialize a MockAPIError.
+
+        :param status_code: The HTTP status code of the response.
+        :type status_code: int
+        :param error: The Baserow error code, e.g. 'ERROR_ROW_DOES_NOT_EXIST'.
+        :type error: str
+        :param detail: A human readable detail or a structured validation error.
+        :type detail: Any
+        """
+        super().__init__(error)
+        self.status_code = status_code
+        self.error = error
+        self.detail = detail
+
+
+class _MockTable:
+    """
+    The in-memory state of a single table of the mock server.
+    """
+
+    def __init__(self, table_id: int, fields: List[Dict[str, Any]]) -> None:
+        self.id = table_id
+        self.fields: List[Dict[str, Any]] = []
+        for index, field_data in enumerate(fields):
+            field = {
+                "id": table_id * 1000 + index + 1,
+                "table_id": table_id,
+                "order": index,
+                "primary": index == 0,
+                "read_only": field_data.get("type") in READ_ONLY_FIELD_TYPES,
+            }
+            field.update(field_data)
+            self.fields.append(field)
+        self.fields_by_name = {field["name"]: field for field in self.fields}
+        self.rows: Dict[int, Dict[str, Any]] = {}
+        self.next_id = 1
+
+    def field(self, name: str) -> Dict[str, Any]:
+        """
+        Look up a field by name or by 'field_<id>'.
+        """
+        if name in self.fields_by_name:
+            return self.fields_by_name[name]
+        for field in self.fields:
+            if name in (f"field_{field['id']}", str(field["id"])):
+                return field
+        raise MockAPIError(
+            400, "ERROR_NO_SUCH_FIELD", f"Field {name} does not exist in the table."
+        )
+
+
+class MockBaserowServer:
+    """
+    A local stand-in for the Baserow REST API, for offline tests and benchmarks.
+
+    The server keeps tables in memory and implements the endpoints used by this library:
+    fields, list/get/create/update/delete rows, batch create/update/delete, move and file
+    uploads. Rows are always returned with user field names. A configurable latency is
+    added to every request to simulate a remote server.
+
+    Example::
+
+        with MockBaserowServer(latency=0.005) as server:
+            server.add_table(1, [{"name": "Name", "type": "text"}])
+            table = server.client().get_table(1)
+
+    :ivar latency: Seconds to wait before answering each request.
+    :vartype latency: float
+    :ivar page_size: The default number of rows per list page.
+    :vartype page_size: int
+    :ivar max_page_size: The largest accepted page size and batch size.
+    :vartype max_page_size: int
+    :ivar token: The database token expected in the Authorization header, or None to accept any.
+    :vartype token: str, optional
+    :ivar request_count: The number of requests handled so far.
+    :vartype request_count: int
+    """
+
+    def __init__(
+        self,
+        host: str = "127.0.0.1",
+        port: int = 0,
+        latency: float = 0.0,
+        page_size: int = 100,
+        max_page_size: int = 200,
+        token: Optional[str] = None,
+    ) -> None:
+        """
+        Initialize a MockBaserowServer. The server only listens after `start()`.
+
+        :param host: The interface to listen on. Defaults to '127.0.0.1'.
+        :type host: str
+        :param port: The port to listen on. Defaults to 0, which picks a free port.
+        :type port: int
+        :param latency: Seconds to wait before answering each request. Defaults to 0.
+        :type latency: float
+        :param page_size: The default number of rows per list page. Defaults to 100.
+        :type page_size: int
+        :param max_page_size: The largest accepted page size and batch size. Defaults to 200.
+        :type max_page_size: int
+        :param token: The expected database token. Defaults to None, which accepts any token.
+        :type token: str, optional
+        """
+        self.host = host
+        self.port = port
+        self.latency = latency
+        self.page_size = page_size
+        self.max_page_size = max_page_size
+        self.token = token
+        self.request_count = 0
+        self.logger = logging.getLogger(__name__)
+        self._tables: Dict[int, _MockTable] = {}
+        self._files: Dict[str, Tuple[bytes, str]] = {}
+        self._lock = threading.RLock()
+        self._httpd: Optional[ThreadingHTTPServer] = None
+        self._thread: Optional[threading.Thread] = None
+
+    def __repr__(self) -> str:
+        """
+        Provide a string representation of the MockBaserowServer.
+
+        :return: A string including the URL of the server.
+        :rtype: str
+        """
+        return f"MockBaserowServer({self.url if self._httpd else 'stopped'})"
+
+    def __enter__(self) -> "MockBaserowServer":
+        return self.start()
+
+    def __exit__(self, *exc_info: Any) -> None:
+        self.stop()
+
+    @property
+    def url(self) -> str:
+        """
+        The base URL of the running server, to be passed to the Baserow client.
+
+        :return: The base URL, e.g. 'http://127.0.0.1:54321'.
+        :rtype: str
+        :raises RuntimeError: If the server was not started.
+        """
+        if self._httpd is None:
+            raise RuntimeError("The mock server is not running.")
+        host, port = self._httpd.server_address[:2]
+        return f"http://{host}:{port}"
+
+    def start(self) -> "MockBaserowServer":
+        """
+        Start serving requests in a background thread.
+
+        :return: The server itself.
+        :rtype: MockBaserowServer
+        """
+        if self._httpd is None:
+            self._httpd = ThreadingHTTPServer((self.host, self.port), _MockHandler)
+            self._httpd.daemon_threads = True
+            self._httpd.mock = self
+            self._thread = threading.Thread(
+                target=self._httpd.serve_forever, name="MockBaserowServer", daemon=True
+            )
+            self._thread.start()
+            self.logger.debug("Mock Baserow server listening on %s", self.url)
+        return self
+
+    def stop(self) -> None:
+        """
+        Stop the server and wait for the background thread to finish.
+        """
+        if self._httpd is not None:
+            self._httpd.shutdown()
+            self._httpd.server_close()
+            self._thread.join()
+            self._httpd = None
+            self._thread = None
+
+    def client(self, **kwargs: Any) -> Any:
+        """
+        Create a Baserow client connected to this server.
+
+        :param kwargs: Additional keyword arguments for the Baserow client.
+        :type kwargs: Any
+        :return: A Baserow client.
+        :rtype: Baserow
+        """
+        from baserowapi.baserow import Baserow
+
+        kwargs.setdefault("token", self.token or "mock-token")
+        return Baserow(url=self.url, **kwargs)
+
+    def add_table(
+        self,
+        table_id: int,
+        fields: List[Dict[str, Any]],
+        rows: Optional[List[Dict[str, Any]]] = None,
+    ) -> None:
+        """
+        Create or replace a table.
+
+        :param table_id: The id of the table.
+        :type table_id: int
+        :param fields: The field definitions, each with at least a 'name' and a 'type' and
+                       optionally type specific options like 'number_decimal_places' or
+                       'select_options'. The first field is the primary field.
+        :type fields: list[dict[str, Any]]
+        :param rows: Initial rows keyed by field name. Defaults to None.
+        :type rows: list[dict[str, Any]], optional
+        :raises MockAPIError: If an initial row contains invalid values.
+        """
+        with self._lock:
+            table = _MockTable(table_id, fields)
+            self._tables[table_id] = table
+            for row_data in rows or []:
+                self._create_row(table, row_data)
+
+    def rows(self, table_id: int) -> List[Dict[str, Any]]:
+        """
+        Return a copy of all rows of a table, in table order.
+
+        :param table_id: The id of the table.
+        :type table_id: int
+        :return: The rows.
+        :rtype: list[dict[str, Any]]
+        """
+        with self._lock:
+            table = self._tables[table_id]
+            return copy.deepcopy(self._ordered(table.rows.values()))
+
+    # Request handling
+
+    def handle(
+        self, method: str, path: str, query: Dict[str, str], body: Any
+    ) -> Tuple[int, Any]:
+        """
+        Dispatch a request to the matching endpoint.
+
+        :return: The status code and the JSON serializable response body.
+        :rtype: tuple[int, Any]
+        :raises MockAPIError: For error responses.
+        """
+        for route_method, pattern, handler in self._routes():
+            match = pattern.fullmatch(path)
+            if match and route_method == method:
+                with self._lock:
+                    return handler(*match.groups(), query=query, body=body)
+        raise MockAPIError(404, "URL_NOT_FOUND", f"Page {path} not found.")
+
+    def _routes(self) -> List[Tuple[str, "re.Pattern[str]", Callable[..., Any]]]:
+        rows = r"/api/database/rows/table/(\d+)/"
+        return [
+            (
+                "GET",
+                re.compile(r"/api/database/fields/table/(\d+)/"),
+                self._list_fields,
+            ),
+            ("GET", re.compile(rows), self._list_rows),
+            ("POST", re.compile(rows), self._post_row),
+            ("POST", re.compile(rows + "batch/"), self._batch_create),
+            ("PATCH", re.compile(rows + "batch/"), self._batch_update),
+            ("POST", re.compile(rows + "batch-delete/"), self._batch_delete),
+            ("GET", re.compile(rows + r"(\d+)/"), self._get_row),
+            ("PATCH", re.compile(rows + r"(\d+)/"), self._patch_row),
+            ("DELETE", re.compile(rows + r"(\d+)/"), self._delete_row),
+            ("PATCH", re.compile(rows + r"(\d+)/move/"), self._move_row),
+            ("POST", re.compile(r"/api/user-files/upload-file/"), self._upload_file),
+            ("POST", re.compile(r"/api/user-files/upload-via-url/"), self._upload_url),
+            ("GET", re.compile(r"/media/user_files/([^/]+)"), self._get_file),
+        ]
+
+    def _table(self, table_id: str) -> _MockTable:
+        table = self._tables.get(int(table_id))
+        if table is None:
+            raise MockAPIError(
+                404,
+                "ERROR_TABLE_DOES_NOT_EXIST",
+                f"The table {table_id} does not exist.",
+            )
+        return table
+
+    def _row(self, table: _MockTable, row_id: Any) -> Dict[str, Any]:
+        try:
+            return table.rows[int(row_id)]
+        except (KeyError, TypeError, ValueError):
+            raise MockAPIError(
+                404, "ERROR_ROW_DOES_NOT_EXIST", f"The row {row_id} does not exist."
+            )
+
+    def _list_fields(self, table_id: str, query: Dict, body: Any) -> Tuple[int, Any]:
+        return 200, copy.deepcopy(self._table(table_id).fields)
+
+    def _list_rows(self, table_id: str, query: Dict, body: Any) -> Tuple[int, Any]:
+        table = self._table(table_id)
+        rows = list(table.rows.values())
+
+        if "filters" in query:
+            try:
+                tree = json.loads(query["filters"])
+            except ValueError:
+                raise MockAPIError(400, "ERROR_FILTERS_PARAM_VALIDATION_ERROR")
+            rows = [row for row in rows if self._matches(table, tree, row)]
+        if query.get("search"):
+            needle = query["search"].lower()
+            rows = [
+                row
+                for row in rows
+                if any(needle in str(value).lower() for value in row.values())
+            ]
+
+        rows = self._ordered(rows)
+        for item in reversed(query.get("order_by", "").split(",")):
+            if item:
+                name = item.lstrip("-+")
+                if name != "id":
+                    name = table.field(name)["name"]
+                rows.sort(
+                    key=lambda row: _sort_key(row.get(name)),
+                    reverse=item.startswith("-"),
+                )
+
+        try:
+            size = int(query.get("size", self.page_size))
+            page = int(query.get("page", 1))
+        except ValueError:
+            raise MockAPIError(400, "ERROR_QUERY_PARAMETER_VALIDATION")
+        if size < 1 or size > self.max_page_size:
+            raise MockAPIError(
+                400,
+                "ERROR_PAGE_SIZE_LIMIT",
+                f"The page size is limited to {self.max_page_size}.",
+            )
+        start = (page - 1) * size
+        if page < 1 or (start >= len(rows) and page > 1):
+            raise MockAPIError(404, "ERROR_INVALID_PAGE", "Invalid page.")
+
+        results = [
+            self._project(table, row, query) for row in rows[start : start + size]
+        ]
+        return 200, {
+            "count": len(rows),
+            "next": (
+                self._page_url(table_id, query, page + 1)
+                if start + size < len(rows)
+                else None
+            ),
+            "previous": self._page_url(table_id, query, page - 1) if page > 1 else None,
+            "results": results,
+        }
+
+    def _page_url(self, table_id: str, query: Dict[str, str], page: int) -> str:
+        params = dict(query, page=str(page))
+        return (
+            f"{self.url}/api/database/rows/table/{table_id}/?"
+            f"{urllib.parse.urlencode(params, quote_via=urllib.parse.quote)}"
+        )
+
+    def _project(
+        self, table: _MockTable, row: Dict[str, Any], query: Dict[str, str]
+    ) -> Dict[str, Any]:
+        names = [field["name"] for field in table.fields]
+        if query.get("include"):
+            included = {
+                table.field(name)["name"] for name in query["include"].split(",")
+            }
+            names = [name for name in names if name in included]
+        if query.get("exclude"):
+            excluded = {
+                table.field(name)["name"] for name in query["exclude"].split(",")
+            }
+            names = [name for name in names if name not in excluded]
+        result = {"id": row["id"], "order": row["order"]}
+        for name in names:
+            result[name] = copy.deepcopy(row.get(name))
+        return result
+
+    def _get_row(self, table_id: str, row_id: str, query: Dict, body: Any):
+        table = self._table(table_id)
+        return 200, self._project(table, self._row(table, row_id), query)
+
+    def _post_row(self, table_id: str, query: Dict, body: Any) -> Tuple[int, Any]:
+        table = self._table(table_id)
+        return 200, copy.deepcopy(self._create_row(table, body or {}))
+
+    def _patch_row(self, table_id: str, row_id: str, query: Dict, body: Any):
+        table = self._table(table_id)
+        row = self._row(table, row_id)
+        values = self._validate_values(table, body or {})
+        row.update(values)
+        self._touch(table, row)
+        return 200, copy.deepcopy(row)
+
+    def _delete_row(self, table_id: str, row_id: str, query: Dict, body: Any):
+        table = self._table(table_id)
+        self._row(table, row_id)
+        del table.rows[int(row_id)]
+        return 204, None
+
+    def _move_row(self, table_id: str, row_id: str, query: Dict, body: Any):
+        table = self._table(table_id)
+        row = self._row(table, row_id)
+        others = [r for r in self._ordered(table.rows.values()) if r is not row]
+        if query.get("before_id"):
+            before = self._row(table, query["before_id"])
+            position = others.index(before)
+            upper = Decimal(before["order"])
+            lower = Decimal(others[position - 1]["order"]) if position else Decimal(0)
+            new_order = (lower + upper) / 2
+        else:
+            new_order = Decimal(others[-1]["order"]) + 1 if others else Decimal(1)
+        row["order"] = _format_order(new_order)
+        return 200, copy.deepcopy(row)
+
+    def _check_batch(self, body: Any) -> List[Any]:
+        items = (body or {}).get("items")
+        if not isinstance(items, list) or not items:
+            raise MockAPIError(
+                400,
+                "ERROR_REQUEST_BODY_VALIDATION",
+                {"items": [{"error": "This field is required.", "code": "required"}]},
+            )
+        if len(items) > self.max_page_size:
+            raise MockAPIError(
+                400,
+                "ERROR_REQUEST_BODY_VALIDATION",
+                {
+                    "items": [
+                        {
+                            "error": f"Ensure this field has no more than {self.max_page_size} elements.",
+                            "code": "max_length",
+                        }
+                    ]
+                },
+            )
+        return items
+
+    def _batch_create(self, table_id: str, query: Dict, body: Any):
+        table = self._table(table_id)
+        items = self._check_batch(body)
+        validated = self._validate_items(table, items)
+        return 200, {
+            "items": [copy.deepcopy(self._create_row(table, v)) for v in validated]
+        }
+
+    def _batch_update(self, table_id: str, query: Dict, body: Any):
+        table = self._table(table_id)
+        items = self._check_batch(body)
+        for item in items:
+            self._row(table, item.get("id") if isinstance(item, dict) else None)
+        validated = self._validate_items(
+            table, [{k: v for k, v in item.items() if k != "id"} for item in items]
+        )
+        updated = []
+        for item, values in zip(items, validated):
+            row = table.rows[int(item["id"])]
+            row.update(values)
+            self._touch(table, row)
+            updated.append(copy.deepcopy(row))
+        return 200, {"items": updated}
+
+    def _batch_delete(self, table_id: str, query: Dict, body: Any):
+        table = self._table(table_id)
+        items = self._check_batch(body)
+        missing = [row_id for row_id in items if row_id not in table.rows]
+        if missing:
+            raise MockAPIError(
+                404,
+                "ERROR_ROW_DOES_NOT_EXIST",
+                f"The rows {missing} do not exist.",
+            )
+        for row_id in items:
+            del table.rows[row_id]
+        return 204, None
+
+    def _upload_file(self, query: Dict, body: Any) -> Tuple[int, Any]:
+        if not isinstance(body, tuple):
+            raise MockAPIError(
+                400,
+                "ERROR_INVALID_FILE",
+                "No file has been provided or the file is invalid.",
+            )
+        file_name, content = body
+        return 200, self._store_file(file_name, content)
+
+    def _upload_url(self, query: Dict, body: Any) -> Tuple[int, Any]:
+        url = (body or {}).get("url", "")
+        stored_name = url.rsplit("/media/user_files/", 1)[-1]
+        if not url.startswith(self.url) or stored_name not in self._files:
+            raise MockAPIError(
+                400,
+                "ERROR_FILE_URL_COULD_NOT_BE_REACHED",
+                "The provided URL could not be reached.",
+            )
+        return 200, self._store_file(
+            url.rsplit("/", 1)[-1], self._files[stored_name][0]
+        )
+
+    def _get_file(self, name: str, query: Dict, body: Any) -> Tuple[int, Any]:
+        if name not in self._files:
+            raise MockAPIError(404, "URL_NOT_FOUND", f"File {name} not found.")
+        return 200, self._files[name]
+
+    def _store_file(self, file_name: str, content: bytes) -> Dict[str, Any]:
+        # Baserow names user files '<unique>_<sha256>.<extension>'.
+        sha256 = hashlib.sha256(content).hexdigest()
+        unique = hashlib.md5(f"{sha256}{file_name}".encode()).hexdigest()
+        extension = file_name.rsplit(".", 1)[-1] if "." in file_name else ""
+        name = f"{unique}_{sha256}.{extension}" if extension else f"{unique}_{sha256}"
+        self._files[name] = (content, file_name)
+        return {
+            "url": f"{self.url}/media/user_files/{name}",
+            "thumbnails": {},
+            "visible_name": file_name,
+            "name": name,
+            "size": len(content),
+            "mime_type": "",
+            "is_image": False,
+            "image_width": None,
+            "image_height": None,
+            "uploaded_at": _now(),
+        }
+
+    # Row state
+
+    @staticmethod
+    def _ordered(rows: Any) -> List[Dict[str, Any]]:
+        return sorted(rows, key=lambda row: (Decimal(row["order"]), row["id"]))
+
+    def _validate_items(
+        self, table: _MockTable, items: List[Dict[str, Any]]
+    ) -> List[Dict[str, Any]]:
+        """
+        Validate all items of a batch before any of them is applied, like Baserow does.
+        """
+        validated, errors = [], {}
+        for index, item in enumerate(items):
+            try:
+                validated.append(self._validate_values(table, item))
+            except MockAPIError as e:
+                errors[str(index)] = e.detail
+        if errors:
+            raise MockAPIError(400, "ERROR_REQUEST_BODY_VALIDATION", {"items": errors})
+        return validated
+
+    def _validate_values(
+        self, table: _MockTable, values: Dict[str, Any]
+    ) -> Dict[str, Any]:
+        result, errors = {}, {}
+        for name, value in values.items():
+            if name in ("id", "order"):
+                continue
+            field = table.field(name)
+            if field["read_only"]:
+                errors[field["name"]] = [
+                    {"error": "This field is read only.", "code": "read_only"}
+                ]
+                continue
+            try:
+                result[field["name"]] = _coerce_value(table, field, value)
+            except (TypeError, ValueError, InvalidOperation) as e:
+                errors[field["name"]] = [{"error": str(e), "code": "invalid"}]
+        if errors:
+            raise MockAPIError(400, "ERROR_REQUEST_BODY_VALIDATION", errors)
+        return result
+
+    def _create_row(self, table: _MockTable, values: Dict[str, Any]) -> Dict[str, Any]:
+        values = self._validate_values(table, values)
+        row_id = table.next_id
+        table.next_id += 1
+        orders = [Decimal(row["order"]) for row in table.rows.values()]
+        row = {"id": row_id, "order": _format_order(max(orders, default=0) + 1)}
+        for field in table.fields:
+            row[field["name"]] = _default_value(field, row_id)
+        row.update(values)
+        table.rows[row_id] = row
+        return row
+
+    def _touch(self, table: _MockTable, row: Dict[str, Any]) -> None:
+        for field in table.fields:
+            if field["type"] == "last_modified":
+                row[field["name"]] = _now()
+
+    def _matches(self, table: _MockTable, tree: Dict[str, Any], row: Dict) -> bool:
+        results = [
+            self._match_filter(table, item, row) for item in tree.get("filters", [])
+        ]
+        results += [
+            self._matches(table, group, row) for group in tree.get("groups", [])
+        ]
+        if not results:
+            return True
+        if tree.get("filter_type", "AND") == "OR":
+            return any(results)
+        return all(results)
+
+    def _match_filter(self, table: _MockTable, item: Dict, row: Dict) -> bool:
+        name = str(item.get("field"))
+        if name == "id":
+            value = row["id"]
+        else:
+            value = row.get(table.field(name)["name"])
+        operator = item.get("type")
+        matcher = FILTER_MATCHERS.get(operator)
+        if matcher is None:
+            raise MockAPIError(
+                400,
+                "ERROR_VIEW_FILTER_TYPE_DOES_NOT_EXIST",
+                f"The filter type {operator} does not exist.",
+            )
+        return matcher(value, item.get("value", ""))
+
+
+def _now() -> str:
+    return datetime.now(timezone.utc).isoformat().replace("+00:00", "Z")
+
+
+def _format_order(order: Decimal) -> str:
+    return f"{order:.20f}"
+
+
+def _sort_key(value: Any) -> Tuple[bool, bool, Decimal, str]:
+    if isinstance(value, list):
+        value = ", ".join(str(_display(item)) for item in value)
+    number = None if isinstance(value, bool) else _to_number(value)
+    text = "" if value is None else str(_display(value))
+    return (value is None, number is None, number or Decimal(0), text)
+
+
+def _default_value(field: Dict[str, Any], row_id: int) -> Any:
+    field_type = field["type"]
+    if field_type in ("boolean", "password"):
+        return False if field_type == "boolean" else None
+    if field_type in (
+        "file",
+        "multiple_select",
+        "link_row",
+        "lookup",
+        "multiple_collaborators",
+    ):
+        return []
+    if field_type in ("created_on", "last_modified"):
+        return _now()
+    if field_type == "uuid":
+        return str(uuid.uuid4())
+    if field_type in ("autonumber", "count"):
+        return row_id if field_type == "autonumber" else "0"
+    if field_type == "rating":
+        return 0
+    return None
+
+
+def _select_option(field: Dict[str, Any], value: Any) -> Dict[str, Any]:
+    if isinstance(value, dict):
+        value = value.get("id", value.get("value"))
+    for option in field.get("select_options", []):
+        if value in (option["id"], option["value"]) or str(value) == str(option["id"]):
+            return dict(option)
+    raise ValueError(f"The select option {value} does not exist.")
+
+
+def _coerce_value(table: _MockTable, field: Dict[str, Any], value: Any) -> Any:
+    """
+    Convert a written value to the representation returned by Baserow.
+    """
+    field_type = field["type"]
+    if value is None or (value == "" and field_type not in ("text", "long_text")):
+        return [] if field_type in ("file", "multiple_select", "link_row") else None
+    if field_type == "number":
+        places = field.get("number_decimal_places", 0)
+        return f"{Decimal(str(value)):.{places}f}"
+    if field_type == "boolean":
+        if isinstance(value, str):
+            return value.lower() in ("1", "true", "yes", "on", "checked")
+        return bool(value)
+    if field_type == "rating":
+        return int(value)
+    if field_type == "password":
+        return True
+    if field_type == "single_select":
+        return _select_option(field, value)
+    if field_type == "multiple_select":
+        return [_select_option(field, item) for item in value]
+    if field_type == "link_row":
+        items = value if isinstance(value, list) else [value]
+        return [
+            (
+                {"id": item["id"], "value": item.get("value", str(item["id"]))}
+                if isinstance(item, dict)
+                else {"id": int(item), "value": str(item)}
+            )
+            for item in items
+        ]
+    if field_type == "file":
+        return [
+            dict(item, visible_name=item.get("visible_name", item["name"]))
+            for item in value
+        ]
+    if field_type in ("text", "long_text", "url", "email", "phone_number"):
+        return str(value)
+    return value
+
+
+def _display(value: Any) -> Any:
+    if isinstance(value, dict):
+        return value.get("value", value.get("visible_name", value.get("name")))
+    return value
+
+
+def _to_number(value: Any) -> Optional[Decimal]:
+    try:
+        return Decimal(str(_display(value)))
+    except (InvalidOperation, ValueError):
+        return None
+
+
+def _compare(test: Callable[[Decimal, Decimal], bool]) -> Callable[[Any, Any], bool]:
+    def matcher(value: Any, expected: Any) -> bool:
+        left, right = _to_number(value), _to_number(expected)
+        if left is None or right is None:
+            return False
+        return test(left, right)
+
+    return matcher
+
+
+def _is_empty(value: Any) -> bool:
+    return value in (None, "", [], False)
+
+
+def _equal(value: Any, expected: Any) -> bool:
+    if isinstance(value, list):
+        return any(str(_display(item)) == str(expected) for item in value)
+    left, right = _to_number(value), _to_number(expected)
+    if left is not None and right is not None:
+        return left == right
+    return str(_display(value) if value is not None else "") == str(expected)
+
+
+def _contains(value: Any, expected: Any) -> bool:
+    if isinstance(value, list):
+        text = " ".join(str(_display(item)) for item in value)
+    else:
+        text = "" if value is None else str(_display(value))
+    return str(expected).lower() in text.lower()
+
+
+def _boolean(value: Any, expected: Any) -> bool:
+    return bool(value) == (str(expected).lower() in ("1", "true", "yes", "on"))
+
+
+def _select_is(value: Any, expected: Any) -> bool:
+    items = value if isinstance(value, list) else [value]
+    return any(
+        isinstance(item, dict) and str(item.get("id")) == str(expected)
+        for item in items
+    )
+
+
+def _link_row_has(value: Any, expected: Any) -> bool:
+    return any(str(item.get("id")) == str(expected) for item in value or [])
+
+
+FILTER_MATCHERS: Dict[str, Callable[[Any, Any], bool]] = {
+    "equal": _equal,
+    "not_equal": lambda value, expected: not _equal(value, expected),
+    "contains": _contains,
+    "contains_not": lambda value, expected: not _contains(value, expected),
+    "higher_than": _compare(lambda left, right: left > right),
+    "higher_than_or_equal": _compare(lambda left, right: left >= right),
+    "lower_than": _compare(lambda left, right: left < right),
+    "lower_than_or_equal": _compare(lambda left, right: left <= right),
+    "empty": lambda value, expected: _is_empty(value),
+    "not_empty": lambda value, expected: not _is_empty(value),
+    "boolean": _boolean,
+    "single_select_equal": _select_is,
+    "single_select_not_equal": lambda value, expected: not _select_is(value, expected),
+    "multiple_select_has": _select_is,
+    "multiple_select_has_not": lambda value, expected: not _select_is(value, expected),
+    "link_row_has": _link_row_has,
+    "link_row_has_not": lambda value, expected: not _link_row_has(value, expected),
+}
+
+
+def _parse_multipart(content_type: str, body: bytes) -> Optional[Tuple[str, bytes]]:
+    """
+    Extract the name and content of the 'file' part of a multipart/form-data body.
+    """
+    match = re.search(r'boundary="?([^";]+)"?', content_type)
+    if not match:
+        return None
+    boundary = b"--" + match.group(1).encode()
+    for part in body.split(boundary):
+        head, _, content = part.partition(b"\r\n\r\n")
+        disposition = re.search(
+            rb'name="file"(?:; filename="([^"]*)")?', head, re.IGNORECASE
+        )
+        if disposition:
+            file_name = (disposition.group(1) or b"file").decode()
+            return file_name, (
+                content[: -len(b"\r\n")] if content.endswith(b"\r\n") else content
+            )
+    return None
+
+
+class _MockHandler(BaseHTTPRequestHandler):
+    """
+    Translates HTTP requests into calls of `MockBaserowServer.handle`.
+    """
+
+    protocol_version = "HTTP/1.1"
+    server: ThreadingHTTPServer
+
+    def log_message(self, format: str, *args: Any) -> None:
+        self.server.mock.logger.debug(format, *args)
+
+    def _read_body(self) -> bytes:
+        if self.headers.get("Transfer-Encoding", "").lower() == "chunked":
+            chunks = []
+            while True:
+                size = int(self.rfile.readline().split(b";")[0].strip() or b"0", 16)
+                if not size:
+                    # Skip trailers up to the blank line that ends the body.
+                    while self.rfile.readline() not in (b"\r\n", b"\n", b""):
+                        pass
+                    return b"".join(chunks)
+                chunks.append(self.rfile.read(size))
+                self.rfile.readline()
+        length = int(self.headers.get("Content-Length") or 0)
+        return self.rfile.read(length) if length else b""
+
+    def _dispatch(self) -> None:
+        mock: MockBaserowServer = self.server.mock
+        if mock.latency:
+            time.sleep(mock.latency)
+        with mock._lock:
+            mock.request_count += 1
+
+        parsed = urllib.parse.urlparse(self.path)
+        query = dict(urllib.parse.parse_qsl(parsed.query, keep_blank_values=True))
+        raw_body = self._read_body()
+
+        try:
+            expected = f"Token {mock.token}" if mock.token else None
+            if expected and self.headers.get("Authorization") != expected:
+                raise MockAPIError(
+                    401, "ERROR_TOKEN_DOES_NOT_EXIST", "The token does not exist."
+                )
+            content_type = self.headers.get("Content-Type", "")
+            if content_type.startswith("multipart/form-data"):
+                body: Any = _parse_multipart(content_type, raw_body)
+            elif raw_body:
+                try:
+                    body = json.loads(raw_body)
+                except ValueError:
+                    raise MockAPIError(
+                        400, "ERROR_REQUEST_BODY_VALIDATION", "Invalid JSON body."
+                    )
+            else:
+                body = None
+            status, payload = mock.handle(self.command, parsed.path, query, body)
+        except MockAPIError as e:
+            status, payload = e.status_code, {"error": e.error, "detail": e.detail}
+        except Exception as e:
+            mock.logger.exception("Mock server failed to handle %s", self.path)
+            status, payload = 500, {"error": "ERROR_INTERNAL", "detail": str(e)}
+
+        extra_headers = {}
+        if isinstance(payload, tuple):
+            data, content_type = payload[0], "application/octet-stream"
+            extra_headers["Accept-Ranges"] = "bytes"
+            match = re.fullmatch(r"bytes=(\d+)-", self.headers.get("Range", ""))
+            if status == 200 and match:
+                start = int(match.group(1))
+                if start >= len(data):
+                    status, extra_headers = 416, {
+                        "Content-Range": f"bytes */{len(data)}"
+                    }
+                    data = b""
+                else:
+                    status = 206
+                    extra_headers["Content-Range"] = (
+                        f"bytes {start}-{len(data) - 1}/{len(data)}"
+                    )
+                    data = data[start:]
+        elif payload is None:
+            data, content_type = b"", "application/json"
+        else:
+            data, content_type = json.dumps(payload).encode(), "application/json"
+
+        self.send_response(status)
+        if status != 204:
+            self.send_header("Content-Type", content_type)
+        self.send_header("Content-Length", str(len(data)))
+        for header, value in extra_headers.items():
+            self.send_header(header, value)
+        self.end_headers()
+        if data:
+            self.wfile.write(data)
+
+    do_GET = do_POST = do_PATCH = do_DELETE = _dispatch
@@ -1,6 +1,11 @@
 from .filter import Filter
 from .row import Row
 from .table import Table
+from .row_writer import RowWriter
+from .checkpoint import Checkpoint, FileCheckpoint, CallbackCheckpoint
+from .batch_result import BatchResult, BatchFailure
+from .aggregation import Aggregation
+from .expression import F, Expression, Predicate, Group
 
 # Import the submodules
 from .fields import *
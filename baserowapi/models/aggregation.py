@@ -0,0 +1,162 @@
+import json
+import math
+from typing import Any, List, Optional, Set
+
+
+class Aggregation:
+    """
+    Computes a Baserow field aggregation incrementally over a stream of raw field values.
+
+    Only the running state of the aggregation is kept, except for 'median', which needs the
+    numeric values of the column, and 'unique_count', which needs the distinct values. The
+    supported functions and their results follow the field aggregations of Baserow views.
+
+    :ivar fn: The aggregation function.
+    :vartype fn: str
+    """
+
+    FUNCTIONS = (
+        "count",
+        "empty_count",
+        "not_empty_count",
+        "empty_percentage",
+        "not_empty_percentage",
+        "checked_count",
+        "not_checked_count",
+        "unique_count",
+        "min",
+        "max",
+        "sum",
+        "average",
+        "median",
+        "std_dev",
+        "variance",
+    )
+    NUMERIC_FUNCTIONS = ("sum", "average", "median", "std_dev", "variance")
+
+    def __init__(self, fn: str) -> None:
+        """
+        Initialize an Aggregation.
+
+        :param fn: The aggregation function, one of `Aggregation.FUNCTIONS`.
+        :type fn: str
+        :raises ValueError: If the function is not supported.
+        """
+        if fn not in self.FUNCTIONS:
+            raise ValueError(
+                f"Unsupported aggregation '{fn}'. Use one of {', '.join(self.FUNCTIONS)}."
+            )
+        self.fn = fn
+        self._count = 0
+        self._empty = 0
+        self._checked = 0
+        self._numbers = 0
+        self._mean = 0.0
+        self._m2 = 0.0
+        self._sum: Any = 0
+        self._min: Any = None
+        self._max: Any = None
+        self._values: List[float] = []
+        self._unique: Set[str] = set()
+
+    def __repr__(self) -> str:
+        """
+        Provide a string representation of the Aggregation.
+
+        :return: A string including the function and the number of values seen.
+        :rtype: str
+        """
+        return f"Aggregation({self.fn!r}, count={self._count})"
+
+    @staticmethod
+    def _number(value: Any) -> Optional[float]:
+        """
+        Convert a raw value, e.g. the decimal string of a number field, to a number.
+        """
+        if isinstance(value, bool):
+            return None
+        if isinstance(value, (int, float)):
+            return value
+        try:
+            return float(value)
+        except (TypeError, ValueError):
+            return None
+
+    def add(self, value: Any) -> None:
+        """
+        Add the raw value of one row to the aggregation.
+
+        :param value: The value as returned by the API.
+        :type value: Any
+        """
+        self._count += 1
+        if value is None or value == "" or value == []:
+            self._empty += 1
+            return
+        if value is True:
+            self._checked += 1
+
+        if self.fn == "unique_count":
+            self._unique.add(json.dumps(value, sort_keys=True, default=str))
+        elif self.fn in ("min", "max"):
+            comparable = self._number(value)
+            comparable = value if comparable is None else comparable
+            if self._min is None or comparable < self._min:
+                self._min = comparable
+            if self._max is None or comparable > self._max:
+                self._max = comparable
+        elif self.fn in self.NUMERIC_FUNCTIONS:
+            number = self._number(value)
+            if number is None:
+                return
+            self._numbers += 1
+            self._sum += number
+            delta = number - self._mean
+            self._mean += delta / self._numbers
+            self._m2 += delta * (number - self._mean)
+            if self.fn == "median":
+                self._values.append(number)
+
+    @property
+    def result(self) -> Any:
+        """
+        The aggregated value of all values added so far.
+
+        :return: The result of the aggregation. Numeric aggregations of an empty column are None.
+        :rtype: Any
+        """
+        not_empty = self._count - self._empty
+        if self.fn == "count":
+            return self._count
+        if self.fn == "empty_count":
+            return self._empty
+        if self.fn == "not_empty_count":
+            return not_empty
+        if self.fn == "empty_percentage":
+            return 100 * self._empty / self._count if self._count else 0
+        if self.fn == "not_empty_percentage":
+            return 100 * not_empty / self._count if self._count else 0
+        if self.fn == "checked_count":
+            return self._checked
+        if self.fn == "not_checked_count":
+            return self._count - self._checked
+        if self.fn == "unique_count":
+            return len(self._unique)
+        if self.fn == "min":
+            return self._min
+        if self.fn == "max":
+            return self._max
+        if self.fn == "sum":
+            return self._sum
+        if not self._numbers:
+            return None
+        if self.fn == "average":
+            return self._mean
+        if self.fn == "median":
+            values = sorted(self._values)
+            middle = len(values) // 2
+            if len(values) % 2:
+                return values[middle]
+            return (values[middle - 1] + values[middle]) / 2
+        variance = self._m2 / self._numbers
+        return variance if self.fn == "variance" else math.sqrt(variance)
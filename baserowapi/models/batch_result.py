@@ -0,0 +1,123 @@
+from typing import Any, List, Optional
+
+
+class BatchFailure:
+    """
+    Describes a single item that the server rejected during a batch operation.
+
+    :ivar index: The position of the item in the input passed to the batch operation.
+    :vartype index: int
+    :ivar item: The item as it was sent to the API.
+    :vartype item: Any
+    :ivar error: The exception raised for the request that contained only this item.
+    :vartype error: Exception
+    """
+
+    def __init__(self, index: int, item: Any, error: Exception) -> None:
+        """
+        Initialize a BatchFailure.
+
+        :param index: The position of the item in the input passed to the batch operation.
+        :type index: int
+        :param item: The item as it was sent to the API.
+        :type item: Any
+        :param error: The exception raised for the item.
+        :type error: Exception
+        """
+        self.index = index
+        self.item = item
+        self.error = error
+
+    def __repr__(self) -> str:
+        """
+        Provide a string representation of the BatchFailure.
+
+        :return: A string including the index of the item and the error.
+        :rtype: str
+        """
+        return f"BatchFailure(index={self.index}, error={self.error})"
+
+    @property
+    def status_code(self) -> Optional[int]:
+        """
+        The HTTP status code returned for the item, if the error was an HTTP error.
+
+        :return: The HTTP status code or None.
+        :rtype: int, optional
+        """
+        return getattr(self.error, "status_code", None)
+
+    @property
+    def detail(self) -> Any:
+        """
+        The error detail returned by the server for the item, if available.
+
+        :return: The parsed error body or None.
+        :rtype: Any
+        """
+        return getattr(self.error, "detail", None)
+
+
+class BatchResult:
+    """
+    The outcome of a batch operation that isolates failing items instead of aborting.
+
+    :ivar succeeded: The results of the committed items, in input order. Row objects for
+                     add and update operations, row ids for delete operations.
+    :vartype succeeded: list
+    :ivar failures: The rejected items, in input order.
+    :vartype failures: list[BatchFailure]
+    :ivar skipped: The number of items that were not sent because they were unchanged.
+    :vartype skipped: int
+    """
+
+    def __init__(
+        self,
+        succeeded: Optional[List[Any]] = None,
+        failures: Optional[List[BatchFailure]] = None,
+        skipped: int = 0,
+    ) -> None:
+        """
+        Initialize a BatchResult.
+
+        :param succeeded: The results of the committed items. Defaults to an empty list.
+        :type succeeded: list, optional
+        :param failures: The rejected items. Defaults to an empty list.
+        :type failures: list[BatchFailure], optional
+        :param skipped: The number of unchanged items that were not sent. Defaults to 0.
+        :type skipped: int, optional
+        """
+        self.succeeded = succeeded if succeeded is not None else []
+        self.failures = failures if failures is not None else []
+        self.skipped = skipped
+
+    def __repr__(self) -> str:
+        """
+        Provide a string representation of the BatchResult.
+
+        :return: A string with the number of succeeded and failed items.
+        :rtype: str
+        """
+        return (
+            f"BatchResult({len(self.succeeded)} succeeded, {len(self.failures)} failed)"
+        )
+
+    @property
+    def ok(self) -> bool:
+        """
+        Whether every item was committed.
+
+        :return: True if no item failed.
+        :rtype: bool
+        """
+        return not self.failures
+
+    @property
+    def failed_indices(self) -> List[int]:
+        """
+        The input positions of all rejected items.
+
+        :return: A list of indices.
+        :rtype: list[int]
+        """
+        return [failure.index for failure in self.failures]
@@ -0,0 +1,296 @@
+import json
+import logging
+import os
+from typing import Any, Callable, Dict, List, Optional, Union
+
+
+class Checkpoint:
+    """
+    Base class for checkpoint stores used by resumable table operations.
+
+    A checkpoint is an append-only sequence of records. The first record identifies the
+    operation, the following records mark completed chunks (by the offset of their first item in
+    the input of the operation, with the ids of the affected rows) or the cursor of the last fully consumed page of a row generator.
+    Subclasses implement `load` and `append`.
+    """
+
+    def __init__(self) -> None:
+        """
+        Initialize the in-memory view of the checkpoint records.
+        """
+        self.logger = logging.getLogger(__name__)
+        self._chunks: Dict[int, List[int]] = {}
+        self._cursor: Optional[Dict[str, Any]] = None
+
+    def load(self) -> List[Dict[str, Any]]:
+        """
+        Load all previously stored records.
+
+        :return: The stored records, oldest first. Empty if nothing was stored yet.
+        :rtype: list[dict[str, Any]]
+        """
+        raise NotImplementedError
+
+    def append(self, record: Dict[str, Any]) -> None:
+        """
+        Durably store a new record.
+
+        :param record: A JSON serializable record.
+        :type record: dict[str, Any]
+        """
+        raise NotImplementedError
+
+    def begin(self, operation: str, **params: Any) -> None:
+        """
+        Start or resume an operation.
+
+        :param operation: The name of the operation, e.g. 'add_rows'.
+        :type operation: str
+        :param params: Parameters that must match when resuming, e.g. the batch size.
+        :type params: Any
+        :raises ValueError: If the stored records belong to a different operation or parameters.
+        """
+        header = {"operation": operation, "params": params}
+        records = self.load()
+        if not records:
+            self.append(header)
+            records = [header]
+        elif records[0] != json.loads(json.dumps(header)):
+            raise ValueError(
+                f"The checkpoint belongs to a different operation: {records[0]}. Expected {header}."
+            )
+
+        self._chunks = {}
+        self._cursor = None
+        for record in records[1:]:
+            if "offset" in record:
+                self._chunks.setdefault(record["offset"], []).extend(record["ids"])
+            if "cursor" in record:
+                self._cursor = record["cursor"]
+
+        if len(records) > 1:
+            self.logger.info(
+                "Resuming %s from checkpoint with %d completed chunk(s).",
+                operation,
+                len(self._chunks),
+            )
+
+    def is_completed(self, offset: int) -> bool:
+        """
+        Check whether the chunk starting at the given offset was already completed.
+
+        :param offset: The offset of the first item of the chunk.
+        :type offset: int
+        :return: True if the chunk was completed.
+        :rtype: bool
+        """
+        return offset in self._chunks
+
+    def complete(self, offset: int, ids: List[int]) -> None:
+        """
+        Record a completed chunk.
+
+        A chunk recorded again under the same offset, e.g. when a resumed run resends rows that
+        were rejected before, adds its ids to the ones recorded already.
+
+        :param offset: The input offset of the first item of the chunk.
+        :type offset: int
+        :param ids: The ids of the rows affected by the chunk.
+        :type ids: list[int]
+        """
+        self._chunks.setdefault(offset, []).extend(ids)
+        self.append({"offset": offset, "ids": ids})
+
+    @property
+    def completed_offsets(self) -> List[int]:
+        """
+        The offsets of all completed chunks, in ascending order.
+
+        :return: A list of offsets.
+        :rtype: list[int]
+        """
+        return sorted(self._chunks)
+
+    @property
+    def ids(self) -> List[int]:
+        """
+        The row ids recorded for all completed chunks, ordered by chunk offset.
+
+        :return: A list of row ids.
+        :rtype: list[int]
+        """
+        return [
+            row_id for offset in sorted(self._chunks) for row_id in self._chunks[offset]
+        ]
+
+    @property
+    def cursor(self) -> Optional[Dict[str, Any]]:
+        """
+        The cursor of the last fully consumed page of a row generator.
+
+        :return: The cursor, or None if no page was consumed yet.
+        :rtype: dict[str, Any], optional
+        """
+        return self._cursor
+
+    @cursor.setter
+    def cursor(self, cursor: Dict[str, Any]) -> None:
+        """
+        Record the cursor of a fully consumed page.
+
+        :param cursor: The cursor to resume from.
+        :type cursor: dict[str, Any]
+        """
+        self._cursor = cursor
+        self.append({"cursor": cursor})
+
+
+class FileCheckpoint(Checkpoint):
+    """
+    A checkpoint stored as JSON lines in a local file.
+
+    Every record is appended as a single line, so saving a chunk costs O(chunk size)
+    regardless of how far the operation has progressed.
+    """
+
+    def __init__(self, path: Union[str, os.PathLike], fsync: bool = True) -> None:
+        """
+        Initialize a FileCheckpoint.
+
+        :param path: The path of the checkpoint file. It is created on first use.
+        :type path: str or os.PathLike
+        :param fsync: If True, every record is flushed to disk before the operation continues.
+        :type fsync: bool, optional
+        """
+        super().__init__()
+        self.path = os.fspath(path)
+        self.fsync = fsync
+
+    def __repr__(self) -> str:
+        """
+        Provide a string representation of the FileCheckpoint.
+
+        :return: A string including the path of the checkpoint file.
+        :rtype: str
+        """
+        return f"FileCheckpoint({self.path!r})"
+
+    def load(self) -> List[Dict[str, Any]]:
+        """
+        Load all records from the checkpoint file.
+
+        A trailing partial line, left behind by an interrupted write, is discarded.
+
+        :return: The stored records, oldest first.
+        :rtype: list[dict[str, Any]]
+        """
+        if not os.path.exists(self.path):
+            return []
+
+        records = []
+        valid_size = 0
+        with open(self.path, "rb") as f:
+            for line in f:
+                try:
+                    if not line.endswith(b"\n"):
+                        raise ValueError("Incomplete line.")
+                    records.append(json.loads(line))
+                except ValueError:
+                    self.logger.warning(
+                        "Discarding incomplete record in checkpoint file %s.", self.path
+                    )
+                    break
+                valid_size += len(line)
+
+        if valid_size < os.path.getsize(self.path):
+            os.truncate(self.path, valid_size)
+        return records
+
+    def append(self, record: Dict[str, Any]) -> None:
+        """
+        Append a record to the checkpoint file.
+
+        :param record: A JSON serializable record.
+        :type record: dict[str, Any]
+        """
+        with open(self.path, "a", encoding="utf-8") as f:
+            f.write(json.dumps(record) + "\n")
+            if self.fsync:
+                f.flush()
+                os.fsync(f.fileno())
+
+    def clear(self) -> None:
+        """
+        Remove the checkpoint file, e.g. after the operation finished successfully.
+        """
+        if os.path.exists(self.path):
+            os.remove(self.path)
+        self._chunks = {}
+        self._cursor = None
+
+
+class CallbackCheckpoint(Checkpoint):
+    """
+    A checkpoint that hands every record to a callback, e.g. to store it in a database.
+
+    To resume, pass the records received by the callback during the previous run.
+    """
+
+    def __init__(
+        self,
+        callback: Callable[[Dict[str, Any]], None],
+        records: Optional[List[Dict[str, Any]]] = None,
+    ) -> None:
+        """
+        Initialize a CallbackCheckpoint.
+
+        :param callback: Called with every new record.
+        :type callback: Callable[[dict[str, Any]], None]
+        :param records: Records saved by a previous run. Defaults to None.
+        :type records: list[dict[str, Any]], optional
+        """
+        super().__init__()
+        self.callback = callback
+        self.records = list(records or [])
+
+    def load(self) -> List[Dict[str, Any]]:
+        """
+        Return the records passed in and received so far.
+
+        :return: The stored records, oldest first.
+        :rtype: list[dict[str, Any]]
+        """
+        return list(self.records)
+
+    def append(self, record: Dict[str, Any]) -> None:
+        """
+        Store a record and pass it to the callback.
+
+        :param record: A JSON serializable record.
+        :type record: dict[str, Any]
+        """
+        self.records.append(record)
+        self.callback(record)
+
+
+def as_checkpoint(
+    checkpoint: Union[Checkpoint, str, os.PathLike, Callable, None],
+) -> Optional[Checkpoint]:
+    """
+    Normalize the checkpoint argument accepted by table operations.
+
+    :param checkpoint: A Checkpoint, a file path, a callback, or None.
+    :type checkpoint: Union[Checkpoint, str, os.PathLike, Callable, None]
+    :return: A Checkpoint instance, or None.
+    :rtype: Checkpoint, optional
+    :raises TypeError: If the argument cannot be used as a checkpoint.
+    """
+    if checkpoint is None or isinstance(checkpoint, Checkpoint):
+        return checkpoint
+    if isinstance(checkpoint, (str, os.PathLike)):
+        return FileCheckpoint(checkpoint)
+    if callable(checkpoint):
+        return CallbackCheckpoint(checkpoint)
+    raise TypeError(
+        f"Unsupported checkpoint type {type(checkpoint)}. Expected a Checkpoint, a file path or a callback."
+    )
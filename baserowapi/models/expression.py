@@ -0,0 +1,507 @@
+import logging
+import re
+from typing import TYPE_CHECKING, Any, Callable, Dict, List, Optional, Tuple, Union
+
+if TYPE_CHECKING:
+    from baserowapi.models.row import Row
+    from baserowapi.models.table import Table
+
+# Baserow filter types and the filter type matching the opposite condition.
+NEGATED_OPERATORS: Dict[str, str] = {
+    "equal": "not_equal",
+    "contains": "contains_not",
+    "contains_word": "doesnt_contain_word",
+    "higher_than": "lower_than_or_equal",
+    "lower_than": "higher_than_or_equal",
+    "empty": "not_empty",
+    "single_select_equal": "single_select_not_equal",
+    "multiple_select_has": "multiple_select_has_not",
+    "link_row_has": "link_row_has_not",
+}
+NEGATED_OPERATORS.update(
+    {negated: operator for operator, negated in list(NEGATED_OPERATORS.items())}
+)
+
+
+def _text(value: Any) -> str:
+    """
+    Convert a raw API value to the text filters compare against, e.g. the names of linked rows.
+    """
+    if value is None:
+        return ""
+    if isinstance(value, list):
+        return ", ".join(_text(item) for item in value)
+    if isinstance(value, dict):
+        return _text(value.get("value", value.get("name", value.get("visible_name"))))
+    return str(value)
+
+
+def _number(value: Any) -> Optional[float]:
+    if isinstance(value, bool) or value is None:
+        return None
+    try:
+        return float(value)
+    except (TypeError, ValueError):
+        return None
+
+
+def _equal(value: Any, expected: Any) -> bool:
+    left, right = _number(value), _number(expected)
+    if left is not None and right is not None:
+        return left == right
+    if isinstance(value, bool) or isinstance(expected, bool):
+        return bool(value) == (str(expected).lower() in ("1", "true"))
+    return _text(value) == _text(expected)
+
+
+def _compare(test: Callable[[Any, Any], bool]) -> Callable[[Any, Any], bool]:
+    def compare(value: Any, expected: Any) -> bool:
+        if value is None or value == "":
+            return False
+        left, right = _number(value), _number(expected)
+        if left is not None and right is not None:
+            return test(left, right)
+        # ISO dates and plain text compare in lexicographic order
+        return test(_text(value), _text(expected))
+
+    return compare
+
+
+def _contains(value: Any, expected: Any) -> bool:
+    return _text(expected).lower() in _text(value).lower()
+
+
+def _contains_word(value: Any, expected: Any) -> bool:
+    return _text(expected).lower() in re.findall(r"\w+", _text(value).lower())
+
+
+def _is_empty(value: Any) -> bool:
+    return value is None or value == "" or value == []
+
+
+# Local implementations of Baserow filter types, applied to the raw values returned by the API.
+LOCAL_OPERATORS: Dict[str, Callable[[Any, Any], bool]] = {
+    "equal": _equal,
+    "not_equal": lambda value, expected: not _equal(value, expected),
+    "contains": _contains,
+    "contains_not": lambda value, expected: not _contains(value, expected),
+    "contains_word": _contains_word,
+    "doesnt_contain_word": lambda value, expected: not _contains_word(value, expected),
+    "higher_than": _compare(lambda left, right: left > right),
+    "higher_than_or_equal": _compare(lambda left, right: left >= right),
+    "lower_than": _compare(lambda left, right: left < right),
+    "lower_than_or_equal": _compare(lambda left, right: left <= right),
+    "length_is_lower_than": lambda value, expected: len(_text(value)) < int(expected),
+    "empty": lambda value, expected: _is_empty(value),
+    "not_empty": lambda value, expected: not _is_empty(value),
+    "boolean": _equal,
+}
+
+# A filter tree node: either a single filter or a nested filter tree.
+Node = Dict[str, Any]
+
+
+class Expression:
+    """
+    A composable row condition that compiles into a Baserow filter tree.
+
+    Expressions are combined with ``&`` (and), ``|`` (or) and negated with ``~``. When rows are
+    fetched with an expression, `compile` splits it into the part Baserow can evaluate, sent
+    as nested filter groups, and a remainder that is evaluated locally on the fetched rows.
+    """
+
+    def __and__(self, other: "Expression") -> "Expression":
+        return Group("AND", [self, other])
+
+    def __or__(self, other: "Expression") -> "Expression":
+        return Group("OR", [self, other])
+
+    def __invert__(self) -> "Expression":
+        raise NotImplementedError
+
+    def plan(self, table: "Table") -> Tuple[Optional[Node], Optional["Expression"]]:
+        """
+        Split the expression into a filter tree node for the server and a local remainder.
+
+        The rows matching the expression are exactly the rows matching the node that also
+        match the remainder.
+
+        :param table: The table whose fields the expression refers to.
+        :type table: Table
+        :return: The node pushed to the server, or None, and the remainder, or None.
+        :rtype: tuple
+        """
+        raise NotImplementedError
+
+    def matches(self, row: "Row") -> bool:
+        """
+        Evaluate the expression locally on a fetched row.
+
+        :param row: The row.
+        :type row: Row
+        :return: True if the row matches.
+        :rtype: bool
+        """
+        raise NotImplementedError
+
+    def field_names(self) -> List[str]:
+        """
+        The names of the fields the expression refers to.
+
+        :return: The field names, in order of appearance.
+        :rtype: list[str]
+        """
+        raise NotImplementedError
+
+    def check_local(self, table: "Table") -> None:
+        """
+        Check that the whole expression can be evaluated locally on fetched rows.
+
+        :param table: The table whose fields the expression refers to.
+        :type table: Table
+        :raises ValueError: If a filter type is only available on the server.
+        """
+        raise NotImplementedError
+
+    def compile(
+        self, table: "Table"
+    ) -> Tuple[Optional[Dict[str, Any]], Optional["Expression"]]:
+        """
+        Compile the expression for a table.
+
+        Every predicate is validated against the fields of the table. Predicates whose filter
+        type is compatible with their field are pushed down to the server, together with every
+        'and' or 'or' group that only contains such predicates. The rest is returned as a
+        remainder to evaluate locally.
+
+        :param table: The table whose fields the expression refers to.
+        :type table: Table
+        :return: The filter tree for the request, or None, and the remainder, or None.
+        :rtype: tuple[dict[str, Any], Expression]
+        :raises ValueError: If a field does not exist, or a filter type is neither supported
+                            by the field nor available locally. An 'or' group that is evaluated
+                            locally must only contain filter types available locally.
+        """
+        node, remainder = self.plan(table)
+        if node is not None and "filter_type" not in node:
+            node = {"filter_type": "AND", "filters": [node], "groups": []}
+        logging.getLogger(__name__).debug(
+            "Compiled %r into filter tree %s and local remainder %r",
+            self,
+            node,
+            remainder,
+        )
+        return node, remainder
+
+
+class Predicate(Expression):
+    """
+    A condition on a single field, e.g. ``F("Age") > 30``.
+
+    :ivar field_name: The name of the field.
+    :vartype field_name: str
+    :ivar operator: The Baserow filter type, or None for a purely local condition.
+    :vartype operator: str, optional
+    :ivar value: The value compared against.
+    :vartype value: Any
+    """
+
+    def __init__(
+        self,
+        field_name: str,
+        operator: Optional[str],
+        value: Any = "",
+        local: Optional[Callable[[Any], bool]] = None,
+    ) -> None:
+        """
+        Initialize a Predicate.
+
+        :param field_name: The name of the field.
+        :type field_name: str
+        :param operator: The Baserow filter type, or None for a purely local condition.
+        :type operator: str, optional
+        :param value: The value compared against. Defaults to ''.
+        :type value: Any
+        :param local: A callable evaluating the condition on the raw value of the field. Used
+                      instead of the filter type when the condition is evaluated locally.
+        :type local: Callable[[Any], bool], optional
+        """
+        self.field_name = field_name
+        self.operator = operator
+        self.value = value
+        self.local = local
+
+    def __repr__(self) -> str:
+        """
+        Provide a string representation of the Predicate.
+
+        :return: A string including the field, filter type and value.
+        :rtype: str
+        """
+        operator = self.operator or getattr(self.local, "__name__", "local")
+        return f"F({self.field_name!r}).{operator}({self.value!r})"
+
+    def __invert__(self) -> "Expression":
+        local = self.local
+        negated_local = (lambda value: not local(value)) if local else None
+        if self.operator in NEGATED_OPERATORS:
+            return Predicate(
+                self.field_name,
+                NEGATED_OPERATORS[self.operator],
+                self.value,
+                negated_local,
+            )
+        if local is None and self.operator not in LOCAL_OPERATORS:
+            raise ValueError(f"The filter '{self.operator}' cannot be negated.")
+        return Predicate(
+            self.field_name,
+            None,
+            self.value,
+            negated_local or (lambda value: not self._evaluate(value)),
+        )
+
+    def _evaluate(self, value: Any) -> bool:
+        if self.local is not None:
+            return self.local(value)
+        return LOCAL_OPERATORS[self.operator](value, self.value)
+
+    def plan(self, table: "Table") -> Tuple[Optional[Node], Optional[Expression]]:
+        if self.field_name not in table.field_names:
+            raise ValueError(f"Invalid field name in filter: {self.field_name}")
+        field = table.fields[self.field_name]
+        if self.operator in getattr(field, "compatible_filters", []):
+            value = self.value
+            if hasattr(value, "isoformat"):
+                value = value.isoformat()
+            elif isinstance(value, bool):
+                value = "1" if value else "0"
+            return {
+                "field": self.field_name,
+                "type": self.operator,
+                "value": value,
+            }, None
+        if self.local is None and self.operator not in LOCAL_OPERATORS:
+            raise ValueError(
+                f"Invalid filter '{self.operator}' with value '{self.value}' for field type '{field.TYPE}'"
+            )
+        return None, self
+
+    def matches(self, row: "Row") -> bool:
+        return self._evaluate(row._row_data.get(self.field_name))
+
+    def field_names(self) -> List[str]:
+        return [self.field_name]
+
+    def check_local(self, table: "Table") -> None:
+        if self.local is None and self.operator not in LOCAL_OPERATORS:
+            raise ValueError(
+                f"The filter '{self.operator}' on field '{self.field_name}' is only available "
+                "on the server and cannot be combined with local conditions in an 'or' group."
+            )
+
+
+class Group(Expression):
+    """
+    Combines expressions with 'AND' or 'OR'.
+
+    :ivar filter_type: Either 'AND' or 'OR'.
+    :vartype filter_type: str
+    :ivar children: The combined expressions.
+    :vartype children: list[Expression]
+    """
+
+    def __init__(self, filter_type: str, children: List[Expression]) -> None:
+        """
+        Initialize a Group, flattening nested groups of the same filter type.
+
+        :param filter_type: Either 'AND' or 'OR'.
+        :type filter_type: str
+        :param children: The combined expressions.
+        :type children: list[Expression]
+        :raises ValueError: If filter_type is not 'AND' or 'OR'.
+        """
+        if filter_type not in ("AND", "OR"):
+            raise ValueError("'filter_type' should be either 'AND' or 'OR'")
+        self.filter_type = filter_type
+        self.children: List[Expression] = []
+        for child in children:
+            if isinstance(child, Group) and child.filter_type == filter_type:
+                self.children.extend(child.children)
+            else:
+                self.children.append(child)
+
+    def __repr__(self) -> str:
+        """
+        Provide a string representation of the Group.
+
+        :return: The combined expressions joined by their operator.
+        :rtype: str
+        """
+        joiner = " & " if self.filter_type == "AND" else " | "
+        return "(" + joiner.join(repr(child) for child in self.children) + ")"
+
+    def __invert__(self) -> "Expression":
+        # De Morgan: not (a and b) == (not a) or (not b)
+        return Group(
+            "OR" if self.filter_type == "AND" else "AND",
+            [~child for child in self.children],
+        )
+
+    def plan(self, table: "Table") -> Tuple[Optional[Node], Optional[Expression]]:
+        planned = [child.plan(table) for child in self.children]
+        remainders = [remainder for _, remainder in planned if remainder is not None]
+        if self.filter_type == "OR" and remainders:
+            # A disjunction can only be narrowed by the server if all of its branches can.
+            self.check_local(table)
+            return None, self
+
+        nodes = [node for node, _ in planned if node is not None]
+        tree = None
+        if nodes:
+            tree = {
+                "filter_type": self.filter_type,
+                "filters": [node for node in nodes if "filter_type" not in node],
+                "groups": [node for node in nodes if "filter_type" in node],
+            }
+        if not remainders:
+            return tree, None
+        if len(remainders) == 1:
+            return tree, remainders[0]
+        return tree, Group("AND", remainders)
+
+    def matches(self, row: "Row") -> bool:
+        results = (child.matches(row) for child in self.children)
+        return all(results) if self.filter_type == "AND" else any(results)
+
+    def field_names(self) -> List[str]:
+        names: List[str] = []
+        for child in self.children:
+            names.extend(name for name in child.field_names() if name not in names)
+        return names
+
+    def check_local(self, table: "Table") -> None:
+        for child in self.children:
+            child.check_local(table)
+
+
+class F:
+    """
+    Refers to a field in a filter expression.
+
+    Comparisons with a field create predicates that can be combined into expressions::
+
+        (F("Age") > 30) & ((F("City") == "Berlin") | F("Notes").contains("vip"))
+
+    :ivar field_name: The name of the field.
+    :vartype field_name: str
+    """
+
+    __hash__ = None  # type: ignore[assignment]
+
+    def __init__(self, field_name: str) -> None:
+        """
+        Initialize a field reference.
+
+        :param field_name: The name of the field.
+        :type field_name: str
+        """
+        self.field_name = field_name
+
+    def __repr__(self) -> str:
+        """
+        Provide a string representation of the field reference.
+
+        :return: A string including the field name.
+        :rtype: str
+        """
+        return f"F({self.field_name!r})"
+
+    def __eq__(self, value: Any) -> Predicate:  # type: ignore[override]
+        return Predicate(self.field_name, "equal", value)
+
+    def __ne__(self, value: Any) -> Predicate:  # type: ignore[override]
+        return Predicate(self.field_name, "not_equal", value)
+
+    def __gt__(self, value: Any) -> Predicate:
+        return Predicate(self.field_name, "higher_than", value)
+
+    def __ge__(self, value: Any) -> Predicate:
+        return Predicate(self.field_name, "higher_than_or_equal", value)
+
+    def __lt__(self, value: Any) -> Predicate:
+        return Predicate(self.field_name, "lower_than", value)
+
+    def __le__(self, value: Any) -> Predicate:
+        return Predicate(self.field_name, "lower_than_or_equal", value)
+
+    def contains(self, value: Any) -> Predicate:
+        """
+        The field contains the given text, case-insensitively.
+
+        :param value: The text.
+        :type value: Any
+        :return: The predicate.
+        :rtype: Predicate
+        """
+        return Predicate(self.field_name, "contains", value)
+
+    def is_empty(self) -> Predicate:
+        """
+        The field is empty.
+
+        :return: The predicate.
+        :rtype: Predicate
+        """
+        return Predicate(self.field_name, "empty")
+
+    def is_in(self, values: List[Any]) -> Expression:
+        """
+        The field equals one of the given values.
+
+        :param values: The values.
+        :type values: list[Any]
+        :return: An 'or' group of equality predicates.
+        :rtype: Expression
+        """
+        return Group("OR", [self == value for value in values])
+
+    def filter(self, operator: str, value: Any = "") -> Predicate:
+        """
+        Apply any Baserow filter type, e.g. 'date_is_after' or 'link_row_has'.
+
+        :param operator: The Baserow filter type.
+        :type operator: str
+        :param value: The filter value. Defaults to ''.
+        :type value: Any
+        :return: The predicate.
+        :rtype: Predicate
+        """
+        return Predicate(self.field_name, operator, value)
+
+    def matches(self, pattern: Union[str, "re.Pattern"]) -> Predicate:
+        """
+        The text of the field matches a regular expression. Always evaluated locally.
+
+        :param pattern: The regular expression.
+        :type pattern: Union[str, re.Pattern]
+        :return: The predicate.
+        :rtype: Predicate
+        """
+        regex = re.compile(pattern)
+        return Predicate(
+            self.field_name,
+            None,
+            regex.pattern,
+            lambda value: regex.search(_text(value)) is not None,
+        )
+
+    def where(self, test: Callable[[Any], bool]) -> Predicate:
+        """
+        The field passes a custom test. Always evaluated locally.
+
+        :param test: A callable receiving the raw value of the field as returned by the API.
+        :type test: Callable[[Any], bool]
+        :return: The predicate.
+        :rtype: Predicate
+        """
+        return Predicate(self.field_name, None, getattr(test, "__name__", ""), test)
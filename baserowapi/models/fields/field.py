@@ -1,5 +1,6 @@
-from typing import Any, Dict, Union
+from typing import Any, Callable, Dict, Optional, Union
 import logging
+from baserowapi.models.fields.native_converters import native_converter
 
 
 class Field:
@@ -32,8 +33,9 @@ class Field:
         self.name = name
         self.field_data = field_data
         self.client = client
+        self._native_converter: Optional[Callable[[Any], Any]] = None
         self.logger.debug(
-            f"Initialized field '{self.name}' with attributes '{self.field_data}'"
+            "Initialized field '%s' with attributes '%s'", self.name, self.field_data
         )
 
     def __repr__(self) -> str:
@@ -87,6 +89,21 @@ class Field:
         # Return the value as-is if it passes validation
         return value
 
+    @property
+    def native_converter(self) -> Callable[[Any], Any]:
+        """
+        Lazy-loaded function converting raw API values of the field to native Python values.
+
+        The converter is chosen once per field from its type, and for formula and lookup fields
+        from their ``formula_type`` and ``array_formula_type``.
+
+        :return: A function taking a raw value and returning the native value.
+        :rtype: Callable[[Any], Any]
+        """
+        if self._native_converter is None:
+            self._native_converter = native_converter(self.type, self.field_data)
+        return self._native_converter
+
     @property
     def id(self) -> Union[int, None]:
         """
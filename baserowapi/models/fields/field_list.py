@@ -21,7 +21,7 @@ class FieldList:
         """
         self.fields = fields
         self.logger = logging.getLogger(__name__)
-        self.logger.debug(f"Initialized FieldList with {len(fields)} fields.")
+        self.logger.debug("Initialized FieldList with %s fields.", len(fields))
 
     def __repr__(self) -> str:
         """
@@ -0,0 +1,147 @@
+from datetime import date, datetime
+from decimal import Decimal
+from typing import Any, Callable, Dict, List, Optional, Union
+from zoneinfo import ZoneInfo
+
+Converter = Callable[[Any], Any]
+
+
+def _identity(raw_value: Any) -> Any:
+    return raw_value
+
+
+def _to_bool(raw_value: Any) -> Optional[bool]:
+    return None if raw_value is None else bool(raw_value)
+
+
+def _to_int(raw_value: Any) -> Optional[int]:
+    if raw_value is None or raw_value == "":
+        return None
+    return raw_value if type(raw_value) is int else int(Decimal(str(raw_value)))
+
+
+def _to_option_value(raw_value: Any) -> Any:
+    return raw_value.get("value") if isinstance(raw_value, dict) else raw_value
+
+
+def _to_option_values(raw_value: Any) -> List[Any]:
+    return [_to_option_value(option) for option in raw_value or []]
+
+
+def _to_ids(raw_value: Any) -> List[Any]:
+    return [
+        entry.get("id") if isinstance(entry, dict) else entry
+        for entry in raw_value or []
+    ]
+
+
+def _number(field_data: Dict[str, Any]) -> Converter:
+    """
+    Convert decimal strings to int for fields without decimal places, to Decimal otherwise.
+    """
+    if not field_data.get("number_decimal_places"):
+        return _to_int
+
+    def to_decimal(raw_value: Any) -> Optional[Decimal]:
+        if raw_value is None or raw_value == "":
+            return None
+        return Decimal(str(raw_value))
+
+    return to_decimal
+
+
+def _date(field_data: Dict[str, Any]) -> Converter:
+    """
+    Convert ISO strings to date, or to aware datetime in the forced timezone of the field.
+    """
+    if not field_data.get("date_include_time", True):
+
+        def to_date(raw_value: Any) -> Union[date, None]:
+            if not raw_value or isinstance(raw_value, date):
+                return raw_value or None
+            return date.fromisoformat(raw_value[:10])
+
+        return to_date
+
+    force_timezone = field_data.get("date_force_timezone")
+    tzinfo = ZoneInfo(force_timezone) if force_timezone else None
+
+    def to_datetime(raw_value: Any) -> Optional[datetime]:
+        if not raw_value:
+            return None
+        if isinstance(raw_value, datetime):
+            value = raw_value
+        elif raw_value.endswith("Z"):
+            value = datetime.fromisoformat(raw_value[:-1] + "+00:00")
+        else:
+            value = datetime.fromisoformat(raw_value)
+        return value.astimezone(tzinfo) if tzinfo is not None else value
+
+    return to_datetime
+
+
+def _array(field_data: Dict[str, Any]) -> Converter:
+    """
+    Convert the values of lookup and array formula results by their array formula type.
+    """
+    item_type = field_data.get("array_formula_type")
+    if item_type == "array":
+        return _identity
+    convert_item = native_converter(item_type, field_data)
+
+    def to_list(raw_value: Any) -> List[Any]:
+        return [
+            convert_item(item.get("value") if isinstance(item, dict) else item)
+            for item in raw_value or []
+        ]
+
+    return to_list
+
+
+def _formula(field_data: Dict[str, Any]) -> Converter:
+    """
+    Choose the converter of a formula by the type of its result.
+    """
+    return native_converter(field_data.get("formula_type"), field_data)
+
+
+NATIVE_CONVERTERS: Dict[str, Callable[[Dict[str, Any]], Converter]] = {
+    "number": _number,
+    "rating": lambda field_data: _to_int,
+    "count": lambda field_data: _to_int,
+    "autonumber": lambda field_data: _to_int,
+    "boolean": lambda field_data: _to_bool,
+    "date": _date,
+    "created_on": _date,
+    "last_modified": _date,
+    "single_select": lambda field_data: _to_option_value,
+    "multiple_select": lambda field_data: _to_option_values,
+    "link_row": lambda field_data: _to_ids,
+    "multiple_collaborators": lambda field_data: _to_ids,
+    "array": _array,
+    "formula": _formula,
+    "lookup": _array,
+}
+
+
+def native_converter(
+    field_type: Optional[str], field_data: Dict[str, Any]
+) -> Converter:
+    """
+    Build the function converting raw API values of a field type to native Python values.
+
+    Numbers become int (without decimal places) or Decimal, dates become date or timezone-aware
+    datetime (in ``date_force_timezone`` if set), booleans bool, single select options their
+    value, multiple select options a list of values, and link and collaborator cells a list of
+    ids. Formula results are converted by their ``formula_type``, lookups and array formulas
+    item by item by their ``array_formula_type``. Other values are returned unchanged.
+
+    :param field_type: The field type or formula result type.
+    :type field_type: str, optional
+    :param field_data: The field data with the settings of the field.
+    :type field_data: dict[str, Any]
+    :return: A function taking a raw value and returning the native value.
+    :rtype: Callable[[Any], Any]
+    """
+    builder = NATIVE_CONVERTERS.get(field_type)
+    return builder(field_data) if builder is not None else _identity
@@ -143,7 +143,10 @@ class TableLinkField(Field):
             options = [row[primary_field_name] for row in returned_rows]
 
             self.logger.debug(
-                f"Retrieved {len(options)} options for TableLinkField '{self.name}' from related table {related_table.id}"
+                "Retrieved %s options for TableLinkField '%s' from related table %s",
+                len(options),
+                self.name,
+                related_table.id,
             )
             return options
         except Exception as e:
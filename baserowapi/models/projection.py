@@ -0,0 +1,82 @@
+import logging
+from typing import List, Optional, Set
+
+
+class Projection:
+    """
+    Learns which fields are read from the rows of a row generator, to narrow 'include' for the
+    pages fetched after a sample.
+
+    Rows of the sample report every field read through `Row.__getitem__`. Once the sample has
+    been consumed, the projection is frozen and the remaining pages are requested with only
+    the fields that were read. If a later row reads a field outside the projection, the field
+    is loaded for that row and added to the projection for the following pages.
+
+    :ivar sample_size: The minimum number of rows read before the projection is frozen.
+    :vartype sample_size: int
+    :ivar accessed: The names of the fields read so far.
+    :vartype accessed: set[str]
+    :ivar include: The fields requested for the remaining pages, or None while sampling.
+    :vartype include: list[str], optional
+    """
+
+    logger: logging.Logger = logging.getLogger(__name__)
+
+    def __init__(self, sample_size: int = 1) -> None:
+        """
+        Initialize a Projection.
+
+        :param sample_size: The minimum number of rows read before the projection is frozen.
+                            The sample always ends with a complete page. Defaults to 1.
+        :type sample_size: int
+        """
+        self.sample_size = sample_size
+        self.accessed: Set[str] = set()
+        self.include: Optional[List[str]] = None
+
+    def __repr__(self) -> str:
+        """
+        Provide a string representation of the Projection.
+
+        :return: A string including the learned fields.
+        :rtype: str
+        """
+        return f"Projection(include={self.include}, accessed={sorted(self.accessed)})"
+
+    @property
+    def frozen(self) -> bool:
+        """
+        Whether the sample is complete and the remaining pages are narrowed.
+
+        :return: True if the projection is frozen.
+        :rtype: bool
+        """
+        return self.include is not None
+
+    def record(self, field_name: str) -> None:
+        """
+        Record that a field was read from a row.
+
+        :param field_name: The name of the field.
+        :type field_name: str
+        """
+        if field_name in self.accessed:
+            return
+        self.accessed.add(field_name)
+        if self.include is not None:
+            self.logger.debug("Adding field '%s' to the projection.", field_name)
+            self.include.append(field_name)
+
+    def freeze(self, fallback_field: str) -> List[str]:
+        """
+        End the sample and fix the fields requested for the remaining pages.
+
+        :param fallback_field: The field requested if no field was read, usually the primary
+                               field, as the API does not accept an empty 'include'.
+        :type fallback_field: str
+        :return: The fields requested for the remaining pages.
+        :rtype: list[str]
+        """
+        self.include = sorted(self.accessed) or [fallback_field]
+        self.logger.debug("Narrowed the projection to %s.", self.include)
+        return self.include
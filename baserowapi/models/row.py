@@ -1,10 +1,11 @@
 import logging
-from typing import TYPE_CHECKING, Dict, Any, List, Type, Optional
+from typing import TYPE_CHECKING, Dict, Any, List, Type, Optional, Union
 
 if TYPE_CHECKING:
     from baserowapi.models.table import Table
     from baserowapi.baserow import Baserow as Client
     from baserowapi.models.fields.field import Field
+    from baserowapi.models.projection import Projection
 
 from baserowapi.exceptions import (
     RowFetchError,
@@ -70,6 +71,10 @@ class Row:
     """
 
     logger: logging.Logger = logging.getLogger(__name__)
+    # Set by row generators with auto_include; fields read from the row are reported to it.
+    _projection: Optional["Projection"] = None
+    # Set by row generators with types="native"; values are read as native Python types.
+    _native: bool = False
 
     def __init__(
         self, row_data: Dict[str, Any], table: "Table", client: "Client"
@@ -90,9 +95,11 @@ class Row:
         self.table_id: int = table.id
         self.client: "Client" = client
         self._row_data: Dict[str, Any] = row_data
+        # Last-known server state. _row_data is copied before local edits so this stays untouched.
+        self._server_data: Dict[str, Any] = row_data
         self._values: Optional[RowValueList] = None
 
-        self.logger.debug(f"Initialized Row id {self.id}")
+        self.logger.debug("Initialized Row id %s", self.id)
 
     @property
     def values(self) -> RowValueList:
@@ -108,7 +115,7 @@ class Row:
             try:
                 self._values = self._create_row_value_list(self._row_data)
                 self.logger.debug(
-                    f"RowValueList for Row id {self.id} successfully created."
+                    "RowValueList for Row id %s successfully created.", self.id
                 )
             except Exception as e:
                 self.logger.error(
@@ -135,37 +142,46 @@ class Row:
         """
         Create a RowValueList based on the given row data and table fields.
 
-        Metadata fields such as "id" and "order" are excluded from processing.
+        Metadata fields such as "id" and "order" are excluded from processing. The RowValue
+        object of a field is only created when the field is first accessed.
 
         :param row_data: Data representing the row.
         :type row_data: dict[str, Any]
-        :return: RowValueList containing RowValue objects derived from the row data.
+        :return: RowValueList building RowValue objects from the row data on demand.
         :rtype: RowValueList
-        :raises RowFetchError: If there's an error creating a RowValue object.
         """
-        row_value_objects: List[RowValue] = []
-        for field_name, value in row_data.items():
-            # Skip metadata fields
-            if field_name in ["id", "order"]:
-                continue
+        return RowValueList(
+            names=[name for name in row_data if name not in ("id", "order")],
+            factory=lambda field_name: self._create_row_value(
+                field_name, row_data[field_name]
+            ),
+        )
+
+    def _create_row_value(self, field_name: str, raw_value: Any) -> RowValue:
+        """
+        Create the RowValue object of a field from its raw value.
 
+        :param field_name: The name of the field.
+        :type field_name: str
+        :param raw_value: The value of the field as returned by the API.
+        :type raw_value: Any
+        :return: The RowValue object of the field.
+        :rtype: RowValue
+        :raises RowFetchError: If the field does not exist or the RowValue object cannot be created.
+        """
+        try:
             field_object = self._get_field_object(field_name)
             row_value_class = self._get_row_value_class(field_object.type)
-
-            try:
-                row_value_obj = row_value_class(
-                    field=field_object, client=self.client, raw_value=value
-                )
-                row_value_objects.append(row_value_obj)
-            except Exception as e:
-                self.logger.error(
-                    f"Failed to create RowValue object for field '{field_name}'. Error: {e}"
-                )
-                raise RowFetchError(
-                    f"Failed to create RowValue object for field '{field_name}'."
-                ) from e
-
-        return RowValueList(row_value_objects)
+            return row_value_class(
+                field=field_object, client=self.client, raw_value=raw_value
+            )
+        except Exception as e:
+            self.logger.error(
+                f"Failed to create RowValue object for field '{field_name}'. Error: {e}"
+            )
+            raise RowFetchError(
+                f"Failed to create RowValue object for field '{field_name}'."
+            ) from e
 
     def _get_field_object(self, field_name: str) -> "Field":
         """
@@ -222,12 +238,48 @@ class Row:
         :raises KeyError: If the specified field name is not found in the row values.
         """
         try:
-            row_value = self.values[key]
-            return row_value.value
+            if self._native:
+                value = self._native_value(key)
+            else:
+                value = self.values[key].value
+            if self._projection is not None:
+                self._projection.record(key)
+            return value
         except KeyError:
+            if self._projection is not None and key in self.table.field_names:
+                self._projection.record(key)
+                row_value = self._load_field(key)
+                return row_value.native_value if self._native else row_value.value
             self.logger.warning(f"Field '{key}' not found in row values.")
             raise KeyError(f"Field '{key}' not found in the row values.")
 
+    def _load_field(self, field_name: str) -> RowValue:
+        """
+        Fetch a field that was left out of a projected row and add it to the row.
+
+        :param field_name: The name of the field.
+        :type field_name: str
+        :return: The RowValue of the loaded field.
+        :rtype: RowValue
+        """
+        self.logger.debug("Loading field '%s' for row id %s.", field_name, self.id)
+        raw_value = self.table._get_field_values([self.id], field_name).get(self.id)
+        field_object = self._get_field_object(field_name)
+        row_value = self._get_row_value_class(field_object.type)(
+            field=field_object, client=self.client, raw_value=raw_value
+        )
+        self.values.add(row_value)
+        self.__dict__.pop("_fields", None)
+
+        # Keep _row_data and the server state in step, without merging local edits into the latter
+        server_data = {**self._server_data, field_name: raw_value}
+        if self._row_data is self._server_data:
+            self._row_data = server_data
+        else:
+            self._row_data = {**self._row_data, field_name: raw_value}
+        self._server_data = server_data
+        return row_value
+
     def __setitem__(self, key: str, new_value: Any) -> None:
         """
         Set a value for a specific field in the row using dictionary-style access.
@@ -239,11 +291,19 @@ class Row:
         :note: This modifies the in-memory representation of the row.
         :raises KeyError: If the specified field name is not found in the row values or is unrecognized.
         """
+        if self._projection is not None and key not in self.values:
+            raise KeyError(
+                f"Field '{key}' was not loaded for row {self.id}, because the row was fetched "
+                f"with the projection {self._projection.include}. Fetch the row with the field "
+                f"included to change it."
+            )
         try:
             row_value = self.values[key]
             row_value.value = new_value  # Using the value setter of the RowValue object
 
-            # Synchronize _row_data with the updated value
+            # Synchronize _row_data with the updated value, keeping the server state intact
+            if self._row_data is self._server_data:
+                self._row_data = dict(self._row_data)
             self._row_data[key] = new_value
         except KeyError:
             # Field not found in the Row's values
@@ -289,23 +349,115 @@ class Row:
             # Lazily load the row values if they haven't been loaded yet
             self.values  # Accessing the property to trigger lazy loading
 
+        if self._native:
+            return self.typed()
+
+        if self._projection is not None:
+            for name in self.values.fields:
+                self._projection.record(name)
         return {row_value.name: row_value.value for row_value in self.values}
 
+    def _native_value(self, field_name: str) -> Any:
+        """
+        Convert the value of a field to its native Python type without building its RowValue.
+
+        :param field_name: The name of the field.
+        :type field_name: str
+        :return: The native value of the field.
+        :rtype: Any
+        :raises KeyError: If the field is not in the row values.
+        """
+        values = self.values
+        if values.is_built(field_name):
+            raw_value = values[field_name]._raw_value
+        elif field_name in values:
+            raw_value = self._row_data[field_name]
+        else:
+            raise KeyError(f"Field '{field_name}' not found in the row values.")
+        return self._get_field_object(field_name).native_converter(raw_value)
+
+    def typed(self) -> Dict[str, Any]:
+        """
+        Converts the Row's values to a dictionary of native Python values.
+
+        Numbers become int or Decimal, dates date or timezone-aware datetime (in the forced
+        timezone of the field, if set), booleans bool, single select options their value,
+        multiple select options a list of values and link and collaborator cells a list of ids.
+        Formula and lookup values are converted by their result type. Other values are returned
+        as by `to_dict`. The converter of every field is chosen once and cached on the field.
+
+        :return: A dictionary of field names and native values.
+        :rtype: dict[str, Any]
+        :raises RowFetchError: If a field of the row does not exist in the table.
+        """
+        values = self.values
+        if self._projection is not None:
+            for name in values.fields:
+                self._projection.record(name)
+        try:
+            return {name: self._native_value(name) for name in values.fields}
+        except KeyError as e:
+            raise RowFetchError(
+                f"Failed to convert the values of row id {self.id}. Error: {e}"
+            ) from e
+
+    def changed_fields(self) -> Dict[str, Any]:
+        """
+        Compare the writable values of the row against the last-known server state.
+
+        Values that were never modified locally are recognized without formatting them, and
+        values that were never accessed are not built.
+
+        :return: A dictionary of API-formatted values for the writable fields that differ from the server state.
+        :rtype: dict[str, Any]
+        """
+        changed = {}
+        values = self.values
+        for name in values.fields:
+            server_raw = self._server_data.get(name)
+            if not values.is_built(name) and self._row_data.get(name) is server_raw:
+                continue
+
+            rv = values[name]
+            if rv.is_read_only:
+                continue
+            if rv._raw_value is server_raw:
+                continue
+
+            new_value = rv.format_for_api()
+            server_value = type(rv)(
+                field=rv.field, client=self.client, raw_value=server_raw
+            ).format_for_api()
+            if new_value != server_value:
+                changed[rv.name] = new_value
+        return changed
+
     def update(
-        self, values: Optional[Dict[str, Any]] = None, memory_only: bool = False
-    ) -> "Row":
+        self,
+        values: Optional[Dict[str, Any]] = None,
+        memory_only: bool = False,
+        returning: str = "rows",
+    ) -> Union["Row", int, Dict[str, Any], None]:
         """
         Updates the row in the table and synchronizes the internal state.
 
+        With ``returning="rows"``, the row values are rebuilt from the response right away.
+        Otherwise they are rebuilt from the response when they are accessed next.
+
         :param values: A dictionary containing field values for updating the row.
                     Defaults to values from the self.values property.
         :type values: dict[str, Any], optional
         :param memory_only: If True, only updates the in-memory row and skips the API request. Defaults to False.
         :type memory_only: bool, optional
-        :return: A Row object representing the updated row.
-        :rtype: Row
+        :param returning: What to return: the row itself ("rows"), its id ("ids"), the row data
+                    returned by the API ("raw") or nothing ("none"). Defaults to "rows".
+        :type returning: str, optional
+        :return: The updated row, its id, the returned row data or None, depending on returning.
+        :rtype: Union[Row, int, dict[str, Any], None]
+        :raises ValueError: If returning is not valid.
         :raises RowUpdateError: If the API request results in any error responses.
         """
+        self.table._check_returning(returning)
         try:
             # Prepare the payload for the API
             payload = {}
@@ -342,14 +494,18 @@ class Row:
                     self[field_name] = value
 
             # Debugging: Print the payload
-            self.logger.debug(f"Payload for API request: {payload}")
+            self.logger.debug("Payload for API request: %s", payload)
 
             # Synchronize _row_data with the current state of _values
-            self._row_data.update(self.to_dict())
+            self._row_data = {
+                **self._row_data,
+                **{rv.name: rv.value for rv in self.values},
+            }
 
             if memory_only:
                 self.logger.debug(
-                    f"Memory-only update for row with ID {self.id}. Skipping API request."
+                    "Memory-only update for row with ID %s. Skipping API request.",
+                    self.id,
                 )
                 return self
 
@@ -364,9 +520,19 @@ class Row:
 
             # Update _row_data and _values with the new data from the API
             self._row_data = response
-            self._values = self._create_row_value_list(self._row_data)
-            self.logger.debug(f"Successfully updated row with ID {self.id}.")
-
+            self._server_data = response
+            if returning == "rows":
+                self._values = self._create_row_value_list(self._row_data)
+            else:
+                self._values = None
+            self.logger.debug("Successfully updated row with ID %s.", self.id)
+
+            if returning == "ids":
+                return self.id
+            if returning == "raw":
+                return response
+            if returning == "none":
+                return None
             return self
 
         except Exception as e:
@@ -384,7 +550,7 @@ class Row:
         :raises RowDeleteError: For errors during the delete operation.
         """
         self.logger.debug(
-            f"Attempting to delete row with ID {self.id} from table {self.table_id}."
+            "Attempting to delete row with ID %s from table %s.", self.id, self.table_id
         )
         try:
             endpoint = f"/api/database/rows/table/{self.table_id}/{self.id}/"
@@ -392,7 +558,9 @@ class Row:
 
             if response_code == 204:
                 self.logger.debug(
-                    f"Successfully deleted row with ID {self.id} from table {self.table_id}."
+                    "Successfully deleted row with ID %s from table %s.",
+                    self.id,
+                    self.table_id,
                 )
                 return True
             else:
@@ -422,7 +590,7 @@ class Row:
         :raises RowMoveError: If there's an error during the move operation.
         """
         self.logger.debug(
-            f"Attempting to move row with ID {self.id} in table {self.table_id}."
+            "Attempting to move row with ID %s in table %s.", self.id, self.table_id
         )
         try:
             endpoint = f"/api/database/rows/table/{self.table_id}/{self.id}/move/?user_field_names=true"
@@ -436,7 +604,7 @@ class Row:
                 table=self.table, client=self.client, row_data=moved_row_data
             )
             self.logger.debug(
-                f"Successfully moved row with ID {self.id} in table {self.table_id}."
+                "Successfully moved row with ID %s in table %s.", self.id, self.table_id
             )
 
             return moved_row
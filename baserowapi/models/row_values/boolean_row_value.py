@@ -34,7 +34,9 @@ class BooleanRowValue(RowValue):
                 f"The provided field is not an instance of the BooleanField class. Received: {type(field).__name__}"
             )
         self.logger.debug(
-            f"Initialized BooleanRowValue with field {self.field.name} and value {self._raw_value}"
+            "Initialized BooleanRowValue with field %s and value %s",
+            self.field.name,
+            self._raw_value,
         )
 
     @property
@@ -59,7 +61,9 @@ class BooleanRowValue(RowValue):
         try:
             self.field.validate_value(new_value)
             self._raw_value = new_value
-            self.logger.debug(f"Set new value {new_value} for field {self.field.name}")
+            self.logger.debug(
+                "Set new value %s for field %s", new_value, self.field.name
+            )
         except Exception as e:
             self.logger.error(
                 f"Failed to set value for field {self.field.name}. Error: {e}"
@@ -34,5 +34,7 @@ class EmailRowValue(RowValue):
                 f"The provided field is not an instance of the EmailField class. Received: {type(field).__name__}"
             )
         self.logger.debug(
-            f"Initialized EmailRowValue with field {self.field.name} and value {self._raw_value}"
+            "Initialized EmailRowValue with field %s and value %s",
+            self.field.name,
+            self._raw_value,
         )
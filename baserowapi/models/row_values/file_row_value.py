@@ -1,10 +1,10 @@
-from typing import Optional, List, Any
+from typing import Callable, Optional, List, Any
 import logging
 import os
-import requests
 from baserowapi.models.fields import FileField
 from baserowapi.models.row_values.row_value import RowValue
 from baserowapi.exceptions import InvalidRowValueError, RowValueOperationError
+from baserowapi.multipart import StreamSource
 
 
 class FileRowValue(RowValue):
@@ -34,11 +34,18 @@ class FileRowValue(RowValue):
         file_path: Optional[str] = None,
         url: Optional[str] = None,
         replace: bool = False,
+        max_workers: int = 4,
+        retries: int = 2,
+        stream: Optional[StreamSource] = None,
+        file_name: Optional[str] = None,
+        progress: Optional[Callable[[int, Optional[int]], None]] = None,
     ) -> List[Any]:
         """
-        Upload a file or files to Baserow either from a local path or by downloading it from a provided URL.
+        Upload a file or files to Baserow from a local path, a stream, or by downloading it from a provided URL.
         The method either appends or replaces the current value based on the 'replace' flag.
 
+        The files of a directory are uploaded in parallel over the pooled connections of the client.
+
         Note: This function updates the in-memory representation of the row value.
         Use `row.update()` to save the updated value to the server.
 
@@ -46,14 +53,25 @@ class FileRowValue(RowValue):
         :param url: The URL of the file to download and upload. Defaults to None.
         :param replace: If True, replaces the current value with the uploaded file's data.
                         Otherwise, appends. Defaults to False.
+        :param max_workers: The maximum number of concurrent uploads. Defaults to 4.
+        :param retries: How often to retry a file after a connection error or a transient
+                        server error. Defaults to 2.
+        :param stream: A file object, bytes, or an iterable of bytes chunks to upload. The content
+                       is streamed without being loaded into memory. Defaults to None.
+        :param file_name: The file name of the uploaded stream. Defaults to the name of the
+                          file object, or 'upload'.
+        :param progress: Called with the number of bytes sent so far and the total size, or None
+                         if unknown, while the stream is uploaded. Defaults to None.
         :return: A list of file object representations returned by Baserow.
-        :raises InvalidRowValueError: If neither file_path nor url is provided.
-        :raises RowValueOperationError: If there's an error during the upload process.
+        :raises InvalidRowValueError: If neither file_path, stream nor url is provided.
+        :raises RowValueOperationError: If there's an error during the upload process. The in-memory
+                                        value is left unchanged in this case.
         """
-        if not file_path and not url:
-            raise InvalidRowValueError("Either file_path or url must be provided.")
+        if not file_path and stream is None and not url:
+            raise InvalidRowValueError(
+                "Either file_path, stream or url must be provided."
+            )
 
-        endpoint_file = "/api/user-files/upload-file/"
         endpoint_url = "/api/user-files/upload-via-url/"
         uploaded_files = []
 
@@ -66,17 +84,29 @@ class FileRowValue(RowValue):
             else:
                 files_to_upload = [file_path]
 
-            for file in files_to_upload:
-                try:
-                    with open(file, "rb") as f:
-                        response = self.client.make_api_request(
-                            endpoint_file, method="POST", files={"file": f}
-                        )
-                        uploaded_files.append(response)
-                except Exception as e:
-                    error_message = f"Failed to upload file {file}. Error: {e}"
-                    self.logger.error(error_message)
-                    raise RowValueOperationError(error_message)
+            result = self.client.upload_files(
+                files_to_upload, max_workers=max_workers, retries=retries
+            )
+            if result.failures:
+                error_message = "; ".join(
+                    f"Failed to upload file {failure.item}. Error: {failure.error}"
+                    for failure in result.failures
+                )
+                self.logger.error(error_message)
+                raise RowValueOperationError(error_message)
+            uploaded_files.extend(result.succeeded)
+
+        # Upload a stream
+        if stream is not None:
+            try:
+                uploaded_files.append(
+                    self.client.upload_file(
+                        stream, retries=retries, file_name=file_name, progress=progress
+                    )
+                )
+            except Exception as e:
+                self.logger.error(f"Failed to upload stream. Error: {e}")
+                raise RowValueOperationError(f"Failed to upload stream. Error: {e}")
 
         # Upload file from URL
         if url:
@@ -96,65 +126,55 @@ class FileRowValue(RowValue):
         if replace:
             self.value = uploaded_files
         else:
-            self.value.extend(uploaded_files)
+            self.value = self.value + uploaded_files
 
         return uploaded_files
 
-    def download_files(self, directory_path: str) -> List[str]:
+    def download_files(
+        self,
+        directory_path: str,
+        max_workers: int = 4,
+        cache_dir: Optional[str] = None,
+        overwrite: bool = False,
+    ) -> List[str]:
         """
         Downloads all file objects in the FileRowValue to the specified directory.
 
+        Files are downloaded in parallel over the pooled connections of the client. Interrupted
+        downloads are resumed, and every file is checked against its size and SHA-256 hash.
+        Files that already exist with the same content are not downloaded again. Existing files
+        with different content are skipped with a warning, unless overwrite is True.
+
         :param directory_path: The path to the directory where the files should be downloaded.
+        :param max_workers: The maximum number of concurrent downloads. Defaults to 4.
+        :param cache_dir: A directory of previously downloaded files, stored by their Baserow name.
+                          Defaults to None.
+        :param overwrite: If True, existing files with different content are replaced. Defaults
+                          to False.
         :return: List of filenames that were successfully downloaded.
         :raises RowValueOperationError: If there's an error during the download process.
         """
-        logger = logging.getLogger(__name__)
-        downloaded_files = []
-
-        # Ensure the target directory exists
-        os.makedirs(directory_path, exist_ok=True)
-
-        for file_obj in self._raw_value:
-            file_url = file_obj["url"]
-            file_name = file_obj["visible_name"]  # use file_obj["name"] for uniqueness?
-            target_file_path = os.path.join(directory_path, file_name)
-
-            # Check if the file already exists in the target directory
-            if os.path.exists(target_file_path):
-                logger.warning(
-                    f"File {file_name} already exists in {directory_path}. Skipping download."
-                )
-                continue
-
-            try:
-                # Download the file
-                response = requests.get(file_url, stream=True)
-                response.raise_for_status()
-
-                # Save the downloaded file to the target directory
-                with open(target_file_path, "wb") as out_file:
-                    for chunk in response.iter_content(chunk_size=8192):
-                        out_file.write(chunk)
-
-                # Optional: Verify file size or integrity after download
-                if os.path.getsize(target_file_path) != file_obj["size"]:
-                    raise RowValueOperationError(
-                        f"Downloaded file {file_name} is incomplete or corrupted."
-                    )
-
-                logger.debug(
-                    f"File {file_name} downloaded successfully to {directory_path}."
-                )
-                downloaded_files.append(file_name)
-
-            except requests.RequestException as e:
-                logger.error(
-                    f"Failed to download file {file_name} from {file_url}. Error: {e}"
-                )
-                if os.path.exists(target_file_path):
-                    os.remove(target_file_path)  # Remove partial file if error occurs
-                raise RowValueOperationError(
-                    f"Failed to download file {file_name}. Error: {e}"
+        result = self.client.download_files(
+            self._raw_value,
+            directory_path,
+            max_workers=max_workers,
+            cache_dir=cache_dir,
+            overwrite=overwrite,
+        )
+        failures = []
+        for failure in result.failures:
+            if isinstance(failure.error, FileExistsError):
+                self.logger.warning(
+                    f"File {failure.item.get('visible_name')} already exists in {directory_path}. Skipping download."
                 )
+            else:
+                failures.append(failure)
+        if failures:
+            error_message = "; ".join(
+                f"Failed to download file {failure.item.get('visible_name')}. Error: {failure.error}"
+                for failure in failures
+            )
+            self.logger.error(error_message)
+            raise RowValueOperationError(error_message)
 
-        return downloaded_files
\ No newline at end of file
+        return [os.path.basename(path) for path in result.succeeded]
@@ -34,5 +34,7 @@ class LongTextRowValue(RowValue):
                 f"The provided field is not an instance of the LongTextField class. Received: {type(field).__name__}"
             )
         self.logger.debug(
-            f"Initialized LongTextRowValue with field {self.field.name} and value {self._raw_value}"
+            "Initialized LongTextRowValue with field %s and value %s",
+            self.field.name,
+            self._raw_value,
         )
@@ -34,7 +34,9 @@ class NumberRowValue(RowValue):
                 f"The provided field is not an instance of the NumberField class. Received: {type(field).__name__}"
             )
         self.logger.debug(
-            f"Initialized NumberRowValue with field {self.field.name} and value {self._raw_value}"
+            "Initialized NumberRowValue with field %s and value %s",
+            self.field.name,
+            self._raw_value,
         )
 
     @property
@@ -60,7 +62,9 @@ class NumberRowValue(RowValue):
             numeric_value = float(new_value)
             self.field.validate_value(numeric_value)
             self._raw_value = new_value
-            self.logger.debug(f"Set new value {new_value} for field {self.field.name}")
+            self.logger.debug(
+                "Set new value %s for field %s", new_value, self.field.name
+            )
         except Exception as e:
             self.logger.error(
                 f"Failed to set value for field {self.field.name}. Error: {e}"
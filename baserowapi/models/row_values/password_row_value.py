@@ -44,7 +44,7 @@ class PasswordRowValue(RowValue):
             self.field.validate_value(new_value)
             self._raw_value = new_value
             self._password_set = new_value is not None
-            self.logger.debug(f"Set new password value for field {self.field.name}")
+            self.logger.debug("Set new password value for field %s", self.field.name)
         except Exception as e:
             self.logger.error(
                 f"Failed to set password value for field {self.field.name}. Error: {e}"
@@ -14,6 +14,8 @@ class RowValue:
         logger (logging.Logger): Logger instance for the class.
     """
 
+    logger: logging.Logger = logging.getLogger(__name__)
+
     def __init__(
         self,
         field: "Field",
@@ -36,9 +38,10 @@ class RowValue:
         self.field = field
         self._raw_value = raw_value
         self.client = client
-        self.logger = logging.getLogger(__name__)
         self.logger.debug(
-            f"Initialized RowValue with field {self.field.name} and value {self._raw_value}"
+            "Initialized RowValue with field %s and value %s",
+            self.field.name,
+            self._raw_value,
         )
 
     def __repr__(self) -> str:
@@ -75,7 +78,9 @@ class RowValue:
             self._raw_value = (
                 new_value  # Child classes can transform this value before setting
             )
-            self.logger.debug(f"Set new value {new_value} for field {self.field.name}")
+            self.logger.debug(
+                "Set new value %s for field %s", new_value, self.field.name
+            )
         except Exception as e:
             self.logger.error(
                 f"Failed to set value for field {self.field.name}. Error: {e}"
@@ -84,6 +89,16 @@ class RowValue:
                 f"Failed to set value for field {self.field.name}. Error: {e}"
             )
 
+    @property
+    def native_value(self) -> Any:
+        """
+        Get the value converted to a native Python type, e.g. int or Decimal for numbers and
+        datetime for dates, using the converter of the associated field.
+
+        :return: The native value.
+        """
+        return self.field.native_converter(self._raw_value)
+
     def format_for_api(self) -> Any:
         """
         Format the value for API submission by delegating to the associated Field's format_for_api method.
@@ -1,4 +1,4 @@
-from typing import Union, List, Any, Optional
+from typing import Union, List, Any, Optional, Dict, Iterable, Callable
 from baserowapi.models.row_values.row_value import RowValue
 
 
@@ -6,20 +6,51 @@ class RowValueList:
     """
     A list-like container for RowValue objects.
 
+    When created with field names and a factory, the RowValue of a field is only built the
+    first time it is requested and cached afterwards, so reading a few fields of a wide row
+    does not build the others. Iterating builds every RowValue in field order.
+
     :ivar row_values: A list of RowValue objects.
     :vartype row_values: List[RowValue]
     """
 
-    def __init__(self, row_values: Union[List["RowValue"], None] = None) -> None:
+    def __init__(
+        self,
+        row_values: Union[List["RowValue"], None] = None,
+        names: Optional[Iterable[str]] = None,
+        factory: Optional[Callable[[str], "RowValue"]] = None,
+    ) -> None:
         """
         Initializes a RowValueList instance.
 
         :param row_values: A list of RowValue objects. Defaults to an empty list if not provided.
         :type row_values: Union[List[RowValue], None], optional
-        """
-        self.row_values = row_values if row_values else []
+        :param names: The names of fields whose RowValue objects are built on first access.
+        :type names: Iterable[str], optional
+        :param factory: Builds the RowValue object of a field from its name. Required with names.
+        :type factory: Callable[[str], RowValue], optional
+        :raises ValueError: If names are given without a factory.
+        """
+        if names is not None and factory is None:
+            raise ValueError("A factory is required to build RowValues lazily.")
+        self._cells: Dict[str, Optional["RowValue"]] = {}
+        for row_value in row_values or []:
+            self._cells[row_value.field.name] = row_value
+        for name in names or []:
+            self._cells.setdefault(name, None)
+        self._factory = factory
         self._fields: Optional[List[str]] = None 
 
+    @property
+    def row_values(self) -> List["RowValue"]:
+        """
+        All RowValue objects in the list, building the ones not accessed yet.
+
+        :return: A list of RowValue objects.
+        :rtype: List[RowValue]
+        """
+        return [self[name] for name in self._cells]
+
     def __repr__(self) -> str:
         """
         Provides a string representation of the RowValueList object.
@@ -28,13 +59,13 @@ class RowValueList:
         :rtype: str
         """
         max_values_to_show = 5
-        value_names = [value.field.name for value in self.row_values]
+        value_names = list(self._cells)
 
         if len(value_names) > max_values_to_show:
             value_names = value_names[:max_values_to_show] + ["..."]
 
         values_str = ", ".join(value_names)
-        return f"RowValueList({len(self.row_values)} values: [{values_str}])"
+        return f"RowValueList({len(self._cells)} values: [{values_str}])"
 
     def __getitem__(self, field_name: str) -> "RowValue":
         """
@@ -46,14 +77,18 @@ class RowValueList:
         :return: The found RowValue object.
         :rtype: RowValue
         """
-        for value in self.row_values:
-            if value.field.name == field_name:
-                return value
-        raise KeyError(f"RowValue with field name '{field_name}' not found.")
+        try:
+            value = self._cells[field_name]
+        except KeyError:
+            raise KeyError(f"RowValue with field name '{field_name}' not found.")
+        if value is None:
+            value = self._factory(field_name)
+            self._cells[field_name] = value
+        return value
 
     def __iter__(self):
         """
-        Allows iteration over the RowValue objects in the list.
+        Allows iteration over the RowValue objects in the list, building the ones not accessed yet.
 
         :return: An iterator over the RowValue objects.
         :rtype: Iterator[RowValue]
@@ -67,7 +102,7 @@ class RowValueList:
         :return: The number of RowValue objects.
         :rtype: int
         """
-        return len(self.row_values)
+        return len(self._cells)
 
     def __contains__(self, field_name: str) -> bool:
         """
@@ -78,11 +113,11 @@ class RowValueList:
         :return: True if a RowValue with the field name exists, False otherwise.
         :rtype: bool
         """
-        return any(value.field.name == field_name for value in self.row_values)
+        return field_name in self._cells
 
     def add(self, row_value: "RowValue") -> None:
         """
-        Add a RowValue object to the list.
+        Add a RowValue object to the list, replacing the one of the same field if present.
 
         :param row_value: The RowValue object to be added.
         :type row_value: RowValue
@@ -93,9 +128,20 @@ class RowValueList:
                 "The provided object is not an instance of the RowValue class."
             )
 
-        self.row_values.append(row_value)
+        self._cells[row_value.field.name] = row_value
         self._fields = None  # Invalidate the cached fields when a new value is added
 
+    def is_built(self, field_name: str) -> bool:
+        """
+        Check if the RowValue object of a field was already built.
+
+        :param field_name: The name of the field to check.
+        :type field_name: str
+        :return: True if the RowValue object exists, False if it is built on first access.
+        :rtype: bool
+        """
+        return self._cells.get(field_name) is not None
+
     @property
     def fields(self) -> List[str]:
         """
@@ -105,5 +151,5 @@ class RowValueList:
         :rtype: List[str]
         """
         if self._fields is None:
-            self._fields = [value.field.name for value in self.row_values]
+            self._fields = list(self._cells)
         return self._fields
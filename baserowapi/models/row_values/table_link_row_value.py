@@ -1,8 +1,11 @@
-from typing import Optional, Union, List, Any
+from typing import TYPE_CHECKING, Optional, Union, List, Any
 from baserowapi.models.fields import TableLinkField
 from baserowapi.models.row_values.row_value import RowValue
 from baserowapi.exceptions import InvalidRowValueError, FieldValidationError
 
+if TYPE_CHECKING:
+    from baserowapi.models.row import Row
+
 
 class TableLinkRowValue(RowValue):
     """
@@ -25,6 +28,35 @@ class TableLinkRowValue(RowValue):
             raise InvalidRowValueError(
                 f"The provided field is not an instance of the TableLinkField class. Received: {type(field).__name__}"
             )
+        self._linked_rows: Optional[List["Row"]] = None
+
+    @property
+    def linked_rows(self) -> List["Row"]:
+        """
+        Get the linked rows as Row objects of the linked table.
+
+        The rows are available if the row was fetched with this field in `expand`. Linked rows
+        that could not be fetched are left out.
+
+        :return: The linked rows, in the order of the link.
+        :rtype: List[Row]
+        :raises InvalidRowValueError: If the links of this value were not expanded.
+        """
+        if self._linked_rows is None:
+            raise InvalidRowValueError(
+                f"The links of field '{self.name}' were not expanded. Fetch the rows with expand=['{self.name}']."
+            )
+        return self._linked_rows
+
+    @linked_rows.setter
+    def linked_rows(self, rows: List["Row"]) -> None:
+        """
+        Attach the resolved linked rows.
+
+        :param rows: The linked rows, in the order of the link.
+        :type rows: List[Row]
+        """
+        self._linked_rows = rows
 
     @property
     def value(self) -> List[Union[int, str]]:
@@ -56,6 +88,7 @@ class TableLinkRowValue(RowValue):
             raise InvalidRowValueError(f"Invalid value provided: {e}")
 
         # Format the value using the field's format_for_api method before assigning
+        self._linked_rows = None
         try:
             self._raw_value = [
                 {"value": val} for val in self.field.format_for_api(new_value)
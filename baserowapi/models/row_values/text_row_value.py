@@ -34,5 +34,7 @@ class TextRowValue(RowValue):
                 f"The provided field is not an instance of the TextField class. Received: {type(field).__name__}"
             )
         self.logger.debug(
-            f"Initialized TextRowValue with field {self.field.name} and value {self._raw_value}"
+            "Initialized TextRowValue with field %s and value %s",
+            self.field.name,
+            self._raw_value,
         )
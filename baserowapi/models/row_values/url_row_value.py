@@ -34,5 +34,7 @@ class UrlRowValue(RowValue):
                 f"The provided field is not an instance of the UrlField class. Received: {type(field).__name__}"
             )
         self.logger.debug(
-            f"Initialized UrlRowValue with field {self.field.name} and value {self._raw_value}"
+            "Initialized UrlRowValue with field %s and value %s",
+            self.field.name,
+            self._raw_value,
         )
@@ -0,0 +1,362 @@
+import atexit
+import json
+import logging
+import os
+import threading
+import time
+from collections import deque
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    Callable,
+    Deque,
+    Dict,
+    List,
+    Optional,
+    Tuple,
+    Union,
+)
+
+from baserowapi.exceptions import RowAddError
+
+if TYPE_CHECKING:
+    from baserowapi.models.table import Table
+
+
+class RowWriter:
+    """
+    Buffers rows appended from any thread and adds them to a table in batches from a background thread.
+
+    `append` only validates the row and puts it into the buffer, so callers never wait for the
+    server. A batch is sent as soon as ``max_batch`` rows are pending or the oldest pending row
+    has waited ``max_latency_ms``. Rows rejected by the server are isolated by bisecting the
+    batch and reported to ``on_error``; the other rows of the batch are still added.
+
+    With a ``spool_path``, every appended row is first written to a local write-ahead file and
+    only marked as done once Baserow accepted it. If the server cannot be reached, the batch is
+    kept and retried with exponential backoff, and rows still pending when the process stops
+    are sent again by the next writer opened on the same file. Without a spool, batches that
+    fail for such reasons are reported to ``on_error`` and dropped.
+
+    The writer is flushed when it is closed, when its context ends and at interpreter exit.
+
+    :ivar table: The table the rows are added to.
+    :vartype table: Table
+    :ivar max_batch: The maximum number of rows per request.
+    :vartype max_batch: int
+    :ivar max_latency: The maximum number of seconds a row waits before its batch is sent.
+    :vartype max_latency: float
+    :ivar written: The number of rows added to the table.
+    :vartype written: int
+    :ivar failed: The number of rows reported to on_error and dropped.
+    :vartype failed: int
+    """
+
+    MAX_RETRY_DELAY = 60.0
+
+    def __init__(
+        self,
+        table: "Table",
+        max_batch: int = 200,
+        max_latency_ms: float = 500,
+        on_error: Optional[Callable[[List[Dict[str, Any]], Exception], None]] = None,
+        spool_path: Optional[Union[str, os.PathLike]] = None,
+        fsync: bool = False,
+    ) -> None:
+        """
+        Initialize a RowWriter and start its background thread.
+
+        :param table: The table the rows are added to.
+        :type table: Table
+        :param max_batch: The maximum number of rows per request. Defaults to 200.
+        :type max_batch: int
+        :param max_latency_ms: The maximum number of milliseconds a row waits before its batch
+                               is sent. Defaults to 500.
+        :type max_latency_ms: float
+        :param on_error: Called from the background thread with the rows that could not be
+                         added and the error. Defaults to logging the error.
+        :type on_error: Callable[[list[dict[str, Any]], Exception], None], optional
+        :param spool_path: The path of a write-ahead file keeping pending rows across failures
+                           and restarts. Rows pending in an existing file are sent first.
+        :type spool_path: str or os.PathLike, optional
+        :param fsync: If True, every appended row is flushed to disk before append returns.
+                      Only used with a spool. Defaults to False.
+        :type fsync: bool, optional
+        :raises ValueError: If max_batch is not positive.
+        """
+        if max_batch < 1:
+            raise ValueError("'max_batch' must be a positive integer.")
+        self.table = table
+        self.max_batch = max_batch
+        self.max_latency = max_latency_ms / 1000
+        self.on_error = on_error
+        self.fsync = fsync
+        self.written = 0
+        self.failed = 0
+        self.logger = logging.getLogger(__name__)
+
+        self._buffer: Deque[Tuple[int, float, Dict[str, Any]]] = deque()
+        self._condition = threading.Condition()
+        self._in_flight = 0
+        self._flushing = 0
+        self._closed = False
+        self._seq = 0
+        self._retry_at = 0.0
+        self._retry_delay = self.max_latency
+
+        self.spool_path = os.fspath(spool_path) if spool_path is not None else None
+        self._spool = None
+        if self.spool_path is not None:
+            self._open_spool()
+
+        self._thread = threading.Thread(
+            target=self._run, name=f"RowWriter-{table.id}", daemon=True
+        )
+        self._thread.start()
+        atexit.register(self.close)
+
+    def __repr__(self) -> str:
+        """
+        Provide a string representation of the RowWriter.
+
+        :return: A string including the table and the number of pending rows.
+        :rtype: str
+        """
+        return f"RowWriter(table={self.table.id}, pending={self.pending}, written={self.written})"
+
+    def __enter__(self) -> "RowWriter":
+        return self
+
+    def __exit__(self, exc_type: Any, exc_value: Any, traceback: Any) -> None:
+        self.close()
+
+    @property
+    def pending(self) -> int:
+        """
+        The number of appended rows that were not added or dropped yet.
+
+        :return: The number of pending rows.
+        :rtype: int
+        """
+        with self._condition:
+            return len(self._buffer) + self._in_flight
+
+    def _open_spool(self) -> None:
+        """
+        Load the rows left pending in the spool file and rewrite it with only those rows.
+        """
+        pending: Dict[int, Dict[str, Any]] = {}
+        acked = 0
+        if os.path.exists(self.spool_path):
+            with open(self.spool_path, "rb") as f:
+                for line in f:
+                    try:
+                        if not line.endswith(b"\n"):
+                            raise ValueError("Incomplete line.")
+                        record = json.loads(line)
+                    except ValueError:
+                        self.logger.warning(
+                            "Discarding incomplete record in spool file %s.",
+                            self.spool_path,
+                        )
+                        break
+                    if "ack" in record:
+                        acked = max(acked, record["ack"])
+                    else:
+                        pending[record["seq"]] = record["row"]
+
+        now = time.monotonic()
+        temporary_path = f"{self.spool_path}.tmp"
+        with open(temporary_path, "w", encoding="utf-8") as f:
+            for seq in sorted(pending):
+                if seq > acked:
+                    self._buffer.append((seq, now, pending[seq]))
+                    f.write(json.dumps({"seq": seq, "row": pending[seq]}) + "\n")
+                self._seq = max(self._seq, seq)
+        os.replace(temporary_path, self.spool_path)
+        self._spool = open(self.spool_path, "a", encoding="utf-8")
+        if self._buffer:
+            self.logger.info(
+                "Resuming %d pending row(s) from spool file %s.",
+                len(self._buffer),
+                self.spool_path,
+            )
+
+    def _write_spool(self, record: Dict[str, Any]) -> None:
+        self._spool.write(json.dumps(record, default=str) + "\n")
+        self._spool.flush()
+        if self.fsync:
+            os.fsync(self._spool.fileno())
+
+    def append(self, row: Dict[str, Any]) -> None:
+        """
+        Queue a row to be added to the table.
+
+        :param row: A dictionary of field names and values.
+        :type row: dict[str, Any]
+        :raises RowAddError: If a field is not writable or does not exist in the table.
+        :raises RuntimeError: If the writer is closed.
+        """
+        for field_name in row.keys():
+            if field_name not in self.table.writable_fields:
+                error_message = f"Field '{field_name}' is not writable or does not exist in the table."
+                self.logger.error(error_message)
+                raise RowAddError(error_message)
+
+        with self._condition:
+            if self._closed:
+                raise RuntimeError("The writer is closed.")
+            self._seq += 1
+            if self._spool is not None:
+                self._write_spool({"seq": self._seq, "row": row})
+            self._buffer.append((self._seq, time.monotonic(), row))
+            if len(self._buffer) >= self.max_batch or len(self._buffer) == 1:
+                self._condition.notify_all()
+
+    def extend(self, rows: List[Dict[str, Any]]) -> None:
+        """
+        Queue several rows to be added to the table.
+
+        :param rows: Dictionaries of field names and values.
+        :type rows: list[dict[str, Any]]
+        :raises RowAddError: If a field is not writable or does not exist in the table.
+        :raises RuntimeError: If the writer is closed.
+        """
+        for row in rows:
+            self.append(row)
+
+    def flush(self, timeout: Optional[float] = None) -> bool:
+        """
+        Send all pending rows now and wait until they were handled.
+
+        :param timeout: The maximum number of seconds to wait. Defaults to None, which waits
+                        until all rows were handled.
+        :type timeout: float, optional
+        :return: True if no rows are pending anymore. False if the timeout expired or, with a
+                 spool, sending failed and the rows are kept for a retry.
+        :rtype: bool
+        """
+        deadline = None if timeout is None else time.monotonic() + timeout
+        with self._condition:
+            self._flushing += 1
+            self._condition.notify_all()
+            try:
+                while self._buffer or self._in_flight:
+                    now = time.monotonic()
+                    if self._retry_at > now and not self._in_flight:
+                        return False
+                    if deadline is not None and now >= deadline:
+                        return False
+                    self._condition.wait(None if deadline is None else deadline - now)
+                return True
+            finally:
+                self._flushing -= 1
+
+    def close(self, timeout: Optional[float] = None) -> None:
+        """
+        Flush the pending rows and stop the background thread.
+
+        With a spool, rows that could not be sent stay in the spool file for the next writer.
+
+        :param timeout: The maximum number of seconds to wait for the flush. Defaults to None.
+        :type timeout: float, optional
+        """
+        with self._condition:
+            if self._closed:
+                return
+        self.flush(timeout)
+        with self._condition:
+            self._closed = True
+            self._condition.notify_all()
+        self._thread.join(timeout)
+        atexit.unregister(self.close)
+        if self._spool is not None:
+            self._spool.close()
+
+    def _run(self) -> None:
+        """
+        Take batches from the buffer whenever a size or time threshold is reached and send them.
+        """
+        while True:
+            with self._condition:
+                while True:
+                    now = time.monotonic()
+                    if self._closed and (not self._buffer or self._retry_at > now):
+                        return
+                    if not self._buffer:
+                        timeout = None
+                    elif self._retry_at > now:
+                        timeout = self._retry_at - now
+                    else:
+                        due = self._buffer[0][1] + self.max_latency
+                        if (
+                            len(self._buffer) >= self.max_batch
+                            or self._flushing
+                            or self._closed
+                            or now >= due
+                        ):
+                            break
+                        timeout = due - now
+                    self._condition.wait(timeout)
+
+                size = min(self.max_batch, len(self._buffer))
+                batch = [self._buffer.popleft() for _ in range(size)]
+                self._in_flight = size
+            self._send(batch)
+
+    def _send(self, batch: List[Tuple[int, float, Dict[str, Any]]]) -> None:
+        """
+        Add a batch to the table and record the outcome.
+        """
+        rows = [row for _, _, row in batch]
+        error = None
+        rejected = []
+        try:
+            result = self.table.add_rows(
+                rows, batch_size=len(rows), on_error="bisect", returning="none"
+            )
+            rejected = result.failures
+        except Exception as e:
+            error = e
+
+        with self._condition:
+            self._in_flight = 0
+            if error is not None and self._spool is not None:
+                # Keep the rows in order and retry them later
+                self._buffer.extendleft(reversed(batch))
+                self._retry_at = time.monotonic() + self._retry_delay
+                self._retry_delay = min(2 * self._retry_delay, self.MAX_RETRY_DELAY)
+            else:
+                self._retry_at = 0.0
+                self._retry_delay = self.max_latency
+                dropped = len(rows) if error is not None else len(rejected)
+                self.failed += dropped
+                self.written += len(rows) - dropped
+                if self._spool is not None:
+                    self._write_spool({"ack": batch[-1][0]})
+                    if not self._buffer:
+                        self._spool.seek(0)
+                        self._spool.truncate()
+            self._condition.notify_all()
+
+        if error is not None:
+            self._report(rows, error)
+        for failure in rejected:
+            self._report([failure.item], failure.error)
+
+    def _report(self, rows: List[Dict[str, Any]], error: Exception) -> None:
+        """
+        Hand rows that could not be added to the error callback.
+        """
+        if self.on_error is None:
+            self.logger.error(
+                "Failed to add %d row(s) to table %s: %s",
+                len(rows),
+                self.table.id,
+                error,
+            )
+            return
+        try:
+            self.on_error(rows, error)
+        except Exception:
+            self.logger.exception("The on_error callback of the RowWriter failed.")
@@ -1,7 +1,34 @@
-from typing import TYPE_CHECKING, List, Union, Optional, Dict, Any, Generator
-from baserowapi.exceptions import RowFetchError, RowAddError, RowUpdateError, RowDeleteError
+from typing import (
+    TYPE_CHECKING,
+    List,
+    Union,
+    Optional,
+    Dict,
+    Any,
+    Generator,
+    Callable,
+    Tuple,
+    Iterable,
+    Iterator,
+    Deque,
+    MutableMapping,
+)
+from baserowapi.exceptions import (
+    BaserowHTTPError,
+    RowFetchError,
+    RowAddError,
+    RowUpdateError,
+    RowDeleteError,
+    RowMoveError,
+)
+from baserowapi.models.aggregation import Aggregation
+from baserowapi.models.batch_result import BatchResult, BatchFailure
+from baserowapi.models.checkpoint import Checkpoint, as_checkpoint
+from baserowapi.models.expression import Expression
 from baserowapi.models.filter import Filter
+from baserowapi.models.projection import Projection
 from baserowapi.models.row import Row
+from baserowapi.models.row_writer import RowWriter
 from baserowapi.models.fields import (
     FieldList,
     TextField,
@@ -29,6 +56,14 @@ from baserowapi.models.fields import (
 import logging
 import urllib.parse
 import json
+import bisect
+import hashlib
+import itertools
+import queue
+import threading
+from collections import OrderedDict, deque
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor
+from decimal import Decimal, InvalidOperation
 
 if TYPE_CHECKING:
     from baserowapi import Baserow
@@ -63,6 +98,22 @@ class Table:
         PasswordField.TYPE: PasswordField,
     }
 
+    # HTTP status codes caused by the content of a batch, which bisection can narrow down.
+    BISECT_STATUS_CODES = (400, 404, 413)
+
+    # Representations of written rows returned by the write operations.
+    RETURNING = ("rows", "ids", "raw", "none")
+
+    # Value types of fetched rows: as returned by the API, or converted to native Python types.
+    TYPES = ("api", "native")
+
+    # Longest encoded filter tree per request when rows are fetched by many ids or values,
+    # which keeps the request URLs below the limits of common servers and proxies.
+    MAX_FILTER_LENGTH = 4000
+
+    # Most rows whose written values are remembered per Table instance for skip_unchanged.
+    MAX_ROW_DIGESTS = 100000
+
     def __init__(self, table_id: int, client: "Baserow"):
         """
         Initialize a Table object.
@@ -74,8 +125,10 @@ class Table:
         self.client = client
         self._fields = None
         self._primary_field = None
+        self._row_digests: "OrderedDict[str, Dict[str, str]]" = OrderedDict()
+        self._digest_lock = threading.Lock()
         self.logger = logging.getLogger(__name__)
-        self.logger.debug(f"Initialized Table id {self.id}")
+        self.logger.debug("Initialized Table id %s", self.id)
 
     def __repr__(self) -> str:
         """
@@ -216,6 +269,7 @@ class Table:
         filters: Optional[List[Filter]] = None,
         view_id: Optional[int] = None,
         size: Optional[int] = None,
+        filter_tree: Optional[Dict[str, Any]] = None,
         **kwargs: Any,
     ) -> str:
         """
@@ -237,6 +291,8 @@ class Table:
         :type view_id: int, optional
         :param size: The number of rows per page in the response.
         :type size: int, optional
+        :param filter_tree: A prebuilt filter tree, used instead of filters and filter_type.
+        :type filter_tree: dict[str, Any], optional
         :param kwargs: Additional parameters for the API request.
         :type kwargs: Any
 
@@ -255,17 +311,19 @@ class Table:
         self._append_query_param(query_params_parts, "view_id", view_id)
         self._append_query_param(query_params_parts, "size", size)
 
-        if filters:
+        if filter_tree is None and filters:
             filter_type = filter_type or "AND"
             if filter_type not in ["AND", "OR"]:
                 raise ValueError("'filter_type' should be either 'AND' or 'OR'")
             filter_tree = self._construct_filter_tree(filters, filter_type)
+
+        if filter_tree is not None:
             filter_string = urllib.parse.quote(json.dumps(filter_tree))
             query_params_parts.append(f"filters={filter_string}")
 
         query_params = "&".join(query_params_parts)
         full_request_url = f"{base_url}&{query_params}" if query_params else base_url
-        self.logger.debug(f"Built request URL: '{full_request_url}'")
+        self.logger.debug("Built request URL: '%s'", full_request_url)
         return full_request_url
 
     def _append_query_param(
@@ -291,8 +349,38 @@ class Table:
                 encoded_value = urllib.parse.quote(str(param_value))
             params_list.append(f"{param_name}={encoded_value}")
 
+    @staticmethod
+    def _replace_include(request_url: str, include: List[str]) -> str:
+        """
+        Replace the 'include' query parameter of a request URL, e.g. of a 'next' page link.
+
+        :param request_url: The request URL.
+        :type request_url: str
+        :param include: The field names to include.
+        :type include: list[str]
+        :return: The request URL with only the given fields included.
+        :rtype: str
+        """
+        parts = urllib.parse.urlsplit(request_url)
+        query = [
+            (key, value)
+            for key, value in urllib.parse.parse_qsl(
+                parts.query, keep_blank_values=True
+            )
+            if key != "include"
+        ]
+        query.append(("include", ",".join(include)))
+        return urllib.parse.urlunsplit(
+            parts._replace(
+                query=urllib.parse.urlencode(query, quote_via=urllib.parse.quote)
+            )
+        )
+
     def _construct_filter_tree(
-        self, filters: List[Filter], filter_type: str
+        self,
+        filters: List[Filter],
+        filter_type: str,
+        groups: Optional[List[Dict[str, Any]]] = None,
     ) -> Dict[str, Any]:
         """
         Helper function to construct the filter tree for the request URL.
@@ -301,6 +389,8 @@ class Table:
         :type filters: list[Filter]
         :param filter_type: Type of filter (AND/OR).
         :type filter_type: str
+        :param groups: Nested filter trees combined with the filters using filter_type.
+        :type groups: list[dict[str, Any]], optional
         :return: Dictionary representing the filter tree.
         :rtype: dict[str, Any]
         """
@@ -308,7 +398,11 @@ class Table:
             {"field": f.field_name, "type": f.operator, "value": f.value}
             for f in filters
         ]
-        return {"filter_type": filter_type, "filters": filter_dicts, "groups": []}
+        return {
+            "filter_type": filter_type,
+            "filters": filter_dicts,
+            "groups": groups or [],
+        }
 
     def _parse_row_data(self, response_data: Dict[str, Any]) -> List[Row]:
         """
@@ -335,16 +429,56 @@ class Table:
         search: Optional[str] = None,
         order_by: Optional[List[str]] = None,
         filter_type: Optional[str] = None,
-        filters: Optional[List[Filter]] = None,
+        filters: Union[List[Filter], Expression, None] = None,
         view_id: Optional[int] = None,
         size: Optional[int] = None,
         limit: Optional[int] = None,
+        keyset: bool = False,
+        after_id: Optional[int] = None,
+        shards: Optional[int] = None,
+        checkpoint: Union[Checkpoint, str, Callable, None] = None,
+        auto_include: bool = False,
+        sample_size: Optional[int] = None,
+        expand: Union[List[str], Dict[str, Optional[List[str]]], None] = None,
+        types: str = "api",
         **kwargs: Any,
     ) -> Generator[Row, None, None]:
         """
         Generator function to retrieve rows from the table in a paginated manner,
         optionally limiting the number of rows returned.
 
+        By default the 'next' page links returned by the API are followed. With ``keyset``
+        enabled, rows are ordered by id and every page is requested with an id filter starting
+        after the last row of the previous page. This keeps deep pages fast and consistent while
+        rows are inserted during the crawl. A keyset crawl can be resumed from the id of the last
+        processed row with ``after_id``, and ``shards`` splits the id range into parts that are
+        fetched in parallel.
+
+        When a checkpoint is given, the cursor of every page is recorded once all of its rows have
+        been consumed, and a new generator with the same checkpoint continues after that page.
+
+        With ``auto_include`` enabled, the first pages are fetched with all fields and the fields
+        read from their rows with ``row[field_name]`` or ``row.to_dict()`` are recorded. The
+        remaining pages are requested with only those fields included. A later row that reads
+        another field loads it with an extra request, and the field is included from the next
+        page on. Fields that were not loaded cannot be changed on a projected row.
+
+        Filters can also be given as an `Expression` built with `F`, e.g.
+        ``(F("Age") > 30) & ((F("City") == "Berlin") | F("Name").matches("^A"))``. It is compiled
+        into nested Baserow filter groups. Conditions Baserow cannot evaluate are applied locally
+        to the fetched rows, so only the rows matching the whole expression are yielded.
+
+        The link fields named in ``expand`` are resolved page by page: the ids linked from all
+        rows of a page are fetched from the linked table with `get_rows_by_ids` and attached as
+        Row objects to the link values, available as ``row.values[field_name].linked_rows``.
+        Rows linked more than once are fetched once per generator. Dotted paths like
+        ``"Order.Customer"`` expand the links of the linked rows as well.
+
+        With ``types="native"``, ``row[field_name]`` and ``row.to_dict()`` return native Python
+        values as `Row.typed` does, e.g. int or Decimal for numbers, datetime for dates and lists
+        of ids for link fields. The converter of every field is chosen once and reused for all
+        rows. Values are still set in the API representation.
+
         :param include: A list of field names to include in the results.
         :type include: list[str], optional
         :param exclude: A list of field names to exclude from the results.
@@ -355,14 +489,36 @@ class Table:
         :type order_by: list[str], optional
         :param filter_type: The type of filter to be applied.
         :type filter_type: str, optional
-        :param filters: A list containing Filter objects to be applied.
-        :type filters: list[Filter], optional
+        :param filters: A list containing Filter objects, or an Expression, to be applied.
+        :type filters: Union[list[Filter], Expression], optional
         :param view_id: ID of the view to consider its filters and sorts.
         :type view_id: int, optional
         :param size: The number of rows per page in the response.
         :type size: int, optional
         :param limit: The maximum number of rows to return.
         :type limit: int, optional
+        :param keyset: If True, use keyset pagination ordered by row id instead of page offsets.
+        :type keyset: bool, optional
+        :param after_id: With keyset pagination, only fetch rows with an id higher than this.
+        :type after_id: int, optional
+        :param shards: With keyset pagination, the number of id ranges fetched in parallel.
+                       Rows from different shards are interleaved.
+        :type shards: int, optional
+        :param checkpoint: A Checkpoint, the path of a checkpoint file, or a callback receiving
+                       every checkpoint record. Cannot be combined with shards.
+        :type checkpoint: Union[Checkpoint, str, Callable], optional
+        :param auto_include: If True, learn the fields to include from the rows of a sample.
+                             Cannot be combined with include, exclude or shards.
+        :type auto_include: bool, optional
+        :param sample_size: With auto_include, the minimum number of rows in the sample. The
+                            sample always ends with a complete page. Defaults to one page.
+        :type sample_size: int, optional
+        :param expand: The link fields to resolve, as a list of field names or dotted paths, or
+                       as a dictionary mapping them to the fields to include for the linked rows.
+        :type expand: Union[list[str], dict[str, list[str]]], optional
+        :param types: One of `TYPES`. "api" (the default) returns values as the API does,
+                      "native" converts them to native Python types.
+        :type types: str, optional
         :param kwargs: Additional parameters for the API request.
         :type kwargs: dict
 
@@ -371,42 +527,441 @@ class Table:
         :raises RowFetchError: If any error occurs during the process.
         :raises ValueError: If parameters are not valid.
         """
-        request_url = self._build_request_url(
+        if types not in self.TYPES:
+            raise ValueError(
+                f"'types' should be one of {', '.join(map(repr, self.TYPES))}"
+            )
+        native = types == "native"
+        sharded = shards is not None and shards > 1
+        if sharded and not keyset:
+            raise ValueError("'shards' can only be used together with 'keyset=True'.")
+
+        projection = None
+        if auto_include:
+            if include or exclude or sharded:
+                raise ValueError(
+                    "'auto_include' cannot be combined with 'include', 'exclude' or 'shards'."
+                )
+            projection = Projection(sample_size or 1)
+
+        filter_tree, remainder = None, None
+        if isinstance(filters, Expression):
+            filter_tree, remainder = filters.compile(self)
+            filters = None
+        if remainder is not None:
+            # The fields of the local conditions have to be fetched to evaluate them
+            local_fields = remainder.field_names()
+            if include:
+                include = include + [n for n in local_fields if n not in include]
+            if exclude:
+                exclude = [n for n in exclude if n not in local_fields]
+            if projection is not None:
+                for name in local_fields:
+                    projection.record(name)
+
+        expand_tree = self._parse_expand(expand)
+        for name in expand_tree:
+            if not isinstance(self.fields[name], TableLinkField):
+                raise ValueError(f"Field '{name}' is not a link field.")
+            if include and name not in include:
+                include = include + [name]
+            if exclude:
+                exclude = [n for n in exclude if n != name]
+            if projection is not None:
+                projection.record(name)
+        expand_cache: Dict[str, Tuple["Table", Dict[int, Row]]] = {}
+
+        checkpoint = as_checkpoint(checkpoint)
+        cursor = None
+        if checkpoint is not None:
+            if sharded:
+                raise ValueError("'checkpoint' cannot be combined with 'shards'.")
+            checkpoint.begin("row_generator", table_id=self.id, keyset=keyset)
+            cursor = checkpoint.cursor
+
+        query_params = dict(
             include=include,
             exclude=exclude,
             search=search,
-            order_by=order_by,
             filter_type=filter_type,
             filters=filters,
+            filter_tree=filter_tree,
             view_id=view_id,
             size=size,
             **kwargs,
         )
 
-        yielded_rows = 0  # Tracks the number of rows yielded
+        if keyset:
+            if order_by:
+                raise ValueError(
+                    "Keyset pagination orders rows by id, 'order_by' cannot be used."
+                )
+            if cursor is not None:
+                after_id = cursor["after_id"]
+            if sharded:
+                pages = self._sharded_keyset_pages(query_params, after_id, shards)
+            else:
+                pages = self._keyset_pages(
+                    query_params, after_id, projection=projection
+                )
+        else:
+            if cursor is not None:
+                request_url = cursor["next"]
+            else:
+                request_url = self._build_request_url(order_by=order_by, **query_params)
+            pages = self._offset_pages(request_url, projection=projection)
 
-        while request_url:
-            self.logger.debug(f"Fetching data from URL: {request_url}")
-            try:
-                response_data = self.client.make_api_request(request_url)
-                rows = self._parse_row_data(response_data)
+        yielded_rows = 0  # Tracks the number of rows yielded
 
+        try:
+            for rows, page_cursor in pages:
+                if remainder is not None:
+                    rows = [row for row in rows if remainder.matches(row)]
+                if expand_tree:
+                    self._expand_links(rows, expand_tree, expand_cache)
                 for row in rows:
+                    if projection is not None:
+                        row._projection = projection
+                    if native:
+                        row._native = True
                     yield row
                     yielded_rows += 1
 
                     if limit and yielded_rows >= limit:
-                        self.logger.debug(f"Reached the limit of {limit} rows.")
+                        self.logger.debug("Reached the limit of %s rows.", limit)
                         return
 
-                request_url = response_data.get("next", None)
-                if request_url:
-                    self.logger.debug(f"Next page URL: {request_url}")
-                else:
-                    self.logger.debug("No more pages to fetch.")
+                if checkpoint is not None:
+                    checkpoint.cursor = page_cursor
+                if (
+                    projection is not None
+                    and not projection.frozen
+                    and yielded_rows >= projection.sample_size
+                ):
+                    projection.freeze(self.primary_field)
+        except Exception as e:
+            self.logger.error(f"Error fetching rows: {e}")
+            raise RowFetchError(f"Error fetching rows: {e}")
+        finally:
+            pages.close()
+
+    @staticmethod
+    def _parse_expand(
+        expand: Union[List[str], Dict[str, Optional[List[str]]], None],
+    ) -> Dict[str, tuple]:
+        """
+        Turn the expand argument into a tree of link fields.
+
+        :param expand: Field names or dotted paths, optionally mapped to the fields to include.
+        :type expand: Union[list[str], dict[str, list[str]]], optional
+        :return: A mapping from link field name to the fields to include for the linked rows,
+                 or None for all fields, and the subtree for the linked rows.
+        :rtype: dict[str, tuple[list[str], dict]]
+        """
+        if not expand:
+            return {}
+        paths = expand if isinstance(expand, dict) else dict.fromkeys(expand)
+
+        tree: Dict[str, tuple] = {}
+        for path, include in paths.items():
+            node = tree
+            names = path.split(".")
+            for depth, name in enumerate(names):
+                leaf_include = include if depth == len(names) - 1 else None
+                current_include, subtree = node.get(name, (None, {}))
+                node[name] = (leaf_include or current_include, subtree)
+                node = subtree
+        return tree
+
+    def _expand_links(
+        self,
+        rows: List[Row],
+        expand_tree: Dict[str, tuple],
+        cache: Dict[str, Tuple["Table", Dict[int, Row]]],
+        path: str = "",
+    ) -> None:
+        """
+        Fetch the rows linked from the given rows and attach them to their link values.
+
+        :param rows: The rows whose links are resolved.
+        :type rows: list[Row]
+        :param expand_tree: The link fields to resolve, as returned by `_parse_expand`.
+        :type expand_tree: dict[str, tuple]
+        :param cache: The linked table and the rows fetched from it so far, per expand path.
+        :type cache: dict[str, tuple[Table, dict[int, Row]]]
+        :param path: The expand path of the given rows.
+        :type path: str
+        :raises ValueError: If a field is not a link field.
+        """
+        for field_name, (include, subtree) in expand_tree.items():
+            field = self.fields[field_name]
+            if not isinstance(field, TableLinkField):
+                raise ValueError(f"Field '{field_name}' is not a link field.")
+            field_path = f"{path}.{field_name}" if path else field_name
+            if field_path not in cache:
+                cache[field_path] = (self.client.get_table(field.link_row_table_id), {})
+            target, loaded = cache[field_path]
+
+            wanted = {
+                entry["id"]: None
+                for row in rows
+                for entry in row._row_data.get(field_name) or []
+                if entry.get("id") not in loaded
+            }
+            if wanted:
+                if include:
+                    include = include + [
+                        name for name in subtree if name not in include
+                    ]
+                result = target.get_rows_by_ids(list(wanted), include=include)
+                if result.failures:
+                    self.logger.debug(
+                        "%s rows linked by '%s' could not be fetched.",
+                        len(result.failures),
+                        field_path,
+                    )
+                for linked_row in result.succeeded:
+                    loaded[linked_row.id] = linked_row
+                if subtree:
+                    target._expand_links(result.succeeded, subtree, cache, field_path)
+
+            for row in rows:
+                row.values[field_name].linked_rows = [
+                    loaded[entry["id"]]
+                    for entry in row._row_data.get(field_name) or []
+                    if entry.get("id") in loaded
+                ]
+
+    def _offset_pages(
+        self, request_url: Optional[str], projection: Optional[Projection] = None
+    ) -> Generator[tuple, None, None]:
+        """
+        Fetch pages of rows by following the 'next' links returned by the API.
+
+        :param request_url: The URL of the first page.
+        :type request_url: str, optional
+        :param projection: Once frozen, the fields of the projection are included in the
+                           requests for the following pages.
+        :type projection: Projection, optional
+        :yield: The rows of each page and the cursor to resume after it.
+        :rtype: Generator[tuple[list[Row], dict], None, None]
+        """
+        while request_url:
+            if projection is not None and projection.frozen:
+                request_url = self._replace_include(request_url, projection.include)
+            self.logger.debug("Fetching data from URL: %s", request_url)
+            response_data = self.client.make_api_request(request_url)
+            rows = self._parse_row_data(response_data)
+            request_url = response_data.get("next", None)
+            yield rows, {"next": request_url}
+
+            if request_url:
+                self.logger.debug("Next page URL: %s", request_url)
+            else:
+                self.logger.debug("No more pages to fetch.")
+
+    def _keyset_filter_tree(
+        self,
+        filters: Optional[List[Filter]],
+        filter_type: Optional[str],
+        lower_id: Optional[int],
+        upper_id: Optional[int] = None,
+        filter_tree: Optional[Dict[str, Any]] = None,
+    ) -> Optional[Dict[str, Any]]:
+        """
+        Construct a filter tree restricting rows to the id range (lower_id, upper_id].
+
+        The user supplied filters are nested as a group so that their filter type is preserved.
+
+        :param filters: The user supplied Filter objects.
+        :type filters: list[Filter], optional
+        :param filter_type: The type of the user supplied filters (AND/OR).
+        :type filter_type: str, optional
+        :param lower_id: Only rows with an id higher than this are included.
+        :type lower_id: int, optional
+        :param upper_id: Only rows with an id lower than or equal to this are included.
+        :type upper_id: int, optional
+        :param filter_tree: A prebuilt filter tree, nested as a group as well.
+        :type filter_tree: dict[str, Any], optional
+        :return: Dictionary representing the filter tree, or None if nothing is filtered.
+        :rtype: dict[str, Any], optional
+        """
+        range_filters = []
+        if lower_id is not None:
+            range_filters.append(Filter("id", lower_id, "higher_than"))
+        if upper_id is not None:
+            range_filters.append(Filter("id", upper_id, "lower_than_or_equal"))
+
+        groups = []
+        if filters:
+            filter_type = filter_type or "AND"
+            if filter_type not in ["AND", "OR"]:
+                raise ValueError("'filter_type' should be either 'AND' or 'OR'")
+            groups.append(self._construct_filter_tree(filters, filter_type))
+        if filter_tree is not None:
+            groups.append(filter_tree)
+
+        if not range_filters and not groups:
+            return None
+        return self._construct_filter_tree(range_filters, "AND", groups=groups)
+
+    def _keyset_pages(
+        self,
+        query_params: Dict[str, Any],
+        after_id: Optional[int] = None,
+        upper_id: Optional[int] = None,
+        projection: Optional[Projection] = None,
+    ) -> Generator[tuple, None, None]:
+        """
+        Fetch pages of rows ordered by id, requesting each page with an id filter
+        starting after the last id of the previous page.
+
+        :param query_params: Parameters passed on to `_build_request_url`.
+        :type query_params: dict[str, Any]
+        :param after_id: Only rows with an id higher than this are fetched.
+        :type after_id: int, optional
+        :param upper_id: Only rows with an id lower than or equal to this are fetched.
+        :type upper_id: int, optional
+        :param projection: Once frozen, the fields of the projection are included in the
+                           requests for the following pages.
+        :type projection: Projection, optional
+        :yield: The rows of each page and the cursor to resume after it.
+        :rtype: Generator[tuple[list[Row], dict], None, None]
+        """
+        params = dict(query_params)
+        filters = params.pop("filters", None)
+        filter_type = params.pop("filter_type", None)
+        base_tree = params.pop("filter_tree", None)
+        last_id = after_id
+
+        while True:
+            filter_tree = self._keyset_filter_tree(
+                filters, filter_type, last_id, upper_id, filter_tree=base_tree
+            )
+            if projection is not None and projection.frozen:
+                params["include"] = projection.include
+            request_url = self._build_request_url(
+                order_by=["id"], filter_tree=filter_tree, **params
+            )
+            self.logger.debug("Fetching keyset page from URL: %s", request_url)
+            response_data = self.client.make_api_request(request_url)
+            rows = self._parse_row_data(response_data)
+            if rows:
+                last_id = rows[-1].id
+                yield rows, {"after_id": last_id}
+
+            if not rows or not response_data.get("next"):
+                self.logger.debug("No more pages to fetch.")
+                return
+
+    def _keyset_bounds(
+        self, query_params: Dict[str, Any], after_id: Optional[int] = None
+    ) -> Optional[tuple]:
+        """
+        Determine the lowest and highest row id matching the given parameters.
+
+        :param query_params: Parameters passed on to `_build_request_url`.
+        :type query_params: dict[str, Any]
+        :param after_id: Only rows with an id higher than this are considered.
+        :type after_id: int, optional
+        :return: A tuple of the lowest and highest id, or None if no rows match.
+        :rtype: tuple[int, int], optional
+        """
+        params = dict(query_params)
+        filter_tree = self._keyset_filter_tree(
+            params.pop("filters", None),
+            params.pop("filter_type", None),
+            after_id,
+            filter_tree=params.pop("filter_tree", None),
+        )
+        params["size"] = 1
+        params["include"] = [self.primary_field]
+        params.pop("exclude", None)
+
+        bounds = []
+        for order in (["id"], ["-id"]):
+            request_url = self._build_request_url(
+                order_by=order, filter_tree=filter_tree, **params
+            )
+            results = self.client.make_api_request(request_url).get("results") or []
+            if not results:
+                return None
+            bounds.append(results[0]["id"])
+        return bounds[0], bounds[1]
+
+    def _sharded_keyset_pages(
+        self, query_params: Dict[str, Any], after_id: Optional[int], shards: int
+    ) -> Generator[tuple, None, None]:
+        """
+        Split the id range of the matching rows into shards and fetch them in parallel.
+
+        Pages are yielded as soon as any shard has fetched them, so rows of different shards are
+        interleaved. Each shard is ordered by id.
+
+        :param query_params: Parameters passed on to `_build_request_url`.
+        :type query_params: dict[str, Any]
+        :param after_id: Only rows with an id higher than this are fetched.
+        :type after_id: int, optional
+        :param shards: The number of shards fetched concurrently.
+        :type shards: int
+        :yield: The rows of each page. Sharded pages have no resumable cursor.
+        :rtype: Generator[tuple[list[Row], None], None, None]
+        """
+        bounds = self._keyset_bounds(query_params, after_id)
+        if bounds is None:
+            return
+
+        lowest, highest = bounds
+        span = highest - lowest + 1
+        step = -(-span // shards)  # ceiling division
+        ranges = [
+            (start - 1, min(start + step - 1, highest))
+            for start in range(lowest, highest + 1, step)
+        ]
+        self.logger.debug("Fetching id ranges %s in %d shards.", ranges, len(ranges))
+
+        done = object()
+        pages_queue: "queue.Queue" = queue.Queue(maxsize=len(ranges) * 2)
+        stop = threading.Event()
+
+        def _put(item: Any) -> None:
+            while not stop.is_set():
+                try:
+                    pages_queue.put(item, timeout=0.1)
+                    return
+                except queue.Full:
+                    continue
+
+        def _fetch_shard(lower_id: int, upper_id: int) -> None:
+            try:
+                for rows, _ in self._keyset_pages(query_params, lower_id, upper_id):
+                    if stop.is_set():
+                        return
+                    _put(rows)
             except Exception as e:
-                self.logger.error(f"Error fetching rows: {e}")
-                raise RowFetchError(f"Error fetching rows: {e}")
+                _put(e)
+            finally:
+                _put(done)
+
+        executor = ThreadPoolExecutor(max_workers=len(ranges))
+        try:
+            for lower_id, upper_id in ranges:
+                executor.submit(
+                    self.client.queue_task(_fetch_shard), lower_id, upper_id
+                )
+
+            remaining = len(ranges)
+            while remaining:
+                item = pages_queue.get()
+                if item is done:
+                    remaining -= 1
+                elif isinstance(item, Exception):
+                    raise item
+                else:
+                    yield item, None
+        finally:
+            stop.set()
+            executor.shutdown(wait=False)
 
     def get_rows(
         self,
@@ -415,16 +970,27 @@ class Table:
         search: Optional[str] = None,
         order_by: Optional[List[str]] = None,
         filter_type: Optional[str] = None,
-        filters: Optional[List[Filter]] = None,
+        filters: Union[List[Filter], Expression, None] = None,
         view_id: Optional[int] = None,
         size: Optional[int] = None,
         limit: Optional[int] = None,
         iterator: bool = False,
+        keyset: bool = False,
+        after_id: Optional[int] = None,
+        shards: Optional[int] = None,
+        checkpoint: Union[Checkpoint, str, Callable, None] = None,
+        auto_include: bool = False,
+        sample_size: Optional[int] = None,
+        expand: Union[List[str], Dict[str, Optional[List[str]]], None] = None,
+        types: str = "api",
         **kwargs: Any,
     ) -> Union[List[Row], Generator[Row, None, None]]:
         """
         Retrieves rows from the table using provided parameters, with an optional limit on the number of rows.
 
+        See `row_generator` for keyset pagination, checkpoints, filter expressions, link expansion
+        and native values.
+
         :param include: A list of field names to include in the results.
         :type include: list[str], optional
         :param exclude: A list of field names to exclude from the results.
@@ -435,8 +1001,8 @@ class Table:
         :type order_by: list[str], optional
         :param filter_type: The type of filter to be applied.
         :type filter_type: str, optional
-        :param filters: A list containing Filter objects to be applied.
-        :type filters: list[Filter], optional
+        :param filters: A list containing Filter objects, or an Expression, to be applied.
+        :type filters: Union[list[Filter], Expression], optional
         :param view_id: ID of the view to consider its filters and sorts.
         :type view_id: int, optional
         :param size: The number of rows per page in the response.
@@ -445,6 +1011,30 @@ class Table:
         :type limit: int, optional
         :param iterator: If True, returns a generator of Row objects. If False, returns a list of Row objects.
         :type iterator: bool, optional
+        :param keyset: If True, use keyset pagination ordered by row id instead of page offsets.
+        :type keyset: bool, optional
+        :param after_id: With keyset pagination, only fetch rows with an id higher than this.
+        :type after_id: int, optional
+        :param shards: With keyset pagination, the number of id ranges fetched in parallel.
+                       Rows from different shards are interleaved.
+        :type shards: int, optional
+        :param checkpoint: A Checkpoint, the path of a checkpoint file, or a callback receiving
+                       every checkpoint record. Cannot be combined with shards.
+        :type checkpoint: Union[Checkpoint, str, Callable], optional
+        :param auto_include: If True, learn the fields to include from the rows of a sample,
+                             see `row_generator`. Requires iterator, as the fields can only be
+                             learned while the rows are consumed. Cannot be combined with
+                             include, exclude or shards.
+        :type auto_include: bool, optional
+        :param sample_size: With auto_include, the minimum number of rows in the sample. The
+                            sample always ends with a complete page. Defaults to one page.
+        :type sample_size: int, optional
+        :param expand: The link fields to resolve, as a list of field names or dotted paths, or
+                       as a dictionary mapping them to the fields to include for the linked rows.
+        :type expand: Union[list[str], dict[str, list[str]]], optional
+        :param types: One of `TYPES`. "api" (the default) returns values as the API does,
+                      "native" converts them to native Python types.
+        :type types: str, optional
         :param kwargs: Additional parameters for the API request.
         :type kwargs: dict
 
@@ -454,6 +1044,10 @@ class Table:
         :raises Exception: If any error occurs during the process.
         :raises ValueError: If parameters are not valid.
         """
+        if auto_include and not iterator:
+            # A list is built before any field is read, so nothing could be learned.
+            raise ValueError("'auto_include' can only be used with 'iterator=True'.")
+
         generator = self.row_generator(
             include=include,
             exclude=exclude,
@@ -464,6 +1058,14 @@ class Table:
             view_id=view_id,
             size=size,
             limit=limit,
+            keyset=keyset,
+            after_id=after_id,
+            shards=shards,
+            checkpoint=checkpoint,
+            auto_include=auto_include,
+            sample_size=sample_size,
+            expand=expand,
+            types=types,
             **kwargs,
         )
 
@@ -501,29 +1103,537 @@ class Table:
             self.logger.error(error_message)
             raise RowFetchError(f"Failed to retrieve row: {e}")
 
+    def _equal_filter_chunks(
+        self, field_name: str, values: List[Any]
+    ) -> List[List[Filter]]:
+        """
+        Split 'equal' filters for the given values into chunks whose encoded filter tree stays
+        below MAX_FILTER_LENGTH.
+
+        :param field_name: The name of the field to filter on.
+        :type field_name: str
+        :param values: The values to match.
+        :type values: list[Any]
+        :return: The chunks of filters, each to be combined with 'OR'.
+        :rtype: list[list[Filter]]
+        """
+        chunks: List[List[Filter]] = []
+        current: List[Filter] = []
+        length = 0
+        for value in values:
+            item = {"field": field_name, "type": "equal", "value": value}
+            # The encoded item plus the ', ' separating it from the next one
+            item_length = len(urllib.parse.quote(json.dumps(item))) + 6
+            if current and length + item_length > self.MAX_FILTER_LENGTH:
+                chunks.append(current)
+                current, length = [], 0
+            current.append(Filter(field_name, value))
+            length += item_length
+        if current:
+            chunks.append(current)
+        return chunks
+
+    def _fetch_equal(
+        self,
+        field_name: str,
+        values: List[Any],
+        include: Optional[List[str]],
+        exclude: Optional[List[str]],
+        max_workers: int,
+    ) -> List[Row]:
+        """
+        Fetch all rows whose field equals one of the values, with one query per chunk of values.
+
+        :param field_name: The name of the field to filter on.
+        :type field_name: str
+        :param values: The values to match.
+        :type values: list[Any]
+        :param include: A list of field names to include in the results.
+        :type include: list[str], optional
+        :param exclude: A list of field names to exclude from the results.
+        :type exclude: list[str], optional
+        :param max_workers: The maximum number of chunks fetched concurrently.
+        :type max_workers: int
+        :return: The matching rows, in no particular order.
+        :rtype: list[Row]
+        :raises RowFetchError: If a request fails.
+        """
+        chunks = self._equal_filter_chunks(field_name, values)
+
+        def _fetch_chunk(chunk: List[Filter]) -> List[Row]:
+            request_url = self._build_request_url(
+                include=include,
+                exclude=exclude,
+                size=200,
+                filter_tree=self._construct_filter_tree(chunk, "OR"),
+            )
+            return [row for rows, _ in self._offset_pages(request_url) for row in rows]
+
+        self.logger.debug(
+            "Fetching rows by %s values of '%s' in %s requests.",
+            len(values),
+            field_name,
+            len(chunks),
+        )
+        try:
+            if len(chunks) <= 1 or max_workers <= 1:
+                results = [_fetch_chunk(chunk) for chunk in chunks]
+            else:
+                with ThreadPoolExecutor(
+                    max_workers=min(max_workers, len(chunks))
+                ) as executor:
+                    results = list(
+                        executor.map(self.client.queue_task(_fetch_chunk), chunks)
+                    )
+        except Exception as e:
+            self.logger.error(f"Error fetching rows by '{field_name}': {e}")
+            raise RowFetchError(f"Error fetching rows by '{field_name}': {e}")
+        return [row for rows in results for row in rows]
+
+    def get_rows_by_ids(
+        self,
+        row_ids: List[Union[int, str]],
+        include: Optional[List[str]] = None,
+        exclude: Optional[List[str]] = None,
+        max_workers: int = 4,
+    ) -> BatchResult:
+        """
+        Fetch many rows by their ids with a few requests instead of one request per row.
+
+        The ids are packed into 'OR' filter groups, split into chunks that keep the request URLs
+        below MAX_FILTER_LENGTH, and the chunks are fetched in parallel.
+
+        :param row_ids: The ids of the rows.
+        :type row_ids: list[Union[int, str]]
+        :param include: A list of field names to include in the results.
+        :type include: list[str], optional
+        :param exclude: A list of field names to exclude from the results.
+        :type exclude: list[str], optional
+        :param max_workers: The maximum number of concurrent requests. Defaults to 4.
+        :type max_workers: int, optional
+        :return: The rows in the order of the requested ids, and a BatchFailure for every id
+                 that does not exist.
+        :rtype: BatchResult
+        :raises ValueError: If an id cannot be converted to an integer.
+        :raises RowFetchError: If a request fails.
+        """
+        try:
+            row_ids = [int(row_id) for row_id in row_ids]
+        except (TypeError, ValueError):
+            raise ValueError("All row ids must be integers.")
+
+        unique_ids = list(dict.fromkeys(row_ids))
+        rows = self._fetch_equal("id", unique_ids, include, exclude, max_workers)
+        rows_by_id = {row.id: row for row in rows}
+
+        result = BatchResult()
+        for index, row_id in enumerate(row_ids):
+            row = rows_by_id.get(row_id)
+            if row is not None:
+                result.succeeded.append(row)
+            else:
+                result.failures.append(
+                    BatchFailure(
+                        index,
+                        row_id,
+                        RowFetchError(
+                            f"Row {row_id} does not exist in table {self.id}."
+                        ),
+                    )
+                )
+        return result
+
+    def get_rows_by_values(
+        self,
+        field_name: str,
+        values: List[Any],
+        include: Optional[List[str]] = None,
+        exclude: Optional[List[str]] = None,
+        max_workers: int = 4,
+    ) -> BatchResult:
+        """
+        Fetch the rows whose field equals one of the given values, e.g. by an external key.
+
+        Works like `get_rows_by_ids` for any field that supports the 'equal' filter.
+
+        :param field_name: The name of the field to match.
+        :type field_name: str
+        :param values: The values to look up.
+        :type values: list[Any]
+        :param include: A list of field names to include in the results. The matched field is
+                        always included.
+        :type include: list[str], optional
+        :param exclude: A list of field names to exclude from the results.
+        :type exclude: list[str], optional
+        :param max_workers: The maximum number of concurrent requests. Defaults to 4.
+        :type max_workers: int, optional
+        :return: The matching rows ordered by the position of their value in values, and a
+                 BatchFailure for every value without a matching row.
+        :rtype: BatchResult
+        :raises ValueError: If the field does not exist or does not support the 'equal' filter.
+        :raises RowFetchError: If a request fails.
+        """
+        if field_name not in self.field_names:
+            raise ValueError(f"Invalid field name in filter: {field_name}")
+        field = self.fields[field_name]
+        if "equal" not in getattr(field, "compatible_filters", []):
+            raise ValueError(
+                f"Field '{field_name}' of type '{field.TYPE}' does not support the 'equal' filter."
+            )
+        if include and field_name not in include:
+            include = include + [field_name]
+        if exclude:
+            exclude = [name for name in exclude if name != field_name]
+
+        numeric = isinstance(field, (NumberField, RatingField, CountField))
+
+        def _key(value: Any) -> Any:
+            # Number fields return decimals as strings, e.g. '3.50' for 3.5. Decimal keeps
+            # large and precise values apart, which float would round together.
+            if numeric:
+                try:
+                    number = Decimal(str(value))
+                except (InvalidOperation, ValueError):
+                    pass
+                else:
+                    if number.is_finite():
+                        return number
+            return str(value)
+
+        unique_values = list({_key(value): value for value in values}.values())
+        rows = self._fetch_equal(
+            field_name, unique_values, include, exclude, max_workers
+        )
+        rows_by_value: Dict[Any, List[Row]] = {}
+        for row in sorted(rows, key=lambda row: row.id):
+            key = _key(row._row_data.get(field_name))
+            rows_by_value.setdefault(key, []).append(row)
+
+        result = BatchResult()
+        for index, value in enumerate(values):
+            matches = rows_by_value.get(_key(value))
+            if matches:
+                result.succeeded.extend(matches)
+            else:
+                result.failures.append(
+                    BatchFailure(
+                        index,
+                        value,
+                        RowFetchError(
+                            f"No row with {field_name} equal to {value!r} in table {self.id}."
+                        ),
+                    )
+                )
+        return result
+
+    def count(
+        self,
+        search: Optional[str] = None,
+        filter_type: Optional[str] = None,
+        filters: Union[List[Filter], Expression, None] = None,
+        view_id: Optional[int] = None,
+        **kwargs: Any,
+    ) -> int:
+        """
+        Count the rows of the table that match the given filters.
+
+        The count is read from a single request for a page of one row, so no rows are
+        downloaded. If an Expression contains conditions Baserow cannot evaluate, the rows
+        matching the rest of it are streamed with only the primary field and counted locally.
+
+        :param search: A search string to apply on the table data.
+        :type search: str, optional
+        :param filter_type: The type of filter to be applied (AND/OR).
+        :type filter_type: str, optional
+        :param filters: A list containing Filter objects, or an Expression, to be applied.
+        :type filters: Union[list[Filter], Expression], optional
+        :param view_id: ID of the view to consider its filters.
+        :type view_id: int, optional
+        :param kwargs: Additional parameters for the API request.
+        :type kwargs: Any
+        :return: The number of matching rows.
+        :rtype: int
+        :raises RowFetchError: If the request fails.
+        """
+        filter_tree = None
+        if isinstance(filters, Expression):
+            filter_tree, remainder = filters.compile(self)
+            if remainder is not None:
+                # Conditions evaluated locally require streaming the narrowed rows
+                rows = self.row_generator(
+                    include=[self.primary_field],
+                    search=search,
+                    filters=filters,
+                    view_id=view_id,
+                    size=200,
+                    **kwargs,
+                )
+                return sum(1 for _ in rows)
+            filters = None
+
+        request_url = self._build_request_url(
+            include=[self.primary_field],
+            search=search,
+            filter_type=filter_type,
+            filters=filters,
+            view_id=view_id,
+            size=1,
+            filter_tree=filter_tree,
+            **kwargs,
+        )
+        try:
+            return self.client.make_api_request(request_url)["count"]
+        except Exception as e:
+            self.logger.error(f"Error counting rows: {e}")
+            raise RowFetchError(f"Error counting rows: {e}")
+
+    def aggregate(
+        self,
+        field_name: str,
+        fn: str,
+        search: Optional[str] = None,
+        filter_type: Optional[str] = None,
+        filters: Union[List[Filter], Expression, None] = None,
+        view_id: Optional[int] = None,
+        **kwargs: Any,
+    ) -> Any:
+        """
+        Aggregate the values of a field, e.g. to sum a number column.
+
+        If only a view is given, the aggregation is computed by Baserow with the field
+        aggregation endpoint of the grid view, which applies the filters of the view. Otherwise,
+        or if the endpoint is not available to the token, the rows are streamed with only the
+        aggregated field included and the aggregation is computed locally.
+
+        :param field_name: The name of the field to aggregate.
+        :type field_name: str
+        :param fn: The aggregation function, one of `Aggregation.FUNCTIONS`, e.g. 'sum',
+                   'average', 'min', 'max', 'median', 'unique_count' or 'empty_count'.
+        :type fn: str
+        :param search: A search string to apply on the table data.
+        :type search: str, optional
+        :param filter_type: The type of filter to be applied (AND/OR).
+        :type filter_type: str, optional
+        :param filters: A list containing Filter objects, or an Expression, to be applied.
+        :type filters: Union[list[Filter], Expression], optional
+        :param view_id: ID of the view to consider its filters.
+        :type view_id: int, optional
+        :param kwargs: Additional parameters for the API request.
+        :type kwargs: Any
+        :return: The aggregated value.
+        :rtype: Any
+        :raises ValueError: If the aggregation function is not supported.
+        :raises KeyError: If the field does not exist.
+        :raises RowFetchError: If the rows cannot be fetched.
+        """
+        aggregation = Aggregation(fn)
+        field = self.fields[field_name]
+        if fn == "count":
+            return self.count(search, filter_type, filters, view_id, **kwargs)
+
+        if view_id is not None and not (search or filters or kwargs):
+            endpoint = (
+                f"/api/database/views/grid/{view_id}/aggregation/{field.id}/?type={fn}"
+            )
+            try:
+                return self.client.make_api_request(endpoint)["value"]
+            except BaserowHTTPError as e:
+                self.logger.debug(
+                    "Aggregating %s locally, the view aggregation failed: %s",
+                    field_name,
+                    e,
+                )
+
+        for row in self.row_generator(
+            include=[field_name],
+            search=search,
+            filter_type=filter_type,
+            filters=filters,
+            view_id=view_id,
+            size=200,
+            **kwargs,
+        ):
+            aggregation.add(row._row_data.get(field_name))
+        return aggregation.result
+
+    @staticmethod
+    def _batches(
+        items: Iterable[Any], batch_size: int
+    ) -> Iterator[Tuple[int, List[Any]]]:
+        """
+        Split an iterable into batches without materializing it.
+
+        :param items: The items to split, consumed lazily.
+        :type items: Iterable[Any]
+        :param batch_size: The maximum number of items per batch.
+        :type batch_size: int
+        :return: An iterator over the offset of each batch and its items.
+        :rtype: Iterator[tuple[int, list]]
+        """
+        iterator = iter(items)
+        offset = 0
+        while True:
+            batch = list(itertools.islice(iterator, batch_size))
+            if not batch:
+                return
+            yield offset, batch
+            offset += len(batch)
+
+    @classmethod
+    def _check_returning(cls, returning: str) -> None:
+        """
+        Validate the returning argument of the write operations.
+
+        :param returning: The requested representation of written rows.
+        :type returning: str
+        :raises ValueError: If returning is not one of `RETURNING`.
+        """
+        if returning not in cls.RETURNING:
+            raise ValueError(
+                f"'returning' should be one of {', '.join(map(repr, cls.RETURNING))}"
+            )
+
+    def _returned(
+        self, items: List[Dict[str, Any]], returning: str
+    ) -> Optional[List[Union[Row, int, Dict[str, Any]]]]:
+        """
+        Convert the row data returned by a write request to the requested representation.
+
+        :param items: The row data returned by the API.
+        :type items: list[dict[str, Any]]
+        :param returning: One of `RETURNING`.
+        :type returning: str
+        :return: Row objects, row ids or the row data itself, or None for "none".
+        :rtype: list[Union[Row, int, dict[str, Any]]], optional
+        """
+        if returning == "rows":
+            return [
+                Row(row_data=item, table=self, client=self.client) for item in items
+            ]
+        if returning == "ids":
+            return [item["id"] for item in items]
+        if returning == "raw":
+            return items
+        return None
+
+    def _batch_results(
+        self,
+        batches: Iterator[Tuple[List[Dict[str, Any]], List[BatchFailure]]],
+        on_error: str,
+        returning: str,
+    ) -> Iterator[Any]:
+        """
+        Convert the results of written batches one batch at a time.
+
+        :param batches: The returned row data and the failures of each written batch.
+        :type batches: Iterator[tuple[list[dict[str, Any]], list[BatchFailure]]]
+        :param on_error: The error handling mode of the write.
+        :type on_error: str
+        :param returning: One of `RETURNING`.
+        :type returning: str
+        :return: An iterator over the converted rows of each batch, or a BatchResult of the
+                 converted rows and failures of each batch if on_error is "bisect".
+        :rtype: Iterator[Any]
+        """
+        for items, failures in batches:
+            results = self._returned(items, returning)
+            if on_error == "bisect":
+                yield BatchResult(results or [], failures)
+            else:
+                yield results
+
+    def _collect_results(
+        self,
+        batches: Iterator[Tuple[List[Dict[str, Any]], List[BatchFailure]]],
+        on_error: str,
+        returning: str,
+    ) -> Any:
+        """
+        Write all batches and collect their converted results.
+
+        :param batches: The returned row data and the failures of each written batch.
+        :type batches: Iterator[tuple[list[dict[str, Any]], list[BatchFailure]]]
+        :param on_error: The error handling mode of the write.
+        :type on_error: str
+        :param returning: One of `RETURNING`.
+        :type returning: str
+        :return: The converted rows of all batches, None if returning is "none", or a
+                 BatchResult of the converted rows and all failures if on_error is "bisect".
+        :rtype: Any
+        """
+        results = []
+        failures = []
+        for items, batch_failures in batches:
+            if returning != "none":
+                results.extend(self._returned(items, returning))
+            failures.extend(batch_failures)
+
+        if on_error == "bisect":
+            return BatchResult(results, failures)
+        return results if returning != "none" else None
+
     def add_rows(
         self,
-        rows_data: Union[Dict[str, Any], List[Dict[str, Any]]],
+        rows_data: Union[Dict[str, Any], Iterable[Dict[str, Any]]],
         batch_size: Optional[int] = None,
-    ) -> Union[Row, List[Row]]:
+        checkpoint: Union[Checkpoint, str, Callable, None] = None,
+        on_error: str = "raise",
+        return_rows: bool = True,
+        returning: Optional[str] = None,
+    ) -> Union[List[Any], BatchResult, Iterator[Any], None]:
         """
         Add a new row (or multiple rows) to the table.
 
+        Rows can be given as any iterable, e.g. a generator, which is consumed one batch at a
+        time, so only the batch in flight is held in memory. Lists and tuples are validated
+        completely before the first request; rows of other iterables are validated per batch.
+
+        When a checkpoint is given, the offset and the returned ids of every committed chunk are
+        recorded. Running the same call again with the same checkpoint skips those chunks, so an
+        interrupted import resumes without creating duplicates. Only rows added during the current
+        call are returned; ``checkpoint.ids`` holds the ids of all added rows.
+
+        With ``on_error="bisect"``, a chunk rejected by the server is split in halves until the
+        offending rows are isolated, all other rows are committed, and a BatchResult listing the
+        added rows and the failures with their input indices is returned instead of raising.
+
+        With ``return_rows=False``, the added rows are not collected. Instead, an iterator is
+        returned that adds one batch per step and yields the ids of its rows, or a BatchResult of
+        the ids and failures of the batch with ``on_error="bisect"``. Nothing is written before
+        the iterator is consumed.
+
+        ``returning`` selects how added rows are returned: as Row objects ("rows"), as ids
+        ("ids"), as the row data returned by the API ("raw") or not at all ("none"). Large imports
+        avoid building a Row object per added row with "ids" or "none".
+
         :param rows_data: A dictionary representing the fields and values
-                        of the row to add, or a list of dictionaries for
+                        of the row to add, or an iterable of dictionaries for
                         adding multiple rows.
-        :type rows_data: dict or list[dict]
+        :type rows_data: dict or Iterable[dict]
 
         :param batch_size: The number of rows to include in each batch request when adding multiple rows.
                         Defaults to the client's batch_size.
         :type batch_size: int
-
-        :return: An instance of the Row model representing the added row or
-                a list of Row instances for multiple rows.
-        :rtype: Row or list[Row]
+        :param checkpoint: A Checkpoint, the path of a checkpoint file, or a callback receiving
+                        every checkpoint record.
+        :type checkpoint: Union[Checkpoint, str, Callable], optional
+        :param on_error: Either "raise" (default) or "bisect" to isolate and report rejected rows.
+        :type on_error: str, optional
+        :param return_rows: If False, return an iterator over the results of every added batch.
+                        Defaults to True.
+        :type return_rows: bool, optional
+        :param returning: One of "rows", "ids", "raw" or "none". Defaults to "rows", or to "ids"
+                        if return_rows is False.
+        :type returning: str, optional
+
+        :return: A list of the added rows in the representation selected by returning, or None
+                if returning is "none". A BatchResult if on_error is "bisect". An iterator over
+                the results of every batch if return_rows is False.
+        :rtype: list or BatchResult or Iterator or None
 
         :raises ValueError: If parameters are not valid.
-        :raises Exception: If there's any error during the API request.
+        :raises RowAddError: If there's any error during the API request. The error carries the
+                        offset of the failed chunk and the offsets of the committed chunks.
         """
 
         def _add_rows_chunk(chunk):
@@ -537,193 +1647,573 @@ class Table:
             response = self.client.make_api_request(
                 api_endpoint, method="POST", data=data_payload
             )
-            return [
-                Row(row_data=row_data_item, table=self, client=self.client)
-                for row_data_item in response["items"]
-            ]
+            return response["items"]
 
-        # Normalize rows_data to always be a list of dictionaries
+        def _validated(rows):
+            """
+            Helper function to validate rows as they are consumed.
+            """
+            for row in rows:
+                for field_name in row.keys():
+                    if field_name not in self.writable_fields:
+                        error_message = f"Field '{field_name}' is not writable or does not exist in the table."
+                        self.logger.error(error_message)
+                        raise RowAddError(error_message)
+                yield row
+
+        # Normalize rows_data to always be an iterable of dictionaries
         if isinstance(rows_data, dict):
             rows_data = [rows_data]
 
-        # Validate each row
-        for row in rows_data:
-            for field_name in row.keys():
-                if field_name not in self.writable_fields:
-                    error_message = f"Field '{field_name}' is not writable or does not exist in the table."
-                    self.logger.error(error_message)
-                    raise RowAddError(error_message)
+        rows = _validated(rows_data)
+        if isinstance(rows_data, (list, tuple)):
+            rows = list(rows)
 
         if batch_size is None:
             batch_size = self.client.batch_size
 
-        added_rows = []
-        for i in range(0, len(rows_data), batch_size):
-            chunk = rows_data[i : i + batch_size]
-            try:
-                added_rows.extend(_add_rows_chunk(chunk))
-            except Exception as e:
-                error_message = f"Failed to add row(s) to table {self.id}. Error: {e}"
-                self.logger.error(error_message)
-                raise RowAddError(f"Failed to add rows: {e}")
-        return added_rows
+        if returning is None:
+            returning = "rows" if return_rows else "ids"
 
-    def update_rows(
-        self,
-        rows_data: Union[List[Union[Dict[str, Any], Row]], Generator[Row, None, None]],
-        batch_size: Optional[int] = None,
-    ) -> List[Row]:
-        """
-        Updates multiple rows in the table using the Baserow batch update endpoint.
+        self._check_on_error(on_error)
+        self._check_returning(returning)
+        checkpoint = as_checkpoint(checkpoint)
+        if checkpoint is not None:
+            checkpoint.begin("add_rows", table_id=self.id, batch_size=batch_size)
 
-        :param rows_data: A list of dictionaries or Row objects.
-                        Each dictionary should contain the field values for updating
-                        a specific row and include the ID of the row to be updated.
-                        Row objects represent the rows to be updated.
-        :type rows_data: list[Union[dict, Row]]
-        :param batch_size: The number of rows to process in each batch.
-        :type batch_size: int
+        def _add_batches():
+            """
+            Helper generator adding one chunk per step.
+            """
+            completed_offsets = []
+            for i, chunk in self._batches(rows, batch_size):
+                if checkpoint is not None and checkpoint.is_completed(i):
+                    continue
+
+                chunk_failures = []
+                try:
+                    if on_error == "bisect":
+                        new_rows, chunk_failures = self._bisect_batch(
+                            _add_rows_chunk, chunk, list(range(i, i + len(chunk)))
+                        )
+                    else:
+                        new_rows = _add_rows_chunk(chunk)
+                except Exception as e:
+                    error_message = f"Failed to add row(s) to table {self.id} at offset {i}. Error: {e}"
+                    self.logger.error(error_message)
+                    raise RowAddError(
+                        f"Failed to add rows at offset {i}: {e}",
+                        failed_offset=i,
+                        completed_offsets=(
+                            checkpoint.completed_offsets
+                            if checkpoint is not None
+                            else completed_offsets
+                        ),
+                    )
 
-        :return: A list of Row objects representing the updated rows.
-        :rtype: list[Row]
+                completed_offsets.append(i)
+                if checkpoint is not None:
+                    checkpoint.complete(i, [item["id"] for item in new_rows])
+                yield new_rows, chunk_failures
 
-        :raises ValueError: If parameters are not valid.
+        if not return_rows:
+            return self._batch_results(_add_batches(), on_error, returning)
+        return self._collect_results(_add_batches(), on_error, returning)
+
+    def writer(
+        self,
+        max_batch: int = 200,
+        max_latency_ms: float = 500,
+        on_error: Optional[Callable[[List[Dict[str, Any]], Exception], None]] = None,
+        spool_path: Optional[str] = None,
+        fsync: bool = False,
+    ) -> RowWriter:
+        """
+        Create a write-behind buffer adding rows to this table in batches from a background thread.
+
+        :param max_batch: The maximum number of rows per request. Defaults to 200.
+        :type max_batch: int
+        :param max_latency_ms: The maximum number of milliseconds a row waits before its batch
+                               is sent. Defaults to 500.
+        :type max_latency_ms: float
+        :param on_error: Called with the rows that could not be added and the error. Defaults
+                         to logging the error.
+        :type on_error: Callable[[list[dict[str, Any]], Exception], None], optional
+        :param spool_path: The path of a write-ahead file keeping pending rows across failures
+                           and restarts.
+        :type spool_path: str, optional
+        :param fsync: If True, every appended row is flushed to disk. Only used with a spool.
+        :type fsync: bool, optional
+        :return: A started RowWriter. Close it, or use it as a context manager, to flush it.
+        :rtype: RowWriter
+        """
+        return RowWriter(
+            self,
+            max_batch=max_batch,
+            max_latency_ms=max_latency_ms,
+            on_error=on_error,
+            spool_path=spool_path,
+            fsync=fsync,
+        )
+
+    def update_rows(
+        self,
+        rows_data: Iterable[Union[Dict[str, Any], Row]],
+        batch_size: Optional[int] = None,
+        skip_unchanged: Union[bool, MutableMapping[str, Dict[str, str]]] = False,
+        checkpoint: Union[Checkpoint, str, Callable, None] = None,
+        on_error: str = "raise",
+        return_rows: bool = True,
+        returning: Optional[str] = None,
+        on_skipped: Optional[Callable[[int], None]] = None,
+    ) -> Union[List[Any], BatchResult, Iterator[Any], None]:
+        """
+        Updates multiple rows in the table using the Baserow batch update endpoint.
+
+        Rows can be given as any iterable, e.g. a generator of rows read with `row_generator`,
+        which is consumed one batch at a time, so only the batch in flight is held in memory.
+        Lists and tuples are validated completely before the first request; rows of other
+        iterables are validated per batch.
+
+        With ``skip_unchanged`` enabled, rows that would not change anything on the server are
+        dropped before batching. Row objects are compared against the state they were fetched with
+        and only their changed fields are sent. Dictionaries are compared against digests of the
+        values last sent for the same row id. With ``skip_unchanged=True`` the digests are kept by
+        this Table instance for the most recently written ``MAX_ROW_DIGESTS`` rows. A mapping,
+        e.g. a dict loaded from disk or a `shelve` file, is used as the digest store instead, so
+        a later process can skip the rows sent by an earlier one. The number of skipped rows is
+        logged and passed to ``on_skipped`` once all rows were processed, in every mode. With
+        ``on_error="bisect"`` it is also returned as ``BatchResult.skipped``.
+
+        When a checkpoint is given, the ids of every committed chunk are recorded. Running the same
+        call again with the same checkpoint skips rows whose ids were already updated.
+
+        With ``on_error="bisect"``, rejected chunks are split until the offending rows are isolated
+        and a BatchResult is returned instead of raising. Failure indices refer to rows_data.
+
+        With ``return_rows=False``, an iterator is returned that updates one batch per step and
+        yields the ids of its rows, or a BatchResult per batch with ``on_error="bisect"``.
+
+        ``returning`` selects how updated rows are returned: as Row objects ("rows"), as ids
+        ("ids"), as the row data returned by the API ("raw") or not at all ("none").
+
+        :param rows_data: An iterable of dictionaries or Row objects.
+                        Each dictionary should contain the field values for updating
+                        a specific row and include the ID of the row to be updated.
+                        Row objects represent the rows to be updated.
+        :type rows_data: Iterable[Union[dict, Row]]
+        :param batch_size: The number of rows to process in each batch.
+        :type batch_size: int
+        :param skip_unchanged: If True or a digest store, rows identical to the last-known server
+                        state are not sent. A digest store maps row ids, as strings, to the
+                        digests of the values last sent for the row.
+        :type skip_unchanged: Union[bool, MutableMapping[str, dict[str, str]]], optional
+        :param checkpoint: A Checkpoint, the path of a checkpoint file, or a callback receiving
+                        every checkpoint record.
+        :type checkpoint: Union[Checkpoint, str, Callable], optional
+        :param on_error: Either "raise" (default) or "bisect" to isolate and report rejected rows.
+        :type on_error: str, optional
+        :param return_rows: If False, return an iterator over the results of every updated
+                        batch. Defaults to True.
+        :type return_rows: bool, optional
+        :param returning: One of "rows", "ids", "raw" or "none". Defaults to "rows", or to "ids"
+                        if return_rows is False.
+        :type returning: str, optional
+        :param on_skipped: A callable receiving the number of rows skipped by skip_unchanged
+                        once all rows were processed. With return_rows=False it is called when
+                        the iterator is exhausted.
+        :type on_skipped: Callable[[int], None], optional
+
+        :return: A list of the updated rows in the representation selected by returning, or
+                 None if returning is "none". A BatchResult, including the number of skipped
+                 rows, if on_error is "bisect". An iterator over the results of every batch if
+                 return_rows is False.
+        :rtype: list or BatchResult or Iterator or None
+
+        :raises ValueError: If parameters are not valid or an empty list is given.
         :raises KeyError: If a dictionary contains a key that doesn't correspond to any writable field in the table or is missing the 'id' key.
-        :raises TypeError: If an item in rows_data is neither a dictionary nor a Row object, or if a generator is passed.
-        :raises Exception: If the API request results in any error responses.
+        :raises TypeError: If an item in rows_data is neither a dictionary nor a Row object.
+        :raises RowUpdateError: If the API request results in any error responses. The error carries
+                        the offset of the failed chunk and the offsets of the committed chunks.
         """
 
-        if not rows_data:
+        if isinstance(rows_data, (list, tuple)) and not rows_data:
             warning_msg = "The rows_data list is empty. Nothing to update."
             self.logger.warning(warning_msg)
             raise ValueError(warning_msg)
 
-        if isinstance(rows_data, Generator):
-            raise TypeError(
-                "The update_rows method does not accept generator objects. Please provide a list of rows."
-            )
+        if returning is None:
+            returning = "rows" if return_rows else "ids"
 
-        formatted_data = []
-        for item in rows_data:
-            if isinstance(item, dict):
-                if "id" not in item:
-                    raise KeyError(
-                        "The 'id' key is missing, which is required for updating a row."
-                    )
+        self._check_on_error(on_error)
+        self._check_returning(returning)
+        if isinstance(skip_unchanged, MutableMapping):
+            digest_store = skip_unchanged
+        else:
+            digest_store = self._row_digests if skip_unchanged else None
+        skip_unchanged = digest_store is not None
+        skipped = 0
+
+        def _formatted(rows):
+            """
+            Helper function to validate and format rows as they are consumed.
+            """
+            nonlocal skipped
+            for index, item in enumerate(rows):
+                if isinstance(item, dict):
+                    if "id" not in item:
+                        raise KeyError(
+                            "The 'id' key is missing, which is required for updating a row."
+                        )
+                    self._validate_update_values(item)
 
-                for key, value in item.items():
-                    if key == "id":
+                    if skip_unchanged and self._is_unchanged(item, digest_store):
+                        skipped += 1
                         continue
 
-                    if key == "order":
-                        if not isinstance(value, (int, float)) or value <= 0:
-                            raise ValueError(
-                                f"Invalid 'order' value: {value}. 'order' should be a positive numeric value."
-                            )
+                    yield index, item
+
+                elif isinstance(item, Row):
+                    if skip_unchanged:
+                        changes = item.changed_fields()
+                        if not changes:
+                            skipped += 1
+                            continue
+                        yield index, {"id": item.id, **changes}
                         continue
 
-                    if key not in self.writable_fields:
-                        raise KeyError(
-                            f"Field '{key}' is either read-only or does not exist in the table."
-                        )
+                    row_data = {"id": item.id}
+                    for rv in item.values:
+                        if not rv.is_read_only:
+                            row_data[rv.name] = rv.format_for_api()
+                    yield index, row_data
 
-                    field_object = self.fields[key]
+                else:
+                    raise TypeError(
+                        f"Unsupported type {type(item)} in rows_data. Expected dict or Row object."
+                    )
 
-                    try:
-                        field_object.validate_value(value)
-                    except ValueError as ve:
-                        raise ValueError(f"Invalid value for field '{key}': {ve}") from ve
+        pending = _formatted(rows_data)
+        if isinstance(rows_data, (list, tuple)):
+            pending = list(pending)
+
+        checkpoint = as_checkpoint(checkpoint)
+        if checkpoint is not None:
+            checkpoint.begin("update_rows", table_id=self.id)
+            updated_ids = set(checkpoint.ids)
+            pending = (
+                (index, item)
+                for index, item in pending
+                if item["id"] not in updated_ids
+            )
 
-                formatted_data.append(item)
+        endpoint = f"/api/database/rows/table/{self.id}/batch/?user_field_names=true"
 
-            elif isinstance(item, Row):
-                row_data = {"id": item.id}
-                for rv in item.values:
-                    if not rv.is_read_only:
-                        row_data[rv.name] = rv.format_for_api()
-                formatted_data.append(row_data)
+        def _update_rows_chunk(chunk):
+            """
+            Helper function to update a chunk of rows.
+            """
+            response = self.client.make_api_request(
+                endpoint, method="PATCH", data={"items": chunk}
+            )
+            return response["items"]
 
-            else:
-                raise TypeError(
-                    f"Unsupported type {type(item)} in rows_data. Expected dict or Row object."
+        if batch_size is None:
+            batch_size = self.client.batch_size
+
+        def _update_batches():
+            """
+            Helper generator updating one chunk per step.
+            """
+            completed_offsets = []
+            sent = 0
+            for _, batch in self._batches(pending, batch_size):
+                input_indices = [index for index, _ in batch]
+                batch_data = [item for _, item in batch]
+                # Offsets refer to rows_data, so they stay stable when a resumed run skips rows
+                i = input_indices[0]
+                chunk_failures = []
+                try:
+                    if on_error == "bisect":
+                        new_rows, chunk_failures = self._bisect_batch(
+                            _update_rows_chunk, batch_data, input_indices
+                        )
+                    else:
+                        new_rows = _update_rows_chunk(batch_data)
+                except Exception as e:
+                    self.logger.error(
+                        f"Failed to update rows in table {self.id} at offset {i}. Error: {e}"
+                    )
+                    raise RowUpdateError(
+                        f"Failed to update rows at offset {i}: {e}",
+                        failed_offset=i,
+                        completed_offsets=(
+                            checkpoint.completed_offsets
+                            if checkpoint is not None
+                            else completed_offsets
+                        ),
+                    )
+
+                committed = [item["id"] for item in new_rows]
+                if skip_unchanged:
+                    committed_ids = set(committed)
+                    self._remember_digests(
+                        [item for item in batch_data if item["id"] in committed_ids],
+                        digest_store,
+                    )
+                completed_offsets.append(i)
+                if checkpoint is not None:
+                    checkpoint.complete(i, committed)
+                sent += len(batch_data)
+                yield new_rows, chunk_failures
+
+            if skip_unchanged:
+                self.logger.info(
+                    "Skipped %d unchanged row(s) out of %d in table %s.",
+                    skipped,
+                    skipped + sent,
+                    self.id,
                 )
+            if on_skipped is not None:
+                on_skipped(skipped)
 
-        try:
-            endpoint = f"/api/database/rows/table/{self.id}/batch/?user_field_names=true"
-            updated_rows = []
+        if not return_rows:
+            return self._batch_results(_update_batches(), on_error, returning)
+        result = self._collect_results(_update_batches(), on_error, returning)
+        if on_error == "bisect":
+            result.skipped = skipped
+        return result
+
+    def _validate_update_values(self, values: Dict[str, Any]) -> None:
+        """
+        Validate the field values of a row update dictionary.
 
-            if batch_size is None:
-                batch_size = self.client.batch_size
+        :param values: The field values to write. An 'id' key is ignored.
+        :type values: dict[str, Any]
+        :raises ValueError: If a value or the 'order' is not valid.
+        :raises KeyError: If a key doesn't correspond to any writable field in the table.
+        """
+        for key, value in values.items():
+            if key == "id":
+                continue
+
+            if key == "order":
+                if not isinstance(value, (int, float)) or value <= 0:
+                    raise ValueError(
+                        f"Invalid 'order' value: {value}. 'order' should be a positive numeric value."
+                    )
+                continue
 
-            for i in range(0, len(formatted_data), batch_size):
-                batch_data = formatted_data[i : i + batch_size]
-                response = self.client.make_api_request(
-                    endpoint, method="PATCH", data={"items": batch_data}
+            if key not in self.writable_fields:
+                raise KeyError(
+                    f"Field '{key}' is either read-only or does not exist in the table."
                 )
 
-                updated_rows.extend(
-                    [
-                        Row(row_data=item, table=self, client=self.client)
-                        for item in response["items"]
-                    ]
+            field_object = self.fields[key]
+
+            try:
+                field_object.validate_value(value)
+            except ValueError as ve:
+                raise ValueError(f"Invalid value for field '{key}': {ve}") from ve
+
+    @staticmethod
+    def _check_on_error(on_error: str) -> None:
+        """
+        Validate the on_error argument of the batch operations.
+
+        :param on_error: The requested error handling mode.
+        :type on_error: str
+        :raises ValueError: If on_error is neither 'raise' nor 'bisect'.
+        """
+        if on_error not in ("raise", "bisect"):
+            raise ValueError("'on_error' should be either 'raise' or 'bisect'")
+
+    def _bisect_batch(
+        self,
+        send: Callable[[List[Any]], List[Any]],
+        items: List[Any],
+        indices: List[int],
+    ) -> tuple:
+        """
+        Send a batch and, if the server rejects it, split it in halves until the rejected items are isolated.
+
+        Only errors caused by the request content (HTTP 400, 404 and 413) are bisected. Any other
+        error is raised, as retrying smaller batches would not help.
+
+        :param send: Sends a list of items and returns one result per item.
+        :type send: Callable[[list], list]
+        :param items: The items to send.
+        :type items: list
+        :param indices: The input positions of the items.
+        :type indices: list[int]
+        :return: The results of the committed items and a list of BatchFailure objects.
+        :rtype: tuple[list, list[BatchFailure]]
+        """
+        try:
+            return send(items), []
+        except BaserowHTTPError as e:
+            if e.status_code not in self.BISECT_STATUS_CODES:
+                raise
+            if len(items) == 1:
+                self.logger.warning(
+                    "Row at index %d was rejected by the server: %s", indices[0], e
                 )
+                return [], [BatchFailure(indices[0], items[0], e)]
 
-            return updated_rows
-        except Exception as e:
-            self.logger.error(f"Failed to update rows in table {self.id}. Error: {e}")
-            raise RowUpdateError(f"Failed to update rows: {e}")
+        middle = len(items) // 2
+        left_results, left_failures = self._bisect_batch(
+            send, items[:middle], indices[:middle]
+        )
+        right_results, right_failures = self._bisect_batch(
+            send, items[middle:], indices[middle:]
+        )
+        return left_results + right_results, left_failures + right_failures
+
+    @staticmethod
+    def _value_digest(value: Any) -> str:
+        """
+        Compute a compact digest of a value as it is sent to the API.
+
+        :param value: The value to digest.
+        :type value: Any
+        :return: A hexadecimal digest of the value's canonical JSON form.
+        :rtype: str
+        """
+        canonical = json.dumps(value, sort_keys=True, default=str)
+        return hashlib.blake2b(canonical.encode("utf-8"), digest_size=8).hexdigest()
+
+    def _is_unchanged(
+        self, item: Dict[str, Any], store: MutableMapping[str, Dict[str, str]]
+    ) -> bool:
+        """
+        Check whether every value of an update dictionary matches the digests last sent for its row.
+
+        :param item: A row update dictionary including the row 'id'.
+        :type item: dict[str, Any]
+        :param store: The digests of the values last sent, by row id.
+        :type store: MutableMapping[str, dict[str, str]]
+        :return: True if the row is known and none of the given values changed.
+        :rtype: bool
+        """
+        with self._digest_lock:
+            known = store.get(str(item["id"]))
+        if known is None:
+            return False
+        return all(
+            known.get(key) == self._value_digest(value)
+            for key, value in item.items()
+            if key != "id"
+        )
+
+    def _remember_digests(
+        self,
+        items: List[Dict[str, Any]],
+        store: MutableMapping[str, Dict[str, str]],
+    ) -> None:
+        """
+        Record digests of values that were successfully written to the server.
+
+        The digests kept by the Table itself are limited to the ``MAX_ROW_DIGESTS`` most
+        recently written rows.
+
+        :param items: The row update dictionaries sent to the API.
+        :type items: list[dict[str, Any]]
+        :param store: The digests of the values last sent, by row id.
+        :type store: MutableMapping[str, dict[str, str]]
+        """
+        new_digests = [
+            (
+                str(item["id"]),
+                {
+                    key: self._value_digest(value)
+                    for key, value in item.items()
+                    if key != "id"
+                },
+            )
+            for item in items
+        ]
+        with self._digest_lock:
+            for row_key, digests in new_digests:
+                # Reassign instead of mutating, so stores like shelve persist the change
+                store[row_key] = {**(store.get(row_key) or {}), **digests}
+                if store is self._row_digests:
+                    store.move_to_end(row_key)
+            if store is self._row_digests:
+                while len(store) > self.MAX_ROW_DIGESTS:
+                    store.popitem(last=False)
 
     def delete_rows(
         self,
-        rows_data: Union[List[Union[Row, int]], Generator[Union[Row, int], None, None]],
+        rows_data: Iterable[Union[Row, int]],
         batch_size: Optional[int] = None,
-    ) -> bool:
+        checkpoint: Union[Checkpoint, str, Callable, None] = None,
+        on_error: str = "raise",
+    ) -> Union[bool, BatchResult]:
         """
         Deletes multiple rows from the table using the Baserow batch-delete endpoint.
 
-        This method accepts a list or generator of Row objects or integers. For each item:
+        This method accepts any iterable of Row objects or integers. For each item:
         - If it's a Row object, the method extracts its ID for deletion.
         - If it's an integer, it represents the ID of the row to be deleted.
 
-        :param rows_data: A list or generator of Row objects or integers. Row objects represent
+        Iterables other than lists and tuples, e.g. generators, are consumed one batch at a time,
+        so only the ids of the batch in flight are held in memory.
+
+        :param rows_data: An iterable of Row objects or integers. Row objects represent
                         the rows to be deleted, while integers represent the row IDs
                         to be deleted.
-        :type rows_data: list[Union[Row, int]] or Generator[Union[Row, int], None, None]
+        :type rows_data: Iterable[Union[Row, int]]
 
         :param batch_size: The number of rows to include in each batch request when deleting multiple rows.
                         Defaults to None, in which case the client's batch_size will be used.
         :type batch_size: int, optional
 
+        :param checkpoint: A Checkpoint, the path of a checkpoint file, or a callback receiving
+                        every checkpoint record. Rerunning with the same checkpoint skips row ids
+                        that were already deleted.
+        :type checkpoint: Union[Checkpoint, str, Callable], optional
+
+        :param on_error: Either "raise" (default) or "bisect". With "bisect", rejected chunks are
+                        split until the offending ids are isolated and a BatchResult listing the
+                        deleted ids and the failures is returned instead of raising.
+        :type on_error: str, optional
+
         :return: True if rows are successfully deleted, otherwise an exception is raised.
-        :rtype: bool
+                A BatchResult if on_error is "bisect".
+        :rtype: bool or BatchResult
 
-        :raises ValueError: If parameters are not valid.
+        :raises ValueError: If parameters are not valid or an empty list is given.
         :raises TypeError: If an item in rows_data is neither an integer nor a Row object.
-        :raises Exception: If the API request results in any error responses.
+        :raises RowDeleteError: If the API request results in any error responses. The error carries
+                        the offset of the failed chunk and the offsets of the committed chunks.
         """
 
-        # Handle Generator input by converting it to a list
-        if isinstance(rows_data, Generator):
-            rows_data = list(rows_data)
+        if isinstance(rows_data, (list, tuple)) and not rows_data:
+            raise ValueError("The rows_data list is empty. Nothing to delete.")
+
+        self._check_on_error(on_error)
 
-        # Convert Row objects to their respective IDs and validate integer inputs
-        row_ids = []
-        for item in rows_data:
-            if isinstance(item, Row):
-                row_ids.append(item.id)
-            elif isinstance(item, int):
-                if item <= 0:
-                    raise ValueError(
-                        f"Invalid row ID: {item}. Row IDs should be positive integers."
+        def _row_ids(items):
+            """
+            Helper function to convert Row objects to their IDs and validate integer inputs.
+            """
+            for index, item in enumerate(items):
+                if isinstance(item, Row):
+                    yield index, item.id
+                elif isinstance(item, int):
+                    if item <= 0:
+                        raise ValueError(
+                            f"Invalid row ID: {item}. Row IDs should be positive integers."
+                        )
+                    yield index, item
+                else:
+                    raise TypeError(
+                        f"Unsupported type {type(item)} in rows_data. Expected Row object or positive integer."
                     )
-                row_ids.append(item)
-            else:
-                raise TypeError(
-                    f"Unsupported type {type(item)} in rows_data. Expected Row object or positive integer."
-                )
 
-        if not row_ids:
-            raise ValueError("The rows_data list is empty. Nothing to delete.")
+        row_ids = _row_ids(rows_data)
+        if isinstance(rows_data, (list, tuple)):
+            row_ids = list(row_ids)
 
         def _delete_rows_chunk(chunk):
             """
@@ -731,16 +2221,807 @@ class Table:
             """
             endpoint = f"/api/database/rows/table/{self.id}/batch-delete/"
             self.client.make_api_request(endpoint, method="POST", data={"items": chunk})
+            return chunk
+
+        checkpoint = as_checkpoint(checkpoint)
+        if checkpoint is not None:
+            checkpoint.begin("delete_rows", table_id=self.id)
+            already_deleted = set(checkpoint.ids)
+            row_ids = (
+                (index, row_id)
+                for index, row_id in row_ids
+                if row_id not in already_deleted
+            )
+
+        # Batch delete rows using the specified batch size
+        if batch_size is None:
+            batch_size = self.client.batch_size
+
+        deleted_ids = []
+        failures = []
+        completed_offsets = []
+        for _, batch in self._batches(row_ids, batch_size):
+            input_indices = [index for index, _ in batch]
+            chunk = [row_id for _, row_id in batch]
+            # Offsets refer to rows_data, so they stay stable when a resumed run skips ids
+            i = input_indices[0]
+            try:
+                if on_error == "bisect":
+                    chunk_deleted, chunk_failures = self._bisect_batch(
+                        _delete_rows_chunk, chunk, input_indices
+                    )
+                    failures.extend(chunk_failures)
+                else:
+                    chunk_deleted = _delete_rows_chunk(chunk)
+            except Exception as e:
+                self.logger.error(
+                    f"Failed to delete rows from table {self.id} at offset {i}. Error: {e}"
+                )
+                raise RowDeleteError(
+                    f"Failed to delete rows at offset {i}: {e}",
+                    failed_offset=i,
+                    completed_offsets=(
+                        checkpoint.completed_offsets
+                        if checkpoint is not None
+                        else completed_offsets
+                    ),
+                )
+
+            if on_error == "bisect":
+                deleted_ids.extend(chunk_deleted)
+            completed_offsets.append(i)
+            if checkpoint is not None:
+                checkpoint.complete(i, chunk_deleted)
+
+        if on_error == "bisect":
+            return BatchResult(deleted_ids, failures)
+        return True
+
+    def _matching_rows(
+        self,
+        filters: Union[List[Filter], Expression],
+        filter_type: Optional[str],
+        include: Optional[List[str]],
+        size: int,
+        **kwargs: Any,
+    ) -> Generator[Row, None, None]:
+        """
+        Stream the rows matching filters in id order for a bulk write.
+
+        Keyset pagination fetches every page with an id filter after the last row seen, so rows
+        deleted or changed by writes in flight do not shift the following pages.
+
+        :param filters: A list of Filter objects or an Expression selecting the rows.
+        :type filters: Union[list[Filter], Expression]
+        :param filter_type: The type of filter to be applied.
+        :type filter_type: str, optional
+        :param include: The fields to fetch, or None for all fields.
+        :type include: list[str], optional
+        :param size: The number of rows per page.
+        :type size: int
+        :param kwargs: Additional parameters for `row_generator`.
+        :type kwargs: dict
+        :return: A generator of the matching rows.
+        :rtype: Generator[Row, None, None]
+        :raises ValueError: If no filters are given.
+        """
+        if not filters:
+            raise ValueError(
+                "No filters given. Use 'delete_rows' or 'update_rows' to write all rows."
+            )
+        return self.row_generator(
+            include=include,
+            filter_type=filter_type,
+            filters=filters,
+            size=min(size, 200),
+            keyset=True,
+            **kwargs,
+        )
+
+    def _pipeline_batches(
+        self,
+        batches: Iterator[Tuple[int, List[Any]]],
+        send: Callable[[List[Any]], Any],
+        max_workers: int,
+        error_class: type,
+        action: str,
+    ) -> int:
+        """
+        Send batches concurrently while the next batches are still being produced.
+
+        At most ``max_workers`` batches are in flight. If a batch fails, the batches in flight
+        are completed before the error is raised.
+
+        :param batches: The offsets and items of the batches, produced lazily.
+        :type batches: Iterator[tuple[int, list]]
+        :param send: Sends the items of one batch.
+        :type send: Callable[[list], Any]
+        :param max_workers: The maximum number of concurrent requests.
+        :type max_workers: int
+        :param error_class: The exception raised if a batch fails.
+        :type error_class: type
+        :param action: The verb used in log and error messages, e.g. 'delete'.
+        :type action: str
+        :return: The number of items sent.
+        :rtype: int
+        :raises error_class: If a batch fails. The error carries the offset of the failed
+                             batch and the offsets of the completed batches.
+        """
+        completed_offsets = []
+        failure = None
+        sent = 0
+        in_flight: Deque[Tuple[int, int, Any]] = deque()
+
+        def _wait_oldest() -> None:
+            nonlocal failure, sent
+            offset, count, future = in_flight.popleft()
+            try:
+                future.result()
+            except Exception as e:
+                if failure is None:
+                    failure = (offset, e)
+                return
+            completed_offsets.append(offset)
+            sent += count
+
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            for offset, batch in batches:
+                future = executor.submit(self.client.queue_task(send), batch)
+                in_flight.append((offset, len(batch), future))
+                while len(in_flight) >= max_workers or (
+                    failure is None and in_flight and in_flight[0][2].done()
+                ):
+                    _wait_oldest()
+                if failure is not None:
+                    break
+            while in_flight:
+                _wait_oldest()
+
+        if failure is not None:
+            offset, e = failure
+            self.logger.error(
+                f"Failed to {action} rows in table {self.id} at offset {offset}. Error: {e}"
+            )
+            raise error_class(
+                f"Failed to {action} rows at offset {offset}: {e}",
+                failed_offset=offset,
+                completed_offsets=sorted(completed_offsets),
+            )
+        return sent
+
+    def delete_where(
+        self,
+        filters: Union[List[Filter], Expression],
+        filter_type: Optional[str] = None,
+        batch_size: Optional[int] = None,
+        max_workers: int = 4,
+        **kwargs: Any,
+    ) -> int:
+        """
+        Delete all rows matching filters.
+
+        Only the ids of the matching rows are fetched. They are streamed page by page with keyset
+        pagination, which is not affected by the deletions, and deleted with concurrent
+        batch-delete requests while the next pages are fetched.
+
+        :param filters: A list of Filter objects or an Expression selecting the rows to delete.
+        :type filters: Union[list[Filter], Expression]
+        :param filter_type: The type of filter to be applied, 'AND' or 'OR'.
+        :type filter_type: str, optional
+        :param batch_size: The number of rows deleted per request. Defaults to the client's
+                        batch_size.
+        :type batch_size: int, optional
+        :param max_workers: The maximum number of concurrent delete requests. Defaults to 4.
+        :type max_workers: int, optional
+        :param kwargs: Additional parameters for `row_generator`, e.g. search or view_id.
+        :type kwargs: dict
+        :return: The number of deleted rows.
+        :rtype: int
+        :raises ValueError: If no filters are given.
+        :raises RowDeleteError: If a batch-delete request fails. The error carries the offset of
+                        the failed batch and the offsets of the completed batches.
+        """
+        if batch_size is None:
+            batch_size = self.client.batch_size
+        rows = self._matching_rows(
+            filters, filter_type, [self.primary_field], batch_size, **kwargs
+        )
+        endpoint = f"/api/database/rows/table/{self.id}/batch-delete/"
+
+        def _delete_rows_chunk(chunk):
+            """
+            Helper function to delete a chunk of rows.
+            """
+            self.client.make_api_request(endpoint, method="POST", data={"items": chunk})
+
+        deleted = self._pipeline_batches(
+            self._batches((row.id for row in rows), batch_size),
+            _delete_rows_chunk,
+            max_workers,
+            RowDeleteError,
+            "delete",
+        )
+        self.logger.info(
+            "Deleted %d row(s) matching the filters from table %s.", deleted, self.id
+        )
+        return deleted
+
+    def update_where(
+        self,
+        filters: Union[List[Filter], Expression],
+        values: Union[Dict[str, Any], Callable[[Row], Optional[Dict[str, Any]]]],
+        filter_type: Optional[str] = None,
+        include: Optional[List[str]] = None,
+        batch_size: Optional[int] = None,
+        max_workers: int = 4,
+        **kwargs: Any,
+    ) -> int:
+        """
+        Update all rows matching filters.
+
+        ``values`` is either a dictionary of field values written to every matching row, in which
+        case only the ids of the rows are fetched, or a function receiving each matching Row and
+        returning the field values to write, or None to leave the row unchanged. The rows are
+        streamed with keyset pagination, which is not affected by rows that stop matching after
+        their update, and written with concurrent batch-update requests while the next pages are
+        fetched.
+
+        :param filters: A list of Filter objects or an Expression selecting the rows to update.
+        :type filters: Union[list[Filter], Expression]
+        :param values: The field values to write, or a function computing them per row.
+        :type values: Union[dict[str, Any], Callable[[Row], Optional[dict[str, Any]]]]
+        :param filter_type: The type of filter to be applied, 'AND' or 'OR'.
+        :type filter_type: str, optional
+        :param include: With a function, the fields it reads. Defaults to all fields.
+        :type include: list[str], optional
+        :param batch_size: The number of rows updated per request. Defaults to the client's
+                        batch_size.
+        :type batch_size: int, optional
+        :param max_workers: The maximum number of concurrent update requests. Defaults to 4.
+        :type max_workers: int, optional
+        :param kwargs: Additional parameters for `row_generator`, e.g. search or view_id.
+        :type kwargs: dict
+        :return: The number of updated rows.
+        :rtype: int
+        :raises ValueError: If no filters are given or a value is not valid.
+        :raises KeyError: If a key doesn't correspond to any writable field in the table.
+        :raises RowUpdateError: If a batch-update request fails. The error carries the offset of
+                        the failed batch and the offsets of the completed batches.
+        """
+        if batch_size is None:
+            batch_size = self.client.batch_size
+
+        if callable(values):
+            rows = self._matching_rows(
+                filters, filter_type, include, batch_size, **kwargs
+            )
+
+            def _items():
+                for row in rows:
+                    changes = values(row)
+                    if changes:
+                        self._validate_update_values(changes)
+                        yield {**changes, "id": row.id}
+
+            items = _items()
+        else:
+            if not values:
+                raise ValueError("No values given. Nothing to update.")
+            self._validate_update_values(values)
+            rows = self._matching_rows(
+                filters, filter_type, [self.primary_field], batch_size, **kwargs
+            )
+            items = ({**values, "id": row.id} for row in rows)
+
+        endpoint = f"/api/database/rows/table/{self.id}/batch/?user_field_names=true"
+
+        def _update_rows_chunk(chunk):
+            """
+            Helper function to update a chunk of rows.
+            """
+            self.client.make_api_request(
+                endpoint, method="PATCH", data={"items": chunk}
+            )
+
+        updated = self._pipeline_batches(
+            self._batches(items, batch_size),
+            _update_rows_chunk,
+            max_workers,
+            RowUpdateError,
+            "update",
+        )
+        self.logger.info(
+            "Updated %d row(s) matching the filters in table %s.", updated, self.id
+        )
+        return updated
+
+    @staticmethod
+    def _prefetched(rows: Iterator[Row], depth: int) -> Generator[Row, None, None]:
+        """
+        Consume rows in a background thread, staying at most ``depth`` rows ahead of the reader.
+
+        :param rows: The rows to consume, e.g. a row generator fetching pages.
+        :type rows: Iterator[Row]
+        :param depth: The maximum number of rows fetched ahead.
+        :type depth: int
+        :yield: The rows in their original order.
+        :rtype: Generator[Row, None, None]
+        """
+        done = object()
+        rows_queue: "queue.Queue" = queue.Queue(maxsize=depth)
+        stop = threading.Event()
+
+        def _put(item: Any) -> None:
+            while not stop.is_set():
+                try:
+                    rows_queue.put(item, timeout=0.1)
+                    return
+                except queue.Full:
+                    continue
+
+        def _produce() -> None:
+            try:
+                for row in rows:
+                    if stop.is_set():
+                        return
+                    _put(row)
+            except Exception as e:
+                _put(e)
+            finally:
+                _put(done)
 
+        threading.Thread(target=_produce, daemon=True).start()
         try:
-            # Batch delete rows using the specified batch size
-            if batch_size is None:
-                batch_size = self.client.batch_size
-
-            for i in range(0, len(row_ids), batch_size):
-                chunk = row_ids[i : i + batch_size]
-                _delete_rows_chunk(chunk)
-            return True
-        except Exception as e:
-            self.logger.error(f"Failed to delete rows from table {self.id}. Error: {e}")
-            raise RowDeleteError(f"Failed to delete rows: {e}")
+            while True:
+                item = rows_queue.get()
+                if item is done:
+                    return
+                if isinstance(item, Exception):
+                    raise item
+                yield item
+        finally:
+            stop.set()
+
+    @staticmethod
+    def _mapped(
+        fn: Callable[[Any], Any],
+        items: Iterator[Tuple[int, Any]],
+        executor: Optional[Executor],
+        window: int,
+    ) -> Generator[Tuple[int, Any], None, None]:
+        """
+        Apply a function to the arguments of rows, in an executor if given, preserving their order.
+
+        :param fn: The function to apply.
+        :type fn: Callable[[Any], Any]
+        :param items: Pairs of a row id and the argument for fn.
+        :type items: Iterator[tuple[int, Any]]
+        :param executor: The executor running fn, or None to run it in the calling thread.
+        :type executor: concurrent.futures.Executor, optional
+        :param window: The maximum number of calls in flight in the executor.
+        :type window: int
+        :yield: Pairs of a row id and the result of fn.
+        :rtype: Generator[tuple[int, Any], None, None]
+        """
+        if executor is None:
+            for row_id, argument in items:
+                yield row_id, fn(argument)
+            return
+
+        in_flight: Deque[Tuple[int, Any]] = deque()
+        try:
+            for row_id, argument in items:
+                in_flight.append((row_id, executor.submit(fn, argument)))
+                if len(in_flight) >= window:
+                    row_id, future = in_flight.popleft()
+                    yield row_id, future.result()
+            while in_flight:
+                row_id, future = in_flight.popleft()
+                yield row_id, future.result()
+        finally:
+            for _, future in in_flight:
+                future.cancel()
+
+    def map_rows(
+        self,
+        fn: Callable[[Any], Optional[Dict[str, Any]]],
+        filters: Union[List[Filter], Expression, None] = None,
+        filter_type: Optional[str] = None,
+        include: Optional[List[str]] = None,
+        concurrency: int = 1,
+        processes: bool = False,
+        batch_size: Optional[int] = None,
+        max_workers: int = 4,
+        **kwargs: Any,
+    ) -> int:
+        """
+        Read rows, compute new values with a function and write them back in one pipeline.
+
+        Fetching pages, applying the function and writing batches run concurrently: a background
+        thread fetches the next pages while the function is applied to the current rows, and
+        batches of results are written by concurrent requests. Every stage only runs a bounded
+        distance ahead of the next one, so memory stays bounded and the total time approaches
+        the time of the slowest stage.
+
+        ``fn`` receives each row and returns the field values to write, or None to leave the row
+        unchanged. With ``concurrency`` above 1 it runs in a thread pool. With ``processes=True``
+        it runs in a process pool and receives ``{"id": row.id, **row.to_dict()}`` instead of the
+        Row, so it has to be picklable, e.g. a module level function.
+
+        Rows are read with keyset pagination in id order, so rows that stop matching the filters
+        after their update do not shift the following pages.
+
+        :param fn: Computes the field values to write for a row.
+        :type fn: Callable[[Row], Optional[dict[str, Any]]]
+        :param filters: A list of Filter objects or an Expression selecting the rows. Defaults to
+                        all rows.
+        :type filters: Union[list[Filter], Expression], optional
+        :param filter_type: The type of filter to be applied, 'AND' or 'OR'.
+        :type filter_type: str, optional
+        :param include: The fields fn reads. Defaults to all fields.
+        :type include: list[str], optional
+        :param concurrency: The number of workers applying fn. Defaults to 1, which applies it in
+                        the calling thread.
+        :type concurrency: int, optional
+        :param processes: If True, apply fn in a process pool. Defaults to False.
+        :type processes: bool, optional
+        :param batch_size: The number of rows per page and per update request. Defaults to the
+                        client's batch_size.
+        :type batch_size: int, optional
+        :param max_workers: The maximum number of concurrent update requests. Defaults to 4.
+        :type max_workers: int, optional
+        :param kwargs: Additional parameters for `row_generator`, e.g. search or view_id.
+        :type kwargs: dict
+        :return: The number of updated rows.
+        :rtype: int
+        :raises ValueError: If concurrency is not positive or a value is not valid.
+        :raises KeyError: If a key doesn't correspond to any writable field in the table.
+        :raises RowFetchError: If fetching rows fails.
+        :raises RowUpdateError: If an update request fails. The error carries the offset of the
+                        failed batch and the offsets of the completed batches.
+        """
+        if concurrency < 1:
+            raise ValueError("'concurrency' must be a positive integer.")
+        if batch_size is None:
+            batch_size = self.client.batch_size
+        page_size = min(batch_size, 200)
+
+        rows = self._prefetched(
+            self.row_generator(
+                include=include,
+                filter_type=filter_type,
+                filters=filters,
+                size=page_size,
+                keyset=True,
+                **kwargs,
+            ),
+            depth=2 * page_size,
+        )
+        if processes:
+            arguments = ((row.id, {"id": row.id, **row.to_dict()}) for row in rows)
+            executor = ProcessPoolExecutor(max_workers=concurrency)
+        else:
+            arguments = ((row.id, row) for row in rows)
+            executor = ThreadPoolExecutor(concurrency) if concurrency > 1 else None
+
+        def _items():
+            for row_id, changes in self._mapped(
+                fn, arguments, executor, window=2 * concurrency
+            ):
+                if changes:
+                    self._validate_update_values(changes)
+                    yield {**changes, "id": row_id}
+
+        endpoint = f"/api/database/rows/table/{self.id}/batch/?user_field_names=true"
+
+        def _update_rows_chunk(chunk):
+            """
+            Helper function to update a chunk of rows.
+            """
+            self.client.make_api_request(
+                endpoint, method="PATCH", data={"items": chunk}
+            )
+
+        try:
+            updated = self._pipeline_batches(
+                self._batches(_items(), batch_size),
+                _update_rows_chunk,
+                max_workers,
+                RowUpdateError,
+                "update",
+            )
+        finally:
+            rows.close()
+            if executor is not None:
+                executor.shutdown(wait=True, cancel_futures=True)
+
+        self.logger.info("Updated %d row(s) of table %s.", updated, self.id)
+        return updated
+
+    @staticmethod
+    def _longest_increasing_subsequence(values: List[int]) -> List[int]:
+        """
+        Find a longest strictly increasing subsequence in O(n log n).
+
+        :param values: The values to search.
+        :type values: list[int]
+        :return: The indices of the subsequence in values, in ascending order.
+        :rtype: list[int]
+        """
+        tails: List[int] = []
+        tail_indices: List[int] = []
+        previous = [-1] * len(values)
+        for index, value in enumerate(values):
+            length = bisect.bisect_left(tails, value)
+            if length == len(tails):
+                tails.append(value)
+                tail_indices.append(index)
+            else:
+                tails[length] = value
+                tail_indices[length] = index
+            previous[index] = tail_indices[length - 1] if length else -1
+
+        indices = []
+        index = tail_indices[-1] if tail_indices else -1
+        while index != -1:
+            indices.append(index)
+            index = previous[index]
+        return indices[::-1]
+
+    def reorder(self, row_ids: List[int], max_workers: int = 4) -> int:
+        """
+        Reorder rows to match the given order with as few row moves as possible.
+
+        The rows in the longest subsequence of row_ids that is already in table order stay in
+        place. Every other row is moved before the row that follows it in row_ids. Consecutive
+        moved rows are moved one after the other, from the last to the first, while separate
+        runs of moved rows are independent and moved concurrently.
+
+        Rows not listed keep their position. The listed rows are ordered among each other and
+        take up the positions between the listed rows that stay in place.
+
+        :param row_ids: The ids of the rows in the desired order.
+        :type row_ids: list[int]
+        :param max_workers: The maximum number of concurrent move requests. Defaults to 4.
+        :type max_workers: int, optional
+        :return: The number of moved rows.
+        :rtype: int
+        :raises ValueError: If an id is listed twice or does not exist in the table.
+        :raises RowMoveError: If moving a row fails. Runs of moves that started are completed
+                        before the error is raised.
+        """
+        row_ids = [int(row_id) for row_id in row_ids]
+        if len(set(row_ids)) != len(row_ids):
+            raise ValueError("The row ids to reorder contain duplicates.")
+
+        current = [
+            row.id for row in self.row_generator(include=[self.primary_field], size=200)
+        ]
+        position = {row_id: index for index, row_id in enumerate(current)}
+        missing = [row_id for row_id in row_ids if row_id not in position]
+        if missing:
+            raise ValueError(f"Rows {missing} do not exist in table {self.id}.")
+
+        kept = set(
+            self._longest_increasing_subsequence(
+                [position[row_id] for row_id in row_ids]
+            )
+        )
+        moved = {row_id for index, row_id in enumerate(row_ids) if index not in kept}
+        if not moved:
+            return 0
+
+        # Rows moved behind the last row that stays are placed before the row following it
+        last_kept = position[row_ids[max(kept)]]
+        tail_anchor = next(
+            (row_id for row_id in current[last_kept + 1 :] if row_id not in moved),
+            None,
+        )
+
+        runs: List[List[Tuple[int, Optional[int]]]] = []
+        run: List[Tuple[int, Optional[int]]] = []
+        for index in reversed(range(len(row_ids))):
+            if index in kept:
+                if run:
+                    runs.append(run)
+                    run = []
+                continue
+            before_id = row_ids[index + 1] if index + 1 < len(row_ids) else tail_anchor
+            run.append((row_ids[index], before_id))
+        if run:
+            runs.append(run)
+
+        def _move_run(moves: List[Tuple[int, Optional[int]]]) -> None:
+            """
+            Helper function to move a run of rows, the last one first.
+            """
+            for row_id, before_id in moves:
+                endpoint = f"/api/database/rows/table/{self.id}/{row_id}/move/?user_field_names=true"
+                if before_id is not None:
+                    endpoint += f"&before_id={before_id}"
+                try:
+                    self.client.make_api_request(endpoint, method="PATCH")
+                except Exception as e:
+                    raise RowMoveError(
+                        f"Failed to move row with ID {row_id}: {e}"
+                    ) from e
+
+        self.logger.debug(
+            "Moving %d of %d rows in %d runs.", len(moved), len(row_ids), len(runs)
+        )
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            futures = [
+                executor.submit(self.client.queue_task(_move_run), moves)
+                for moves in runs
+            ]
+        errors = [future.exception() for future in futures if future.exception()]
+        if errors:
+            self.logger.error(
+                f"Failed to reorder rows in table {self.id}. Error: {errors[0]}"
+            )
+            raise errors[0]
+
+        self.logger.info(
+            "Reordered %d rows of table %s with %d moves.",
+            len(row_ids),
+            self.id,
+            len(moved),
+        )
+        return len(moved)
+
+    def upload_files(
+        self,
+        field_name: str,
+        files: Union[
+            Dict[int, Union[str, List[str]]],
+            List[Tuple[Union[Row, int], Union[str, List[str]]]],
+        ],
+        replace: bool = False,
+        max_workers: int = 4,
+        retries: int = 2,
+        batch_size: Optional[int] = None,
+    ) -> BatchResult:
+        """
+        Upload attachments for many rows in parallel and store them with batch updates.
+
+        All files are uploaded through one bounded pool of concurrent uploads, then the file field
+        of every row is set with `update_rows`. A row is only updated if all of its files were
+        uploaded, so no row ends up with a partial set of attachments.
+
+        :param field_name: The name of the file field.
+        :type field_name: str
+        :param files: A mapping from row ids to a file path or a list of file paths, or a list of
+                      (Row object or row id, file path or list of file paths) pairs.
+        :type files: Union[dict[int, Union[str, list[str]]], list[tuple[Union[Row, int], Union[str, list[str]]]]]
+        :param replace: If True, the uploaded files replace the current files of each row.
+                        Otherwise they are appended. Defaults to False.
+        :type replace: bool, optional
+        :param max_workers: The maximum number of concurrent uploads. Defaults to 4.
+        :type max_workers: int, optional
+        :param retries: How often to retry a file after a connection error or a transient
+                        server error. Defaults to 2.
+        :type retries: int, optional
+        :param batch_size: The number of rows per batch update. Defaults to the client's batch_size.
+        :type batch_size: int, optional
+        :return: The updated Row objects, and a BatchFailure for every file that could not be
+                 uploaded. The item of a failure is a (row id, file path) tuple and its index the
+                 position of the file among all files.
+        :rtype: BatchResult
+        :raises ValueError: If the field is not a file field.
+        :raises RowUpdateError: If the batch update fails.
+        """
+        if not isinstance(self.fields[field_name], FileField):
+            raise ValueError(f"Field '{field_name}' is not a file field.")
+
+        uploads = []
+        rows_by_id: Dict[int, Optional[Row]] = {}
+        for row, paths in files.items() if isinstance(files, dict) else files:
+            row_id = row.id if isinstance(row, Row) else int(row)
+            rows_by_id[row_id] = row if isinstance(row, Row) else None
+            for path in [paths] if isinstance(paths, str) else paths:
+                uploads.append((row_id, path))
+
+        result = self.client.upload_files(
+            [path for _, path in uploads], max_workers=max_workers, retries=retries
+        )
+
+        failures = [
+            BatchFailure(failure.index, uploads[failure.index], failure.error)
+            for failure in result.failures
+        ]
+        failed_indices = set(result.failed_indices)
+        uploaded: Dict[int, List[Dict[str, Any]]] = {
+            row_id: [] for row_id in rows_by_id
+        }
+        descriptors = iter(result.succeeded)
+        for index, (row_id, _) in enumerate(uploads):
+            if index not in failed_indices:
+                uploaded[row_id].append(next(descriptors))
+        for failure in failures:
+            uploaded.pop(failure.item[0], None)
+
+        if not uploaded:
+            return BatchResult([], failures)
+
+        if not replace:
+            missing_ids = [row_id for row_id in uploaded if rows_by_id[row_id] is None]
+            current = self._get_field_values(missing_ids, field_name)
+            for row_id, row in rows_by_id.items():
+                if row is not None:
+                    current[row_id] = row[field_name]
+            for row_id in uploaded:
+                uploaded[row_id] = list(current.get(row_id) or []) + uploaded[row_id]
+
+        updated_rows = self.update_rows(
+            [{"id": row_id, field_name: value} for row_id, value in uploaded.items()],
+            batch_size=batch_size,
+        )
+        return BatchResult(updated_rows, failures)
+
+    def _get_field_values(self, row_ids: List[int], field_name: str) -> Dict[int, Any]:
+        """
+        Fetch the raw values of one field for the given row ids.
+
+        :param row_ids: The ids of the rows.
+        :type row_ids: list[int]
+        :param field_name: The name of the field.
+        :type field_name: str
+        :return: A mapping from row id to the raw value returned by the API.
+        :rtype: dict[int, Any]
+        """
+        result = self.get_rows_by_ids(row_ids, include=[field_name])
+        return {row.id: row._row_data.get(field_name) for row in result.succeeded}
+
+    def download_all_files(
+        self,
+        field_name: str,
+        dest: str,
+        max_workers: int = 4,
+        retries: int = 2,
+        cache_dir: Optional[str] = None,
+        overwrite: bool = False,
+        **kwargs: Any,
+    ) -> BatchResult:
+        """
+        Download the files of a file field of all rows to a local directory.
+
+        Rows are fetched with only the file field included. Files shared by several rows are
+        downloaded once, and all downloads run in parallel over the pooled connections of the
+        client. See `Baserow.download_files` for naming, resuming and integrity checks.
+
+        :param field_name: The name of the file field.
+        :type field_name: str
+        :param dest: The directory to download the files to. It is created if needed.
+        :type dest: str
+        :param max_workers: The maximum number of concurrent downloads. Defaults to 4.
+        :type max_workers: int, optional
+        :param retries: How often to retry each file after a connection error or a transient
+                        server error. Defaults to 2.
+        :type retries: int, optional
+        :param cache_dir: A directory of previously downloaded files, stored by their Baserow name.
+                          Defaults to None.
+        :type cache_dir: str, optional
+        :param overwrite: If True, existing local files that do not match are replaced.
+        :type overwrite: bool, optional
+        :param kwargs: Additional arguments for `row_generator`, e.g. filters or view_id.
+        :type kwargs: Any
+        :return: The local paths of the distinct files, and a BatchFailure for every file that
+                 could not be downloaded.
+        :rtype: BatchResult
+        :raises ValueError: If the field is not a file field.
+        """
+        if not isinstance(self.fields[field_name], FileField):
+            raise ValueError(f"Field '{field_name}' is not a file field.")
+
+        file_objs = []
+        for row in self.row_generator(include=[field_name], **kwargs):
+            file_objs.extend(row._row_data.get(field_name) or [])
+
+        return self.client.download_files(
+            file_objs,
+            dest,
+            max_workers=max_workers,
+            retries=retries,
+            cache_dir=cache_dir,
+            overwrite=overwrite,
+        )
@@ -0,0 +1,193 @@
+import io
+import logging
+import mimetypes
+import os
+import uuid
+from typing import IO, Callable, Iterable, Iterator, Optional, Union
+
+StreamSource = Union[bytes, IO[bytes], Iterable[bytes]]
+
+
+class MultipartStream:
+    """
+    A multipart/form-data request body that streams a single file without buffering it.
+
+    The body is produced chunk by chunk while it is sent, so memory use is bounded by the chunk
+    size regardless of the file size. If the size of the source is known, the stream reports its
+    length and is sent with a Content-Length header. Otherwise it reports a length of 0 and is
+    sent with chunked transfer encoding.
+
+    :ivar file_name: The file name sent to the server.
+    :vartype file_name: str
+    :ivar boundary: The multipart boundary.
+    :vartype boundary: str
+    :ivar bytes_sent: The number of body bytes produced so far.
+    :vartype bytes_sent: int
+    """
+
+    def __init__(
+        self,
+        source: StreamSource,
+        file_name: str,
+        field_name: str = "file",
+        content_type: Optional[str] = None,
+        size: Optional[int] = None,
+        chunk_size: int = 64 * 1024,
+        progress: Optional[Callable[[int, Optional[int]], None]] = None,
+    ) -> None:
+        """
+        Initialize a MultipartStream.
+
+        :param source: The file content as bytes, a readable binary file-like object, or an
+                       iterable of bytes chunks.
+        :type source: Union[bytes, IO[bytes], Iterable[bytes]]
+        :param file_name: The file name sent to the server.
+        :type file_name: str
+        :param field_name: The name of the form field. Defaults to 'file'.
+        :type field_name: str
+        :param content_type: The content type of the file. Guessed from the file name by default.
+        :type content_type: str, optional
+        :param size: The size of the file in bytes. Determined automatically for bytes and
+                     seekable file objects. Defaults to None.
+        :type size: int, optional
+        :param chunk_size: The number of bytes read from a file object at once. Defaults to 64 KiB.
+        :type chunk_size: int
+        :param progress: Called with the number of file bytes sent so far and the file size,
+                         or None if the size is unknown, after every chunk.
+        :type progress: Callable[[int, Optional[int]], None], optional
+        :raises TypeError: If the source is not bytes, a file object or an iterable.
+        """
+        if isinstance(source, (bytes, bytearray, memoryview)):
+            source = io.BytesIO(source)
+        elif not hasattr(source, "read") and not hasattr(source, "__iter__"):
+            raise TypeError(
+                f"Unsupported upload source {type(source)}. Expected bytes, a file object or an iterable of bytes."
+            )
+
+        self.source = source
+        self.file_name = file_name
+        self.chunk_size = chunk_size
+        self.progress = progress
+        self.boundary = uuid.uuid4().hex
+        self.bytes_sent = 0
+        self.logger = logging.getLogger(__name__)
+        self._start = self._tell(source)
+        self.size = size if size is not None else self._remaining_size(source)
+
+        content_type = (
+            content_type
+            or mimetypes.guess_type(file_name)[0]
+            or "application/octet-stream"
+        )
+        quoted_name = file_name.replace('"', "%22").replace("\r", "").replace("\n", "")
+        self._preamble = (
+            f"--{self.boundary}\r\n"
+            f'Content-Disposition: form-data; name="{field_name}"; filename="{quoted_name}"\r\n'
+            f"Content-Type: {content_type}\r\n\r\n"
+        ).encode()
+        self._epilogue = f"\r\n--{self.boundary}--\r\n".encode()
+
+    def __repr__(self) -> str:
+        """
+        Provide a string representation of the MultipartStream.
+
+        :return: A string including the file name and size.
+        :rtype: str
+        """
+        return f"MultipartStream(file_name={self.file_name!r}, size={self.size})"
+
+    def __len__(self) -> int:
+        """
+        The length of the encoded body, or 0 if the size of the source is unknown.
+
+        :return: The body length in bytes.
+        :rtype: int
+        """
+        if self.size is None:
+            return 0
+        return len(self._preamble) + self.size + len(self._epilogue)
+
+    def __bool__(self) -> bool:
+        """
+        A stream is always truthy, even if its length is unknown and reported as 0.
+
+        :return: True
+        :rtype: bool
+        """
+        return True
+
+    def __iter__(self) -> Iterator[bytes]:
+        """
+        Produce the encoded body.
+
+        :return: An iterator over the body chunks.
+        :rtype: Iterator[bytes]
+        """
+        self.bytes_sent = 0
+        file_bytes = 0
+        yield self._emit(self._preamble)
+        for chunk in self._chunks():
+            if chunk:
+                file_bytes += len(chunk)
+                yield self._emit(bytes(chunk))
+                if self.progress is not None:
+                    self.progress(file_bytes, self.size)
+        yield self._emit(self._epilogue)
+
+    @property
+    def content_type(self) -> str:
+        """
+        The Content-Type header of the request, including the boundary.
+
+        :return: The content type.
+        :rtype: str
+        """
+        return f"multipart/form-data; boundary={self.boundary}"
+
+    @property
+    def rewindable(self) -> bool:
+        """
+        Whether the body can be produced again, e.g. to retry a failed upload.
+
+        :return: True if the source is a seekable file object.
+        :rtype: bool
+        """
+        return self._start is not None
+
+    def rewind(self) -> None:
+        """
+        Move a seekable source back to where the first upload attempt started.
+
+        :raises io.UnsupportedOperation: If the source cannot be rewound.
+        """
+        if self._start is None:
+            raise io.UnsupportedOperation("The upload source cannot be rewound.")
+        self.source.seek(self._start)
+
+    def _emit(self, chunk: bytes) -> bytes:
+        self.bytes_sent += len(chunk)
+        return chunk
+
+    def _chunks(self) -> Iterator[bytes]:
+        if hasattr(self.source, "read"):
+            return iter(lambda: self.source.read(self.chunk_size), b"")
+        return iter(self.source)
+
+    @staticmethod
+    def _tell(source: StreamSource) -> Optional[int]:
+        try:
+            if hasattr(source, "seekable") and source.seekable():
+                return source.tell()
+        except (OSError, ValueError):
+            pass
+        return None
+
+    def _remaining_size(self, source: StreamSource) -> Optional[int]:
+        if self._start is None:
+            return None
+        try:
+            return os.fstat(source.fileno()).st_size - self._start
+        except (AttributeError, OSError, io.UnsupportedOperation):
+            end = source.seek(0, io.SEEK_END)
+            source.seek(self._start)
+            return end - self._start
@@ -0,0 +1,245 @@
+import hashlib
+import json
+import logging
+import os
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Dict, Optional, Tuple, Union
+
+
+def content_hash(source: Any, chunk_size: int = 1024 * 1024) -> Optional[str]:
+    """
+    Compute the SHA-256 hash of upload content without consuming it.
+
+    Bytes are hashed directly. Seekable file objects are read from their current position,
+    which is restored afterwards, so the content can still be uploaded. Other sources, like
+    generators, cannot be read twice and are not hashed.
+
+    :param source: Bytes, a binary file object or an iterable of bytes.
+    :type source: Any
+    :param chunk_size: The number of bytes read from a file object at once. Defaults to 1 MiB.
+    :type chunk_size: int
+    :return: The hex digest of the content, or None if the source cannot be hashed.
+    :rtype: str, optional
+    """
+    if isinstance(source, (bytes, bytearray, memoryview)):
+        return hashlib.sha256(source).hexdigest()
+    try:
+        if not (hasattr(source, "read") and source.seekable()):
+            return None
+        start = source.tell()
+    except (OSError, ValueError):
+        return None
+    digest = hashlib.sha256()
+    for chunk in iter(lambda: source.read(chunk_size), b""):
+        digest.update(chunk)
+    source.seek(start)
+    return digest.hexdigest()
+
+
+class UploadCache:
+    """
+    Maps the content hash of uploaded files to the user file descriptors returned by Baserow.
+
+    A client with an upload cache skips the transfer of a file whose content was uploaded to the
+    same Baserow instance before and reuses the stored descriptor instead. Entries are evicted
+    in least recently used order once `max_entries` is exceeded, and expire after `max_age`
+    seconds if set.
+
+    If a path is given, the cache persists across processes as a JSON lines file. Every new
+    entry is appended as a single line, and the file is compacted once it holds twice as many
+    lines as live entries.
+
+    :ivar path: The path of the cache file, or None for an in-memory cache.
+    :vartype path: str, optional
+    :ivar max_entries: The maximum number of cached descriptors.
+    :vartype max_entries: int
+    :ivar max_age: The number of seconds after which an entry expires, or None.
+    :vartype max_age: float, optional
+    :ivar hits: The number of uploads answered from the cache.
+    :vartype hits: int
+    :ivar misses: The number of lookups that required an upload.
+    :vartype misses: int
+    """
+
+    def __init__(
+        self,
+        path: Optional[Union[str, os.PathLike]] = None,
+        max_entries: int = 10000,
+        max_age: Optional[float] = None,
+    ) -> None:
+        """
+        Initialize an UploadCache and load its file, if any.
+
+        :param path: The path of the cache file. It is created on first use. Defaults to None,
+                     which keeps the cache in memory only.
+        :type path: str or os.PathLike, optional
+        :param max_entries: The maximum number of cached descriptors. Defaults to 10000.
+        :type max_entries: int
+        :param max_age: The number of seconds after which an entry expires. Defaults to None,
+                        which keeps entries until they are evicted.
+        :type max_age: float, optional
+        :raises ValueError: If max_entries is not positive.
+        """
+        if max_entries < 1:
+            raise ValueError("'max_entries' must be a positive integer.")
+        self.path = os.fspath(path) if path is not None else None
+        self.max_entries = max_entries
+        self.max_age = max_age
+        self.hits = 0
+        self.misses = 0
+        self.logger = logging.getLogger(__name__)
+        self._entries: "OrderedDict[Tuple[str, str], Tuple[float, Dict[str, Any]]]" = (
+            OrderedDict()
+        )
+        self._lines = 0
+        self._lock = threading.Lock()
+        if self.path is not None:
+            self._load()
+
+    def __repr__(self) -> str:
+        """
+        Provide a string representation of the UploadCache.
+
+        :return: A string including the path and the number of entries.
+        :rtype: str
+        """
+        return f"UploadCache({self.path!r}, entries={len(self)})"
+
+    def __len__(self) -> int:
+        """
+        The number of cached descriptors.
+
+        :return: The number of entries.
+        :rtype: int
+        """
+        return len(self._entries)
+
+    def _load(self) -> None:
+        """
+        Read the cache file, keeping the most recent entry of every key.
+        """
+        if not os.path.exists(self.path):
+            return
+        with open(self.path, "rb") as f:
+            for line in f:
+                try:
+                    if not line.endswith(b"\n"):
+                        raise ValueError("Incomplete line.")
+                    record = json.loads(line)
+                    key = (record["url"], record["sha256"])
+                except (ValueError, KeyError, TypeError):
+                    self.logger.warning(
+                        "Discarding invalid record in upload cache %s.", self.path
+                    )
+                    continue
+                self._lines += 1
+                self._entries.pop(key, None)
+                if record.get("file") is not None:
+                    self._entries[key] = (record["time"], record["file"])
+        self._evict()
+
+    def _expired(self, stored_at: float) -> bool:
+        return self.max_age is not None and time.time() - stored_at > self.max_age
+
+    def _evict(self) -> None:
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+
+    def _write(self, url: str, sha256: str, file: Optional[Dict[str, Any]]) -> None:
+        """
+        Append a record to the cache file and compact it if it grew too large.
+        """
+        if self.path is None:
+            return
+        record = {"url": url, "sha256": sha256, "time": time.time(), "file": file}
+        with open(self.path, "a", encoding="utf-8") as f:
+            f.write(json.dumps(record) + "\n")
+        self._lines += 1
+        if self._lines > 2 * max(len(self._entries), 100):
+            self._compact()
+
+    def _compact(self) -> None:
+        """
+        Rewrite the cache file with the live entries only.
+        """
+        temporary_path = f"{self.path}.tmp"
+        with open(temporary_path, "w", encoding="utf-8") as f:
+            for (url, sha256), (stored_at, file) in self._entries.items():
+                record = {"url": url, "sha256": sha256, "time": stored_at, "file": file}
+                f.write(json.dumps(record) + "\n")
+        os.replace(temporary_path, self.path)
+        self._lines = len(self._entries)
+
+    def get(
+        self, url: str, sha256: str, file_name: Optional[str] = None
+    ) -> Optional[Dict[str, Any]]:
+        """
+        Look up the descriptor of previously uploaded content.
+
+        :param url: The base URL of the Baserow instance.
+        :type url: str
+        :param sha256: The SHA-256 hex digest of the content.
+        :type sha256: str
+        :param file_name: If given, the visible name of the returned descriptor is set to it.
+        :type file_name: str, optional
+        :return: A copy of the cached descriptor, or None if the content is not cached.
+        :rtype: dict[str, Any], optional
+        """
+        key = (url.rstrip("/"), sha256)
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None or self._expired(entry[0]):
+                if entry is not None:
+                    del self._entries[key]
+                self.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+        file = dict(entry[1])
+        if file_name is not None:
+            file["visible_name"] = file_name
+        return file
+
+    def put(self, url: str, sha256: str, file: Dict[str, Any]) -> None:
+        """
+        Store the descriptor Baserow returned for uploaded content.
+
+        :param url: The base URL of the Baserow instance.
+        :type url: str
+        :param sha256: The SHA-256 hex digest of the content.
+        :type sha256: str
+        :param file: The user file descriptor returned by Baserow.
+        :type file: dict[str, Any]
+        """
+        key = (url.rstrip("/"), sha256)
+        with self._lock:
+            self._entries.pop(key, None)
+            self._entries[key] = (time.time(), dict(file))
+            self._evict()
+            self._write(key[0], sha256, file)
+
+    def invalidate(self, url: str, sha256: str) -> None:
+        """
+        Remove an entry, e.g. after the user file was deleted from Baserow.
+
+        :param url: The base URL of the Baserow instance.
+        :type url: str
+        :param sha256: The SHA-256 hex digest of the content.
+        :type sha256: str
+        """
+        key = (url.rstrip("/"), sha256)
+        with self._lock:
+            if self._entries.pop(key, None) is not None:
+                self._write(key[0], sha256, None)
+
+    def clear(self) -> None:
+        """
+        Remove all entries and the cache file.
+        """
+        with self._lock:
+            self._entries.clear()
+            self._lines = 0
+            if self.path is not None and os.path.exists(self.path):
+                os.remove(self.path)
@@ -70,7 +70,12 @@ class FilterValidator:
         filter_type = filter_obj.operator
         filter_value = filter_obj.value
 
-        FilterValidator.logger.debug(f"Validating filter: field='{filter_name}', type='{filter_type}', value='{filter_value}'")
+        FilterValidator.logger.debug(
+            "Validating filter: field='%s', type='%s', value='%s'",
+            filter_name,
+            filter_type,
+            filter_value,
+        )
         field = table.fields[filter_name]
         if not FilterValidator._validate_single_filter(filter_type, filter_value, field):
             FilterValidator.logger.error(f"Invalid filter '{filter_type}' with value '{filter_value}' for field type '{field.TYPE}'")
@@ -0,0 +1,19 @@
+from conftest import NUM_ROWS
+
+
+def bench_replay_row_generator(benchmark, replayed_table):
+    def consume():
+        rows = [row.values for row in replayed_table.row_generator(size=200)]
+        replayed_table.client.cassette.rewind()
+        return rows
+
+    assert len(benchmark(consume)) == NUM_ROWS
+
+
+def bench_replay_to_dict(benchmark, replayed_table):
+    def consume():
+        rows = [row.to_dict() for row in replayed_table.row_generator(size=200)]
+        replayed_table.client.cassette.rewind()
+        return rows
+
+    assert len(benchmark(consume)) == NUM_ROWS
@@ -0,0 +1,50 @@
+import pytest
+
+from baserowapi import Row
+from conftest import make_row
+
+
+@pytest.fixture(scope="module")
+def rows_data(mock_server, populated_table):
+    return mock_server.rows(populated_table.id)
+
+
+def bench_row_materialization(benchmark, populated_table, client, rows_data):
+    def materialize():
+        return [
+            Row(row_data=row_data, table=populated_table, client=client).values
+            for row_data in rows_data
+        ]
+
+    assert len(benchmark(materialize)) == len(rows_data)
+
+
+def bench_row_to_dict(benchmark, populated_table, client, rows_data):
+    rows = [
+        Row(row_data=row_data, table=populated_table, client=client)
+        for row_data in rows_data
+    ]
+    benchmark(lambda: [row.to_dict() for row in rows])
+
+
+def bench_row_changed_fields(benchmark, populated_table, client, rows_data):
+    rows = [
+        Row(row_data=row_data, table=populated_table, client=client)
+        for row_data in rows_data
+    ]
+    benchmark(lambda: [row.changed_fields() for row in rows])
+
+
+def bench_field_validation(benchmark, populated_table):
+    fields = {field.name: field for field in populated_table.fields}
+    values = [
+        (fields[name], value)
+        for i in range(1000)
+        for name, value in make_row(i).items()
+    ]
+
+    def validate():
+        for field, value in values:
+            field.validate_value(value)
+
+    benchmark(validate)
@@ -0,0 +1,98 @@
+"""
+Measure the cost of building Row objects and their values without a Baserow server.
+
+Run from the repository root with ``PYTHONPATH=. python benchmarks/bench_row_construction.py``,
+or without ``PYTHONPATH`` after ``pip install -e .``. Pass ``--debug`` to enable
+DEBUG logging (to a null handler) and compare with the default level.
+"""
+
+import argparse
+import logging
+import timeit
+
+from baserowapi import Baserow, Row, Table
+from baserowapi.models.fields.field_list import FieldList
+
+FIELDS_DATA = [
+    {"id": 1, "name": "Name", "type": "text", "primary": True},
+    {"id": 2, "name": "Notes", "type": "long_text"},
+    {"id": 3, "name": "Active", "type": "boolean"},
+    {"id": 4, "name": "Count", "type": "number", "number_decimal_places": 0},
+    {"id": 5, "name": "Email", "type": "email"},
+    {"id": 6, "name": "Website", "type": "url"},
+    {"id": 7, "name": "Phone", "type": "phone_number"},
+    {"id": 8, "name": "Rating", "type": "rating", "max_value": 5},
+]
+
+ROW_DATA = {
+    "id": 1,
+    "order": "1.00000000000000000000",
+    "Name": "Test Name",
+    "Notes": "Sample note for testing",
+    "Active": True,
+    "Count": "42",
+    "Email": "test@example.com",
+    "Website": "https://example.com",
+    "Phone": "+1 555 0100",
+    "Rating": 3,
+}
+
+
+def build_table(client: Baserow) -> Table:
+    """
+    Build a table whose fields are populated from static field data.
+    """
+    table = Table(table_id=1, client=client)
+    table._fields = FieldList(
+        [
+            Table._field_class_from_data(field_data)(
+                field_data["name"], field_data, client
+            )
+            for field_data in FIELDS_DATA
+        ]
+    )
+    return table
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--rows", type=int, default=20000)
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--debug", action="store_true")
+    args = parser.parse_args()
+
+    client = Baserow(url="http://localhost", token="benchmark")
+    package_logger = logging.getLogger("baserowapi")
+    for handler in list(package_logger.handlers):
+        package_logger.removeHandler(handler)
+    package_logger.addHandler(logging.NullHandler())
+    package_logger.setLevel(logging.DEBUG if args.debug else logging.WARNING)
+
+    table = build_table(client)
+
+    def build_rows() -> None:
+        for _ in range(args.rows):
+            list(Row(row_data=dict(ROW_DATA), table=table, client=client).values)
+
+    def read_one_field() -> None:
+        for _ in range(args.rows):
+            Row(row_data=dict(ROW_DATA), table=table, client=client)["Name"]
+
+    def convert_rows() -> None:
+        for _ in range(args.rows):
+            Row(row_data=dict(ROW_DATA), table=table, client=client).typed()
+
+    for label, fn in (
+        (f"{len(FIELDS_DATA)} fields", build_rows),
+        ("1 field read", read_one_field),
+        (f"{len(FIELDS_DATA)} native values", convert_rows),
+    ):
+        best = min(timeit.repeat(fn, number=1, repeat=args.repeat))
+        print(
+            f"{args.rows} rows x {label}: {best:.3f}s, "
+            f"{best / args.rows * 1e6:.1f} us per row"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,55 @@
+from conftest import NUM_ROWS, make_row
+
+
+def bench_row_generator_offset(benchmark, populated_table):
+    rows = benchmark(lambda: list(populated_table.row_generator(size=200)))
+    assert len(rows) == NUM_ROWS
+
+
+def bench_row_generator_keyset(benchmark, populated_table):
+    rows = benchmark(lambda: list(populated_table.row_generator(size=200, keyset=True)))
+    assert len(rows) == NUM_ROWS
+
+
+def bench_add_rows(benchmark, empty_table):
+    rows_data = [make_row(i) for i in range(1000)]
+    benchmark.pedantic(
+        empty_table.add_rows,
+        args=(rows_data,),
+        kwargs={"batch_size": 200},
+        setup=empty_table.reset,
+        rounds=5,
+    )
+
+
+def bench_add_rows_returning_ids(benchmark, empty_table):
+    rows_data = [make_row(i) for i in range(1000)]
+    benchmark.pedantic(
+        empty_table.add_rows,
+        args=(rows_data,),
+        kwargs={"batch_size": 200, "returning": "ids"},
+        setup=empty_table.reset,
+        rounds=5,
+    )
+
+
+def bench_update_rows(benchmark, empty_table):
+    ids = [row.id for row in empty_table.add_rows([make_row(i) for i in range(1000)])]
+    rows_data = [{"id": row_id, "Name": f"Updated {row_id}"} for row_id in ids]
+    benchmark.pedantic(
+        empty_table.update_rows,
+        args=(rows_data,),
+        kwargs={"batch_size": 200},
+        rounds=5,
+    )
+
+
+def bench_update_rows_skip_unchanged(benchmark, empty_table):
+    rows = empty_table.add_rows([make_row(i) for i in range(1000)])
+    empty_table.update_rows(rows, skip_unchanged=True)
+    benchmark.pedantic(
+        empty_table.update_rows,
+        args=(rows,),
+        kwargs={"skip_unchanged": True},
+        rounds=5,
+    )
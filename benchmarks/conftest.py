@@ -0,0 +1,95 @@
+import pytest
+
+from baserowapi import Baserow, Cassette
+from baserowapi.mock_server import MockBaserowServer
+
+TABLE_ID = 1
+NUM_ROWS = 2000
+
+FIELDS = [
+    {"name": "Name", "type": "text"},
+    {"name": "Notes", "type": "long_text"},
+    {"name": "Active", "type": "boolean"},
+    {"name": "Number", "type": "number", "number_decimal_places": 2},
+    {"name": "Rating", "type": "rating", "max_value": 5},
+    {
+        "name": "EU Date",
+        "type": "date",
+        "date_format": "EU",
+        "date_include_time": False,
+    },
+    {"name": "URL", "type": "url"},
+    {"name": "Email", "type": "email"},
+    {"name": "Phone", "type": "phone_number"},
+    {
+        "name": "SingleSelect",
+        "type": "single_select",
+        "select_options": [
+            {"id": 1, "value": "Option 1", "color": "blue"},
+            {"id": 2, "value": "Option 2", "color": "red"},
+        ],
+    },
+    {"name": "Formula", "type": "formula", "formula_type": "text"},
+]
+
+
+def make_row(i):
+    return {
+        "Name": f"Row {i}",
+        "Notes": "Sample note for benchmarking " * 4,
+        "Active": i % 2 == 0,
+        "Number": i,
+        "Rating": i % 6,
+        "EU Date": "2024-08-06",
+        "URL": f"https://example.com/{i}",
+        "Email": f"user{i}@example.com",
+        "Phone": "+1 555 0100",
+        "SingleSelect": 1 + i % 2,
+    }
+
+
+@pytest.fixture(scope="session")
+def mock_server():
+    with MockBaserowServer(page_size=200) as server:
+        yield server
+
+
+@pytest.fixture(scope="session")
+def client(mock_server):
+    return mock_server.client()
+
+
+@pytest.fixture(scope="session")
+def populated_table(mock_server, client):
+    mock_server.add_table(TABLE_ID, FIELDS, rows=[make_row(i) for i in range(NUM_ROWS)])
+    return client.get_table(TABLE_ID)
+
+
+@pytest.fixture
+def empty_table(mock_server, client):
+    table_id = TABLE_ID + 1
+    mock_server.add_table(table_id, FIELDS)
+    table = client.get_table(table_id)
+
+    def reset():
+        mock_server.add_table(table_id, FIELDS)
+
+    table.reset = reset
+    return table
+
+
+@pytest.fixture(scope="session")
+def cassette_path(tmp_path_factory, mock_server, populated_table):
+    path = tmp_path_factory.mktemp("cassettes") / "rows.cassette"
+    with Cassette(path, mode="record") as cassette:
+        table = mock_server.client(cassette=cassette).get_table(TABLE_ID)
+        table.fields
+        list(table.row_generator(size=200))
+    return path
+
+
+@pytest.fixture
+def replayed_table(cassette_path):
+    with Cassette(cassette_path) as cassette:
+        client = Baserow(url="http://replay.invalid", token="replay", cassette=cassette)
+        yield client.get_table(TABLE_ID)
@@ -0,0 +1,21 @@
+from baserowapi import Baserow, Cassette
+from baserowapi.mock_server import MockBaserowServer
+
+
+def test_cassette_record_and_replay(tmp_path):
+    cassette_path = tmp_path / "rows.cassette"
+
+    # Step 1: Record the exchanges of a client against a mock server
+    with MockBaserowServer(page_size=2) as server:
+        server.add_table(1, [{"name": "Name", "type": "text"}], rows=[{"Name": f"Row {i}"} for i in range(5)])
+        with Cassette(cassette_path, mode="record") as cassette:
+            recorded_rows = server.client(cassette=cassette).get_table(1).get_rows()
+            recorded_data = [row.to_dict() for row in recorded_rows]
+
+    # Step 2: Replay the exchanges with the server stopped
+    with Cassette(cassette_path) as cassette:
+        client = Baserow(url="http://replay.invalid", token="token", cassette=cassette)
+        replayed_data = [row.to_dict() for row in client.get_table(1).get_rows()]
+
+    # Step 3: Verify that the replayed rows match the recorded ones
+    assert replayed_data == recorded_data
@@ -0,0 +1,56 @@
+import logging
+
+import pytest
+
+from baserowapi import Baserow
+
+
+@pytest.fixture
+def package_logger():
+    # Restore the handlers, level and propagation of the package logger after the test
+    logger = logging.getLogger("baserowapi")
+    state = (list(logger.handlers), logger.level, logger.propagate)
+    yield logger
+    for handler in logger.handlers:
+        if handler not in state[0]:
+            handler.close()
+    logger.handlers[:] = state[0]
+    logger.setLevel(state[1])
+    logger.propagate = state[2]
+
+
+def test_client_has_no_logging_side_effects(package_logger):
+    # Step 1: Remember the logging setup
+    root_handlers = list(logging.getLogger().handlers)
+    handlers = list(package_logger.handlers)
+    package_logger.setLevel(logging.ERROR)
+
+    # Step 2: A client without logging options leaves it untouched
+    Baserow(token="token")
+    assert logging.getLogger().handlers == root_handlers
+    assert package_logger.handlers == handlers
+    assert package_logger.level == logging.ERROR
+    assert package_logger.propagate
+    assert any(isinstance(h, logging.NullHandler) for h in package_logger.handlers)
+
+
+def test_configure_logging_on_opt_in(package_logger, tmp_path):
+    # Step 1: With a configured root logger, records propagate without a console handler
+    root_logger = logging.getLogger()
+    root_handler = logging.NullHandler()
+    root_logger.addHandler(root_handler)
+    try:
+        handlers = list(package_logger.handlers)
+        Baserow(token="token", logging_level=logging.DEBUG)
+        assert package_logger.handlers == handlers
+        assert package_logger.level == logging.DEBUG
+
+        # Step 2: A log file adds one file handler, which a second client replaces
+        log_file = tmp_path / "baserow.log"
+        Baserow(token="token", log_file=str(log_file))
+        Baserow(token="token", logging_level="INFO", log_file=str(log_file))
+        added = [h for h in package_logger.handlers if h not in handlers]
+        assert [type(h) for h in added] == [logging.FileHandler]
+        assert package_logger.level == logging.INFO
+    finally:
+        root_logger.removeHandler(root_handler)
@@ -0,0 +1,20 @@
+from baserowapi import RequestMetrics
+
+
+def test_request_metrics_hook(baserow_client, all_fields_table):
+    # Step 1: Register a metrics hook on the client
+    metrics = RequestMetrics()
+    baserow_client.add_request_hook(metrics)
+
+    try:
+        # Step 2: Make a request to the rows endpoint
+        all_fields_table.get_rows()
+
+        # Step 3: Verify that the request was recorded with its endpoint template
+        endpoint = "/api/database/rows/table/{id}/"
+        assert metrics.count(method="GET", endpoint=endpoint) >= 1, "The request was not recorded."
+        assert metrics.error_rate(endpoint=endpoint) == 0.0, "Unexpected failed requests."
+        assert metrics.percentile(50, endpoint=endpoint) > 0, "Expected a positive latency."
+    finally:
+        # Step 4: Clean up by removing the hook
+        baserow_client.remove_request_hook(metrics)
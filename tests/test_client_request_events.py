@@ -0,0 +1,44 @@
+import io
+
+import requests
+
+from baserowapi.mock_server import MockBaserowServer
+
+
+def test_request_events_report_retries_queue_and_downloads(tmp_path, monkeypatch):
+    # Step 1: Start a slow mock server and collect the events of a client
+    with MockBaserowServer(latency=0.02) as server:
+        events = []
+        client = server.client(on_request=events.append)
+
+        # Step 2: Queued uploads report their wait, a retried upload its attempt
+        perform_request = client.perform_request
+        failures = [requests.exceptions.ConnectionError("Connection reset")]
+
+        def flaky_request(method, url, *args, **kwargs):
+            if failures and "upload-file" in url:
+                raise failures.pop()
+            return perform_request(method, url, *args, **kwargs)
+
+        monkeypatch.setattr(client, "perform_request", flaky_request)
+        sources = [io.BytesIO(b"file %d" % i) for i in range(3)]
+        result = client.upload_files(sources, max_workers=1)
+        assert result.ok
+        assert [(event.retries, event.error is None) for event in events] == [
+            (0, False),
+            (1, True),
+            (0, True),
+            (0, True),
+        ]
+        assert events[1].queued == 0.0
+        assert events[3].queued > events[2].queued > 0.01
+
+        # Step 3: Downloads are reported to the hooks like API requests
+        events.clear()
+        file_objs = result.succeeded
+        client.download_files(file_objs, str(tmp_path), max_workers=1)
+        assert [(event.method, event.endpoint) for event in events] == [
+            ("GET", "/media/user_files/" + file_obj["name"]) for file_obj in file_objs
+        ]
+        assert [event.bytes_received for event in events] == [6, 6, 6]
+        assert events[2].queued > 0.01
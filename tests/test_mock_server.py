@@ -0,0 +1,24 @@
+from baserowapi import Filter
+from baserowapi.mock_server import MockBaserowServer
+
+
+def test_mock_server_round_trip():
+    # Step 1: Start a mock server with a small table
+    with MockBaserowServer(page_size=2) as server:
+        server.add_table(
+            1,
+            [{"name": "Name", "type": "text"}, {"name": "Number", "type": "number"}],
+        )
+        table = server.client().get_table(1)
+
+        # Step 2: Add rows and read them back across several pages
+        created_rows = table.add_rows([{"Name": f"Row {i}", "Number": i} for i in range(5)])
+        fetched_rows = table.get_rows()
+        assert [row["Name"] for row in fetched_rows] == [f"Row {i}" for i in range(5)]
+
+        # Step 3: Verify filtering, updating and deleting
+        assert len(table.get_rows(filters=[Filter("Number", 2, "higher_than")])) == 2
+        table.update_rows([{"id": created_rows[0].id, "Name": "Updated"}])
+        assert table.get_row(created_rows[0].id)["Name"] == "Updated"
+        table.delete_rows([row.id for row in created_rows])
+        assert server.rows(1) == []
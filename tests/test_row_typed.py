@@ -0,0 +1,121 @@
+from datetime import date, datetime, timezone
+from decimal import Decimal
+
+import pytest
+
+from baserowapi.mock_server import MockBaserowServer
+from baserowapi.models.fields import FormulaField, LookupField
+
+
+def test_native_values():
+    # Step 1: Start a mock server with a table of typed fields
+    with MockBaserowServer() as server:
+        server.add_table(
+            1,
+            [
+                {"name": "Name", "type": "text"},
+                {"name": "Count", "type": "number"},
+                {"name": "Price", "type": "number", "number_decimal_places": 2},
+                {"name": "Done", "type": "boolean"},
+                {"name": "Day", "type": "date", "date_include_time": False},
+                {
+                    "name": "Due",
+                    "type": "date",
+                    "date_include_time": True,
+                    "date_force_timezone": "Europe/Berlin",
+                },
+                {
+                    "name": "Status",
+                    "type": "single_select",
+                    "select_options": [{"id": 1, "value": "open", "color": "blue"}],
+                },
+                {"name": "Links", "type": "link_row", "link_row_table_id": 1},
+            ],
+            rows=[
+                {
+                    "Name": "First",
+                    "Count": 3,
+                    "Price": "9.99",
+                    "Done": True,
+                    "Day": "2024-02-29",
+                    "Due": "2024-06-01T10:00:00Z",
+                    "Status": 1,
+                    "Links": [2],
+                },
+                {"Name": "Second"},
+            ],
+        )
+        table = server.client().get_table(1)
+
+        # Step 2: Row.typed() converts every value to its native type
+        row = table.get_row(1)
+        due = datetime(2024, 6, 1, 10, tzinfo=timezone.utc)
+        assert row.typed() == {
+            "Name": "First",
+            "Count": 3,
+            "Price": Decimal("9.99"),
+            "Done": True,
+            "Day": date(2024, 2, 29),
+            "Due": due,
+            "Status": "open",
+            "Links": [2],
+        }
+        assert row.typed()["Due"].utcoffset().total_seconds() == 7200
+        assert not row.values.is_built("Price")
+        assert row["Price"] == "9.99"
+
+        # Step 3: Rows fetched with types="native" return native values
+        rows = table.get_rows(types="native")
+        assert rows[0]["Count"] == 3
+        assert rows[0].to_dict() == row.typed()
+        assert rows[1]["Count"] is None
+        assert rows[1]["Links"] == []
+        assert rows[1]["Status"] is None
+
+        # Step 4: Values set on a native row are read back converted, and update still works
+        rows[0].update({"Done": False})
+        assert rows[0]["Done"] is False
+        assert rows[0]["Count"] == 3
+        assert table.get_row(1)["Done"] is False
+
+        # Step 5: The converter is chosen once per field
+        field = table.fields["Price"]
+        assert field.native_converter is field.native_converter
+
+        with pytest.raises(ValueError):
+            table.get_rows(types="python")
+
+
+def test_formula_and_lookup_converters():
+    number = FormulaField(
+        "Total",
+        {"type": "formula", "formula_type": "number", "number_decimal_places": 1},
+    )
+    assert number.native_converter("1.5") == Decimal("1.5")
+
+    dates = FormulaField(
+        "Dates",
+        {
+            "type": "formula",
+            "formula_type": "array",
+            "array_formula_type": "date",
+            "date_include_time": False,
+        },
+    )
+    assert dates.native_converter([{"id": 1, "value": "2024-01-02"}]) == [
+        date(2024, 1, 2)
+    ]
+
+    lookup = LookupField(
+        "Flags",
+        {
+            "type": "lookup",
+            "read_only": True,
+            "formula_type": "array",
+            "array_formula_type": "boolean",
+        },
+    )
+    assert lookup.native_converter([{"id": 1, "value": True}, {"id": 2}]) == [
+        True,
+        None,
+    ]
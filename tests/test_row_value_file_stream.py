@@ -0,0 +1,44 @@
+import io
+import os
+
+from baserowapi.mock_server import MockBaserowServer
+
+
+def test_file_row_value_upload_from_stream():
+    bike = os.path.join(os.path.dirname(__file__), "bike.jpg")
+    with open(bike, "rb") as f:
+        content = f.read()
+
+    # Step 1: Start a mock server with a table containing a file field
+    with MockBaserowServer() as server:
+        server.add_table(
+            1,
+            [{"name": "Name", "type": "text"}, {"name": "FileField", "type": "file"}],
+            rows=[{"Name": "Row 1"}],
+        )
+        client = server.client()
+        row = client.get_table(1).get_row(1)
+
+        # Step 2: Upload a file object of known size and a generator of unknown size
+        progress = []
+        row.values["FileField"].upload_file_to_server(
+            stream=io.BytesIO(content),
+            file_name="bike.jpg",
+            progress=lambda sent, total: progress.append((sent, total)),
+        )
+        chunks = (content[i : i + 1000] for i in range(0, len(content), 1000))
+        row.values["FileField"].upload_file_to_server(
+            stream=chunks, file_name="chunks.jpg"
+        )
+        row.update()
+
+        # Step 3: Verify both uploads arrived complete
+        files = server.rows(1)[0]["FileField"]
+        assert [file["visible_name"] for file in files] == ["bike.jpg", "chunks.jpg"]
+        assert files[0]["size"] == files[1]["size"] == len(content)
+        assert files[0]["name"].split("_")[1] == files[1]["name"].split("_")[1]
+        assert progress[-1] == (len(content), len(content))
+
+        # Step 4: Download one of them and compare it to the original
+        response = client.session.get(files[1]["url"])
+        assert response.content == content
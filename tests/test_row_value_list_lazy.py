@@ -0,0 +1,47 @@
+import pytest
+
+from baserowapi.exceptions import RowFetchError
+from baserowapi.mock_server import MockBaserowServer
+
+
+def test_row_values_are_built_per_cell():
+    # Step 1: Start a mock server with a wide table
+    fields = [{"name": f"Field {i}", "type": "text"} for i in range(50)]
+    with MockBaserowServer() as server:
+        server.add_table(
+            1,
+            fields,
+            rows=[{f"Field {i}": f"Value {i}" for i in range(50)}],
+        )
+        table = server.client().get_table(1)
+        row = table.get_row(1)
+
+        # Step 2: Reading one field only builds its RowValue, and caches it
+        assert row["Field 7"] == "Value 7"
+        assert [name for name in row.values.fields if row.values.is_built(name)] == [
+            "Field 7"
+        ]
+        assert row.values["Field 7"] is row.values["Field 7"]
+        assert len(row.values) == 50
+        assert "Field 49" in row.values
+        assert not row.values.is_built("Field 49")
+
+        # Step 3: Unmodified values that were never read are not built to find changes
+        row["Field 3"] = "Changed"
+        assert row.changed_fields() == {"Field 3": "Changed"}
+        assert not row.values.is_built("Field 49")
+
+        # Step 4: Iteration and to_dict still cover every field in order
+        assert [rv.name for rv in row.values] == [f"Field {i}" for i in range(50)]
+        assert row.to_dict() == {
+            **{f"Field {i}": f"Value {i}" for i in range(50)},
+            "Field 3": "Changed",
+        }
+
+        # Step 5: Unknown fields in the row data fail when they are accessed
+        row = table.get_row(1)
+        row._row_data = {**row._row_data, "Unknown": 1}
+        row._values = None
+        assert row["Field 1"] == "Value 1"
+        with pytest.raises(RowFetchError):
+            row.to_dict()
@@ -0,0 +1,70 @@
+import time
+
+import requests
+
+from baserowapi.mock_server import MockBaserowServer
+
+
+def wait_for(condition, timeout=5.0):
+    deadline = time.monotonic() + timeout
+    while not condition():
+        assert time.monotonic() < deadline, "Condition not reached in time."
+        time.sleep(0.01)
+
+
+def test_row_writer(tmp_path, monkeypatch):
+    # Step 1: Start a mock server with an empty table
+    with MockBaserowServer() as server:
+        server.add_table(
+            1,
+            [{"name": "Name", "type": "text"}, {"name": "Count", "type": "number"}],
+        )
+        client = server.client()
+        table = client.get_table(1)
+        table.fields
+
+        # Step 2: Full batches are sent right away, the rest when it is flushed
+        requests_before = server.request_count
+        with table.writer(max_batch=10, max_latency_ms=10000) as writer:
+            writer.extend([{"Name": f"Row {i}"} for i in range(25)])
+            wait_for(lambda: writer.written == 20)
+            assert writer.pending == 5
+        assert writer.written == 25
+        assert server.request_count - requests_before == 3
+
+        # Step 3: A single row is sent once it waited max_latency_ms
+        rejected = []
+        writer = table.writer(
+            max_latency_ms=50, on_error=lambda rows, e: rejected.extend(rows)
+        )
+        writer.append({"Name": "Late"})
+        wait_for(lambda: writer.written == 1)
+
+        # Step 4: Rows rejected by the server are reported, the others are added
+        writer.extend([{"Name": "Ok", "Count": 1}, {"Count": "abc"}, {"Name": "Ok"}])
+        assert writer.flush()
+        assert rejected == [{"Count": "abc"}]
+        assert (writer.written, writer.failed) == (3, 1)
+        writer.close()
+        assert len(table.get_rows()) == 28
+
+        # Step 5: While Baserow is down, spooled rows are kept and sent by the next writer
+        spool_path = tmp_path / "rows.spool"
+        make_api_request = client.make_api_request
+
+        def unreachable(*args, **kwargs):
+            raise requests.exceptions.ConnectionError("Baserow is down")
+
+        monkeypatch.setattr(client, "make_api_request", unreachable)
+        writer = table.writer(spool_path=spool_path, on_error=lambda rows, e: None)
+        writer.extend([{"Name": f"Spooled {i}"} for i in range(5)])
+        assert not writer.flush()
+        writer.close()
+        assert writer.pending == 5
+
+        monkeypatch.setattr(client, "make_api_request", make_api_request)
+        with table.writer(spool_path=spool_path) as writer:
+            assert writer.pending == 5
+        assert writer.written == 5
+        assert spool_path.read_text() == ""
+        assert len(table.get_rows()) == 33
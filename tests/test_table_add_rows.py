@@ -1,3 +1,4 @@
+from baserowapi import FileCheckpoint
 from .helper_functions.generate_identical_rows import generate_identical_rows
 
 def test_create_row(all_fields_table, single_row_data):
@@ -63,3 +64,45 @@ def test_create_multiple_identical_rows(all_fields_table, single_row_data):
 
     # Cleanup: Delete all the rows after the test using the correct id attribute
     all_fields_table.delete_rows([row.id for row in created_rows])
+
+
+def test_add_rows_resume_from_checkpoint(all_fields_table, single_row_data, tmp_path):
+    multiple_rows_data = generate_identical_rows(single_row_data, num_rows=6)
+    input_data = [
+        {key: value["input"] for key, value in row.items() if not value["read_only"]}
+        for row in multiple_rows_data
+    ]
+    checkpoint_path = tmp_path / "add_rows.checkpoint"
+
+    # First run adds all rows and records every chunk
+    created_rows = all_fields_table.add_rows(
+        input_data, batch_size=2, checkpoint=checkpoint_path
+    )
+    assert len(created_rows) == 6
+
+    # Rerunning with the same checkpoint does not create duplicates
+    rerun_rows = all_fields_table.add_rows(
+        input_data, batch_size=2, checkpoint=checkpoint_path
+    )
+    assert rerun_rows == [], "Completed chunks should have been skipped."
+
+    checkpoint = FileCheckpoint(checkpoint_path)
+    checkpoint.begin("add_rows", table_id=all_fields_table.id, batch_size=2)
+    assert checkpoint.ids == [row.id for row in created_rows]
+
+    # Clean up
+    all_fields_table.delete_rows(checkpoint.ids)
+
+
+def test_add_rows_bisect_isolates_invalid_rows(all_fields_table):
+    input_data = [{"Name": f"Row {i}", "Number": 1} for i in range(5)]
+    input_data[3]["Number"] = "not a number"
+
+    result = all_fields_table.add_rows(input_data, batch_size=5, on_error="bisect")
+
+    assert result.failed_indices == [3], "Only the invalid row should have failed."
+    assert result.failures[0].status_code == 400
+    assert [row["Name"] for row in result.succeeded] == ["Row 0", "Row 1", "Row 2", "Row 4"]
+
+    # Clean up
+    all_fields_table.delete_rows(result.succeeded)
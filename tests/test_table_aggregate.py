@@ -0,0 +1,35 @@
+import statistics
+
+from baserowapi import Filter
+from baserowapi.mock_server import MockBaserowServer
+
+
+def test_table_count_and_aggregate():
+    amounts = [3, 1, 4, 1, 5, 9, 2, 6]
+
+    # Step 1: Start a mock server with a table containing a number field
+    with MockBaserowServer() as server:
+        server.add_table(
+            1,
+            [{"name": "Name", "type": "text"}, {"name": "Amount", "type": "number"}],
+            rows=[{"Name": f"Row {i}", "Amount": str(a)} for i, a in enumerate(amounts)]
+            + [{"Name": "Empty"}],
+        )
+        table = server.client().get_table(1)
+
+        # Step 2: Count rows with a single request
+        table.fields
+        requests_before = server.request_count
+        assert table.count() == len(amounts) + 1
+        assert table.count(filters=[Filter("Name", "Empty")]) == 1
+        assert server.request_count == requests_before + 2
+
+        # Step 3: Verify the local aggregations
+        assert table.aggregate("Amount", "sum") == sum(amounts)
+        assert table.aggregate("Amount", "max") == 9
+        assert table.aggregate("Amount", "median") == statistics.median(amounts)
+        assert table.aggregate("Amount", "std_dev") == statistics.pstdev(amounts)
+        assert table.aggregate("Amount", "empty_count") == 1
+        assert table.aggregate("Amount", "unique_count") == len(set(amounts))
+        filters = [Filter("Amount", 4, "higher_than")]
+        assert table.aggregate("Amount", "average", filters=filters) == 20 / 3
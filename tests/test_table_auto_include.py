@@ -0,0 +1,62 @@
+import pytest
+
+from baserowapi.mock_server import MockBaserowServer
+
+
+def test_row_generator_learns_included_fields():
+    # Step 1: Start a mock server with a wide table and a small page size
+    with MockBaserowServer(page_size=10) as server:
+        server.add_table(
+            1,
+            [{"name": "Name", "type": "text"}]
+            + [{"name": f"Notes {i}", "type": "long_text"} for i in range(10)],
+            rows=[
+                {"Name": f"Row {n}", **{f"Notes {i}": "x" * 100 for i in range(10)}}
+                for n in range(40)
+            ],
+        )
+        table = server.client().get_table(1)
+
+        # Step 2: Read one field from every row, and another one from a late row
+        rows = []
+        for row in table.get_rows(auto_include=True, iterator=True):
+            rows.append(row)
+            assert row["Name"] == f"Row {row.id - 1}"
+            if row.id == 25:
+                assert row["Notes 3"] == "x" * 100
+
+        # Step 3: Verify that only the sampled page was fetched with all fields
+        assert len(rows[0].fields) == 11
+        assert rows[10].fields == ["Name"]
+        assert rows[24].fields == ["Name", "Notes 3"]
+        assert rows[29].fields == ["Name"]
+        assert rows[39].fields == ["Name", "Notes 3"]
+
+        # Step 4: Verify that fields which were not loaded cannot be changed
+        with pytest.raises(KeyError, match="was not loaded"):
+            rows[10]["Notes 1"] = "changed"
+        rows[10]["Name"] = "Changed"
+        rows[10].update()
+        assert server.rows(1)[10]["Name"] == "Changed"
+        assert server.rows(1)[10]["Notes 1"] == "x" * 100
+
+
+def test_get_rows_auto_include_requires_iterator():
+    with MockBaserowServer(page_size=10) as server:
+        server.add_table(
+            1,
+            [{"name": "Name", "type": "text"}, {"name": "Notes", "type": "long_text"}],
+            rows=[{"Name": f"Row {n}", "Notes": "x"} for n in range(50)],
+        )
+        table = server.client().get_table(1)
+        table.fields
+
+        # A list is complete before any field is read, so no fields could be learned
+        requests_before = server.request_count
+        with pytest.raises(ValueError, match="iterator=True"):
+            table.get_rows(auto_include=True)
+        assert server.request_count == requests_before
+
+        rows = table.get_rows()
+        assert [row["Notes"] for row in rows] == ["x"] * 50
+        assert server.request_count - requests_before == 5
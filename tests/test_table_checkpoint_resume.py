@@ -0,0 +1,82 @@
+import pytest
+
+from baserowapi import FileCheckpoint
+from baserowapi.exceptions import BaserowHTTPError, RowDeleteError, RowUpdateError
+from baserowapi.mock_server import MockBaserowServer
+
+
+def test_resume_after_two_interruptions(tmp_path, monkeypatch):
+    # Step 1: Start a mock server with 8 rows and fail requests containing a chosen row id
+    with MockBaserowServer() as server:
+        server.add_table(
+            1,
+            [{"name": "Name", "type": "text"}],
+            rows=[{"Name": f"Row {i}"} for i in range(1, 9)],
+        )
+        client = server.client()
+        table = client.get_table(1)
+        table.fields
+
+        make_api_request = client.make_api_request
+        failing_id = None
+        sent_ids = []
+
+        def flaky_request(endpoint, method="GET", data=None, **kwargs):
+            if "batch" in endpoint and method != "GET":
+                ids = [
+                    item["id"] if isinstance(item, dict) else item
+                    for item in data["items"]
+                ]
+                if failing_id in ids:
+                    raise BaserowHTTPError(503, "Unavailable")
+                sent_ids.extend(ids)
+            return make_api_request(endpoint, method=method, data=data, **kwargs)
+
+        monkeypatch.setattr(client, "make_api_request", flaky_request)
+
+        # Step 2: An update interrupted twice sends every row exactly once
+        checkpoint_path = tmp_path / "update.checkpoint"
+        updates = [{"id": i, "Name": f"Updated {i}"} for i in range(1, 9)]
+        failing_id = 5
+        with pytest.raises(RowUpdateError) as error:
+            table.update_rows(updates, batch_size=2, checkpoint=checkpoint_path)
+        assert (error.value.failed_offset, error.value.completed_offsets) == (4, [0, 2])
+
+        # The second run skips rows 1-4, offsets still refer to the input
+        failing_id = 7
+        with pytest.raises(RowUpdateError) as error:
+            table.update_rows(updates, batch_size=2, checkpoint=checkpoint_path)
+        assert (error.value.failed_offset, error.value.completed_offsets) == (
+            6,
+            [0, 2, 4],
+        )
+
+        failing_id = None
+        table.update_rows(updates, batch_size=2, checkpoint=checkpoint_path)
+        assert sent_ids == list(range(1, 9))
+        assert FileCheckpoint(checkpoint_path).load()[-1] == {
+            "offset": 6,
+            "ids": [7, 8],
+        }
+
+        # Step 3: A delete interrupted twice deletes every id exactly once
+        sent_ids.clear()
+        checkpoint_path = tmp_path / "delete.checkpoint"
+        failing_id = 3
+        with pytest.raises(RowDeleteError):
+            table.delete_rows(
+                list(range(1, 9)), batch_size=2, checkpoint=checkpoint_path
+            )
+        failing_id = 6
+        with pytest.raises(RowDeleteError) as error:
+            table.delete_rows(
+                list(range(1, 9)), batch_size=2, checkpoint=checkpoint_path
+            )
+        assert (error.value.failed_offset, error.value.completed_offsets) == (4, [0, 2])
+
+        failing_id = None
+        assert table.delete_rows(
+            list(range(1, 9)), batch_size=2, checkpoint=checkpoint_path
+        )
+        assert sent_ids == list(range(1, 9))
+        assert table.count() == 0
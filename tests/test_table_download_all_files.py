@@ -0,0 +1,55 @@
+import os
+
+from baserowapi.mock_server import MockBaserowServer
+
+
+def test_download_all_files_deduplicates_and_resumes(tmp_path):
+    bike = os.path.join(os.path.dirname(__file__), "bike.jpg")
+    wheel = os.path.join(os.path.dirname(__file__), "bike_wheel.jpg")
+
+    # Step 1: Start a mock server with two rows sharing one file
+    with MockBaserowServer() as server:
+        server.add_table(
+            1,
+            [{"name": "Name", "type": "text"}, {"name": "FileField", "type": "file"}],
+            rows=[{"Name": "Row 1"}, {"Name": "Row 2"}],
+        )
+        table = server.client().get_table(1)
+        table.upload_files("FileField", {1: [bike, wheel], 2: [bike]})
+
+        # Step 2: Leave a partial download of one file behind
+        with open(bike, "rb") as f:
+            bike_content = f.read()
+        (tmp_path / "bike.jpg.part").write_bytes(bike_content[:1000])
+
+        # Step 3: Download all files of the field
+        result = table.download_all_files("FileField", str(tmp_path), max_workers=4)
+
+        # Step 4: Verify that each distinct file was downloaded once and completed
+        assert result.ok, f"Unexpected failures: {result.failures}"
+        assert sorted(os.listdir(tmp_path)) == ["bike.jpg", "bike_wheel.jpg"]
+        assert (tmp_path / "bike.jpg").read_bytes() == bike_content
+
+
+def test_row_value_download_skips_different_existing_files(tmp_path):
+    bike = os.path.join(os.path.dirname(__file__), "bike.jpg")
+
+    # Step 1: Start a mock server with a row holding one file
+    with MockBaserowServer() as server:
+        server.add_table(
+            1,
+            [{"name": "Name", "type": "text"}, {"name": "FileField", "type": "file"}],
+            rows=[{"Name": "Row 1"}],
+        )
+        table = server.client().get_table(1)
+        table.upload_files("FileField", {1: [bike]})
+        value = table.get_row(1).values["FileField"]
+
+        # Step 2: A different existing file is skipped unless overwrite is set
+        (tmp_path / "bike.jpg").write_bytes(b"other content")
+        assert value.download_files(str(tmp_path)) == []
+        assert (tmp_path / "bike.jpg").read_bytes() == b"other content"
+
+        assert value.download_files(str(tmp_path), overwrite=True) == ["bike.jpg"]
+        with open(bike, "rb") as f:
+            assert (tmp_path / "bike.jpg").read_bytes() == f.read()
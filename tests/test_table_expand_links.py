@@ -0,0 +1,58 @@
+import pytest
+
+from baserowapi.exceptions import InvalidRowValueError
+from baserowapi.mock_server import MockBaserowServer
+
+
+def test_expand_links():
+    # Step 1: Start a mock server with customers, orders and order lines
+    with MockBaserowServer() as server:
+        server.add_table(
+            1,
+            [{"name": "Name", "type": "text"}, {"name": "City", "type": "text"}],
+            rows=[{"Name": f"Customer {i}", "City": f"City {i}"} for i in range(5)],
+        )
+        server.add_table(
+            2,
+            [
+                {"name": "Number", "type": "text"},
+                {"name": "Customer", "type": "link_row", "link_row_table_id": 1},
+            ],
+            rows=[{"Number": f"O{i}", "Customer": [i % 5 + 1]} for i in range(20)],
+        )
+        server.add_table(
+            3,
+            [
+                {"name": "Line", "type": "text"},
+                {"name": "Order", "type": "link_row", "link_row_table_id": 2},
+            ],
+            rows=[{"Line": f"L{i}", "Order": [i % 20 + 1, 99]} for i in range(60)],
+        )
+        table = server.client().get_table(3)
+        table.fields
+
+        # Step 2: Expand the orders and their customers of all lines
+        requests_before = server.request_count
+        rows = table.get_rows(
+            size=30,
+            expand={"Order.Customer": ["Name"], "Order": ["Number"]},
+        )
+
+        # Step 3: Verify the linked rows and that they were fetched in batches
+        assert len(rows) == 60
+        orders = rows[21].values["Order"].linked_rows
+        assert [order["Number"] for order in orders] == ["O1"]
+        customers = orders[0].values["Customer"].linked_rows
+        assert [customer["Name"] for customer in customers] == ["Customer 1"]
+        assert "City" not in customers[0].values
+        assert orders[0] is rows[1].values["Order"].linked_rows[0]
+        assert server.request_count - requests_before < 15
+
+        # Step 4: Links that were not expanded cannot be resolved
+        row = table.get_rows(limit=1)[0]
+        with pytest.raises(InvalidRowValueError):
+            row.values["Order"].linked_rows
+
+        # Step 5: Only link fields can be expanded
+        with pytest.raises(ValueError):
+            table.get_rows(expand=["Line"])
@@ -0,0 +1,73 @@
+import pytest
+
+from baserowapi import F
+from baserowapi.mock_server import MockBaserowServer
+
+PEOPLE = [
+    ("Ada", 36, "London"),
+    ("Grace", 85, "New York"),
+    ("Alan", 41, "London"),
+    ("Edsger", 72, "Rotterdam"),
+    ("Barbara", 30, "New York"),
+]
+
+
+def test_expression_filters_push_down_and_filter_locally():
+    # Step 1: Start a mock server with a table of people
+    with MockBaserowServer() as server:
+        server.add_table(
+            1,
+            [
+                {"name": "Name", "type": "text"},
+                {"name": "Age", "type": "number"},
+                {"name": "City", "type": "text"},
+                {"name": "Joined", "type": "date", "date_include_time": False},
+            ],
+            rows=[{"Name": n, "Age": str(a), "City": c} for n, a, c in PEOPLE],
+        )
+        table = server.client().get_table(1)
+
+        # Step 2: Compile an expression that Baserow can evaluate completely
+        expression = (F("Age") > 35) & (
+            (F("City") == "London") | F("Name").contains("gr")
+        )
+        filter_tree, remainder = expression.compile(table)
+        assert remainder is None
+        assert filter_tree["filter_type"] == "AND"
+        assert filter_tree["groups"][0]["filter_type"] == "OR"
+        names = [row["Name"] for row in table.get_rows(filters=expression)]
+        assert names == ["Ada", "Grace", "Alan"]
+
+        # Step 3: Evaluate unsupported conditions locally on the narrowed rows
+        expression = (F("City") == "London") & F("Name").matches("^A.a$")
+        filter_tree, remainder = expression.compile(table)
+        assert filter_tree["filters"] == [
+            {"field": "City", "type": "equal", "value": "London"}
+        ]
+        assert [row["Name"] for row in table.get_rows(filters=expression)] == ["Ada"]
+        assert table.count(filters=expression) == 1
+        assert table.count(filters=~(F("City") == "London")) == 3
+
+        # Step 4: A text field cannot be compared on the server, so ordering is local
+        rows = table.get_rows(filters=F("Name") > "C", keyset=True, include=["Age"])
+        assert [row.id for row in rows] == [2, 4]
+
+        # Step 5: Unknown fields and unsupported filter types fail at compile time
+        with pytest.raises(ValueError):
+            (F("Missing") == 1).compile(table)
+        with pytest.raises(ValueError):
+            F("Age").filter("date_is", "today").compile(table)
+
+        # Step 6: An 'or' group evaluated locally must not contain server-only filters
+        expression = F("Joined").filter("date_equal", "2024-01-02") | F("Name").matches(
+            "^A"
+        )
+        with pytest.raises(ValueError, match="date_equal"):
+            expression.compile(table)
+        with pytest.raises(ValueError, match="date_equal"):
+            table.get_rows(filters=expression)
+        filter_tree, remainder = (
+            (F("Joined").filter("date_equal", "2024-01-02") & (F("Age") > 1))
+            | (F("Age") > 80)
+        ).compile(table)
+        assert remainder is None
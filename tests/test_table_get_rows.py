@@ -282,3 +282,41 @@ def test_get_rows_with_date_filter(all_fields_table, single_row_data):
     if created_row_ids:
         all_fields_table.delete_rows(created_row_ids)
 
+
+
+def test_get_rows_keyset_pagination(all_fields_table, single_row_data):
+    # Create enough rows to span several small pages
+    num_rows = 7
+    multiple_rows_data = generate_identical_rows(single_row_data, num_rows=num_rows)
+    created_rows = all_fields_table.add_rows([
+        {key: value["input"] for key, value in row.items() if not value["read_only"]}
+        for row in multiple_rows_data
+    ])
+    created_row_ids = sorted(row.id for row in created_rows)
+    created = set(created_row_ids)
+
+    # Keyset pagination returns all rows ordered by id. The shared table may hold
+    # other rows, so only the created ids are compared.
+    fetched_ids = [row.id for row in all_fields_table.get_rows(keyset=True, size=3)]
+    assert fetched_ids == sorted(set(fetched_ids))
+    assert [row_id for row_id in fetched_ids if row_id in created] == created_row_ids
+
+    # Resuming after an id only returns the remaining rows
+    resumed_ids = [
+        row.id
+        for row in all_fields_table.get_rows(
+            keyset=True, size=3, after_id=created_row_ids[2]
+        )
+    ]
+    assert all(row_id > created_row_ids[2] for row_id in resumed_ids)
+    assert [row_id for row_id in resumed_ids if row_id in created] == created_row_ids[3:]
+
+    # Sharded fetching returns every row exactly once
+    sharded_ids = [
+        row.id for row in all_fields_table.get_rows(keyset=True, size=2, shards=3)
+    ]
+    assert len(sharded_ids) == len(set(sharded_ids))
+    assert sorted(row_id for row_id in sharded_ids if row_id in created) == created_row_ids
+
+    # Clean up
+    all_fields_table.delete_rows(created_row_ids)
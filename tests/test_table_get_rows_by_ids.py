@@ -0,0 +1,43 @@
+from baserowapi.mock_server import MockBaserowServer
+
+
+def test_get_rows_by_ids_and_values():
+    # Step 1: Start a mock server with a table of 1000 rows
+    with MockBaserowServer() as server:
+        server.add_table(
+            1,
+            [{"name": "Name", "type": "text"}, {"name": "Code", "type": "number"}],
+            rows=[{"Name": f"Row {i}", "Code": str(i * 10)} for i in range(1000)],
+        )
+        table = server.client().get_table(1)
+        table.fields
+
+        # Step 2: Fetch 500 rows by id in shuffled order, including missing ids
+        row_ids = list(range(1000, 0, -2)) + [5000, 7]
+        requests_before = server.request_count
+        result = table.get_rows_by_ids(row_ids, include=["Name"])
+
+        # Step 3: Verify the order, the missing id and the number of requests
+        assert [row.id for row in result.succeeded] == row_ids[:500] + [7]
+        assert result.succeeded[0]["Name"] == "Row 999"
+        assert result.failed_indices == [500]
+        assert result.failures[0].item == 5000
+        assert 1 < server.request_count - requests_before < 20
+
+        # Step 4: Look up rows by the values of another field
+        result = table.get_rows_by_values("Code", [30, "10", 12345], include=["Name"])
+        assert [row["Name"] for row in result.succeeded] == ["Row 3", "Row 1"]
+        assert result.failures[0].item == 12345
+
+        # Step 5: Large decimal values are matched exactly
+        server.add_table(
+            2,
+            [{"name": "Amount", "type": "number", "number_decimal_places": 1}],
+            rows=[{"Amount": "12345678901234567.1"}, {"Amount": "12345678901234567.2"}],
+        )
+        amounts = server.client().get_table(2)
+        result = amounts.get_rows_by_values(
+            "Amount", ["12345678901234567.20", "12345678901234567.3"]
+        )
+        assert [row.id for row in result.succeeded] == [2]
+        assert result.failed_indices == [1]
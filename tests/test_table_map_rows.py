@@ -0,0 +1,66 @@
+import time
+
+from baserowapi import Filter
+from baserowapi.mock_server import MockBaserowServer
+
+
+def double_count(row):
+    return {"Count": int(row["Count"]) * 2}
+
+
+def test_map_rows_pipeline():
+    # Step 1: Start a mock server with 400 rows and some request latency
+    with MockBaserowServer(latency=0.02) as server:
+        server.add_table(
+            1,
+            [
+                {"name": "Name", "type": "text"},
+                {"name": "Status", "type": "text"},
+                {"name": "Count", "type": "number"},
+            ],
+            rows=[
+                {"Name": f"Row {i}", "Status": "new", "Count": i} for i in range(400)
+            ],
+        )
+        client = server.client()
+        client.batch_size = 50
+        table = client.get_table(1)
+        table.fields
+
+        # Step 2: Transform the rows in a thread pool while pages are fetched and written
+        def slow_transform(row):
+            time.sleep(0.005)
+            return {"Name": row["Name"].upper(), "Status": "done"}
+
+        started = time.perf_counter()
+        updated = table.map_rows(
+            slow_transform,
+            filters=[Filter("Status", "new")],
+            include=["Name"],
+            concurrency=8,
+        )
+        elapsed = time.perf_counter() - started
+
+        # Step 3: Verify the results, and that the stages overlapped
+        assert updated == 400
+        assert table.count(filters=[Filter("Status", "done")]) == 400
+        assert table.get_row(7)["Name"] == "ROW 6"
+        # In strict phases, the function alone would take 2 seconds
+        assert elapsed < 1.5
+
+        # Step 4: Rows the function returns None for are left unchanged
+        updated = table.map_rows(
+            lambda row: {"Status": "odd"} if int(row["Count"]) % 2 else None,
+            include=["Count"],
+        )
+        assert updated == 200
+
+        # Step 5: Apply a picklable function in a process pool
+        updated = table.map_rows(
+            double_count,
+            filters=[Filter("Status", "odd")],
+            concurrency=2,
+            processes=True,
+        )
+        assert updated == 200
+        assert int(table.get_row(2)["Count"]) == 2
@@ -0,0 +1,49 @@
+import random
+
+import pytest
+
+from baserowapi.mock_server import MockBaserowServer
+
+
+def test_reorder_rows():
+    # Step 1: Start a mock server with 500 rows
+    with MockBaserowServer() as server:
+        server.add_table(
+            1,
+            [{"name": "Name", "type": "text"}],
+            rows=[{"Name": f"Row {i}"} for i in range(500)],
+        )
+        table = server.client().get_table(1)
+        table.fields
+
+        def table_order():
+            return [row.id for row in table.get_rows(include=["Name"])]
+
+        # Step 2: Move a few rows of an otherwise sorted table
+        desired = list(range(1, 501))
+        for row_id in (7, 250, 499):
+            desired.remove(row_id)
+        desired = [499] + desired[:100] + [250] + desired[100:] + [7]
+        requests_before = server.request_count
+        assert table.reorder(desired) == 3
+        # Three pages of row ids and one request per moved row
+        assert server.request_count - requests_before == 6
+        assert table_order() == desired
+
+        # Step 3: A random permutation ends up in the desired order
+        random.Random(4).shuffle(desired)
+        assert table.reorder(desired, max_workers=8) < 500
+        assert table_order() == desired
+        assert table.reorder(desired) == 0
+
+        # Step 4: Only the listed rows are reordered among each other
+        current = table_order()
+        subset = current[10:20][::-1]
+        assert table.reorder(subset) == 9
+        assert table_order() == current[:10] + subset + current[20:]
+
+        # Step 5: Unknown and duplicate ids are rejected
+        with pytest.raises(ValueError):
+            table.reorder([1, 1])
+        with pytest.raises(ValueError):
+            table.reorder([1, 9999])
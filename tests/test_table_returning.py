@@ -0,0 +1,52 @@
+import pytest
+
+from baserowapi.mock_server import MockBaserowServer
+from baserowapi.models.row import Row
+
+
+def test_write_operations_returning():
+    # Step 1: Start a mock server with an empty table
+    with MockBaserowServer() as server:
+        server.add_table(
+            1,
+            [{"name": "Name", "type": "text"}, {"name": "Count", "type": "number"}],
+        )
+        client = server.client()
+        client.batch_size = 10
+        table = client.get_table(1)
+
+        # Step 2: Add rows returning ids, raw data or nothing
+        rows_data = [{"Name": f"Row {i}", "Count": i} for i in range(25)]
+        ids = table.add_rows(rows_data[:10], returning="ids")
+        assert ids == list(range(1, 11))
+        raw = table.add_rows(rows_data[10:20], returning="raw")
+        assert raw[0]["Name"] == "Row 10" and isinstance(raw[0], dict)
+        assert table.add_rows(rows_data[20:], returning="none") is None
+        assert len(table.get_rows()) == 25
+
+        # Step 3: Stream raw batches and collect bisected results as ids
+        batches = table.update_rows(
+            ({"id": row_id, "Count": 1} for row_id in range(1, 26)),
+            return_rows=False,
+            returning="raw",
+        )
+        assert [len(batch) for batch in batches] == [10, 10, 5]
+        result = table.update_rows(
+            [{"id": 1, "Count": 2}, {"id": 999, "Count": 2}],
+            on_error="bisect",
+            returning="ids",
+        )
+        assert result.succeeded == [1]
+        assert result.failed_indices == [1]
+        assert isinstance(table.update_rows([{"id": 2}])[0], Row)
+
+        # Step 4: Update a single row without rebuilding its values right away
+        row = table.get_row(3)
+        assert row.update({"Name": "Changed"}, returning="ids") == 3
+        assert row._values is None
+        assert row["Name"] == "Changed"
+        assert row.update({"Name": "Raw"}, returning="raw")["Name"] == "Raw"
+
+        # Step 5: Unknown representations are rejected
+        with pytest.raises(ValueError):
+            table.add_rows(rows_data, returning="objects")
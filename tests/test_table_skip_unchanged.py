@@ -0,0 +1,71 @@
+from baserowapi.mock_server import MockBaserowServer
+
+
+def test_skip_unchanged_digest_store():
+    # Step 1: Start a mock server with 10 rows
+    with MockBaserowServer() as server:
+        server.add_table(
+            1,
+            [{"name": "Name", "type": "text"}],
+            rows=[{"Name": f"Row {i}"} for i in range(10)],
+        )
+        client = server.client()
+        records = [{"id": i, "Name": f"Synced {i}"} for i in range(1, 11)]
+
+        # Step 2: A persistent store lets a later Table instance skip the rows sent before
+        digests = {}
+        result = client.get_table(1).update_rows(
+            records, skip_unchanged=digests, on_error="bisect"
+        )
+        assert (len(result.succeeded), result.skipped) == (10, 0)
+        assert len(digests) == 10
+
+        records[3]["Name"] = "Changed"
+        table = client.get_table(1)
+        table.fields
+        requests_before = server.request_count
+        result = table.update_rows(records, skip_unchanged=digests, on_error="bisect")
+        assert [row.id for row in result.succeeded] == [4]
+        assert result.skipped == 9
+        assert server.request_count - requests_before == 1
+
+        # Step 3: The digests kept by a Table are limited to the most recently written rows
+        table = client.get_table(1)
+        table.MAX_ROW_DIGESTS = 4
+        table.update_rows(records, skip_unchanged=True)
+        assert list(table._row_digests) == ["7", "8", "9", "10"]
+        result = table.update_rows(records, skip_unchanged=True, on_error="bisect")
+        assert (len(result.succeeded), result.skipped) == (6, 4)
+
+
+def test_skip_unchanged_reports_skipped_rows_in_every_mode():
+    # Step 1: Start a mock server with 4 rows and send them once
+    with MockBaserowServer() as server:
+        server.add_table(
+            1,
+            [{"name": "Name", "type": "text"}],
+            rows=[{"Name": f"Row {i}"} for i in range(4)],
+        )
+        table = server.client().get_table(1)
+        records = [{"id": i, "Name": f"Synced {i}"} for i in range(1, 5)]
+        table.update_rows(records, skip_unchanged=True)
+
+        # Step 2: The default mode passes the skip count to on_skipped
+        records[0]["Name"] = "Changed"
+        skipped = []
+        rows = table.update_rows(
+            records, skip_unchanged=True, on_skipped=skipped.append
+        )
+        assert [row.id for row in rows] == [1]
+        assert skipped == [3]
+
+        # Step 3: Batch iterators report it once they are exhausted
+        batches = table.update_rows(
+            records,
+            batch_size=1,
+            skip_unchanged=True,
+            return_rows=False,
+            on_skipped=skipped.append,
+        )
+        assert list(batches) == []
+        assert skipped == [3, 4]
@@ -0,0 +1,54 @@
+import pytest
+
+from baserowapi.exceptions import RowAddError
+from baserowapi.mock_server import MockBaserowServer
+
+
+def test_writes_consume_generators_lazily():
+    # Step 1: Start a mock server with an empty table
+    with MockBaserowServer() as server:
+        server.add_table(
+            1,
+            [{"name": "Name", "type": "text"}, {"name": "Count", "type": "number"}],
+        )
+        client = server.client()
+        client.batch_size = 10
+        table = client.get_table(1)
+        table.fields
+
+        # Step 2: Add rows from a generator and record the requests made before each row is read
+        requests_seen = []
+
+        def new_rows():
+            for i in range(35):
+                requests_seen.append(server.request_count)
+                yield {"Name": f"Row {i}", "Count": i}
+
+        requests_before = server.request_count
+        batches = table.add_rows(new_rows(), return_rows=False)
+        assert requests_seen == []
+
+        # Step 3: Verify that one batch is added per step and only its rows were read
+        first_ids = next(batches)
+        assert len(first_ids) == 10
+        assert len(requests_seen) == 10
+        assert [len(ids) for ids in batches] == [10, 10, 5]
+        assert requests_seen[25] == requests_before + 2
+
+        # Step 4: Pipe the row generator through a transform into update_rows
+        updated = table.update_rows(
+            {"id": row.id, "Count": int(row["Count"]) * 2}
+            for row in table.row_generator(size=10)
+        )
+        assert len(updated) == 35
+        assert int(table.get_row(first_ids[3])["Count"]) == 6
+
+        # Step 5: Delete rows from a generator
+        assert table.delete_rows(row.id for row in table.get_rows() if row.id % 2)
+        assert len(table.get_rows()) == 17
+
+        # Step 6: Rows of a generator are validated batch by batch
+        invalid_rows = ({"Name": "Ok"} if i < 15 else {"Missing": 1} for i in range(20))
+        with pytest.raises(RowAddError):
+            table.add_rows(invalid_rows)
+        assert len(table.get_rows()) == 27
@@ -101,4 +101,26 @@ def test_update_and_delete_with_missing_rows(all_fields_table, single_row_data):
     # Cleanup: Delete only the remaining rows
     rows_remaining = [row.id for row in created_rows if row not in rows_to_delete]
     if rows_remaining:
-        all_fields_table.delete_rows(rows_remaining)
\ No newline at end of file
+        all_fields_table.delete_rows(rows_remaining)
+
+def test_update_rows_skip_unchanged(all_fields_table, single_row_data):
+    # Create rows to update
+    multiple_rows_data = generate_identical_rows(single_row_data, num_rows=3)
+    input_data = [
+        {key: value["input"] for key, value in row.items() if not value["read_only"]}
+        for row in multiple_rows_data
+    ]
+    created_rows = all_fields_table.add_rows(input_data)
+
+    # Change a single row; the others are identical to the server state
+    created_rows[0]["Notes"] = "Only this row changed"
+    result = all_fields_table.update_rows(
+        created_rows, skip_unchanged=True, on_error="bisect"
+    )
+
+    assert len(result.succeeded) == 1, "Only the changed row should have been sent."
+    assert result.skipped == 2, "Unchanged rows were not skipped."
+    assert all_fields_table.get_row(created_rows[0].id)["Notes"] == "Only this row changed"
+
+    # Clean up
+    all_fields_table.delete_rows([row.id for row in created_rows])
@@ -0,0 +1,30 @@
+import os
+
+from baserowapi.mock_server import MockBaserowServer
+
+
+def test_table_upload_files_reports_failures_per_file():
+    bike = os.path.join(os.path.dirname(__file__), "bike.jpg")
+    wheel = os.path.join(os.path.dirname(__file__), "bike_wheel.jpg")
+
+    # Step 1: Start a mock server with a table containing a file field
+    with MockBaserowServer() as server:
+        server.add_table(
+            1,
+            [{"name": "Name", "type": "text"}, {"name": "FileField", "type": "file"}],
+            rows=[{"Name": "Row 1"}, {"Name": "Row 2"}],
+        )
+        table = server.client().get_table(1)
+
+        # Step 2: Upload files for both rows, one of them missing
+        result = table.upload_files(
+            "FileField", {1: [bike, wheel], 2: [bike, "missing.jpg"]}, max_workers=4
+        )
+
+        # Step 3: Verify that only the row without failures was updated
+        assert [row.id for row in result.succeeded] == [1]
+        assert result.failed_indices == [3]
+        assert result.failures[0].item == (2, "missing.jpg")
+        rows = server.rows(1)
+        assert [file["visible_name"] for file in rows[0]["FileField"]] == ["bike.jpg", "bike_wheel.jpg"]
+        assert rows[1]["FileField"] == []
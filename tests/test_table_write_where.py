@@ -0,0 +1,69 @@
+import pytest
+
+from baserowapi import F, Filter
+from baserowapi.exceptions import BaserowHTTPError, RowDeleteError
+from baserowapi.mock_server import MockBaserowServer
+
+
+def test_delete_and_update_where(monkeypatch):
+    # Step 1: Start a mock server with 1000 rows, every third one expired
+    with MockBaserowServer() as server:
+        server.add_table(
+            1,
+            [
+                {"name": "Name", "type": "text"},
+                {"name": "Status", "type": "text"},
+                {"name": "Count", "type": "number"},
+            ],
+            rows=[
+                {
+                    "Name": f"Row {i}",
+                    "Status": "expired" if i % 3 == 0 else "active",
+                    "Count": i,
+                }
+                for i in range(1000)
+            ],
+        )
+        client = server.client()
+        client.batch_size = 50
+        table = client.get_table(1)
+        table.fields
+
+        # Step 2: Delete the expired rows while the following pages are fetched
+        deleted = table.delete_where([Filter("Status", "expired")], max_workers=3)
+        assert deleted == 334
+        assert table.count() == 666
+        assert table.count(filters=[Filter("Status", "expired")]) == 0
+
+        # Step 3: Write the same values to every matching row
+        updated = table.update_where(F("Count") < 100, {"Status": "archived"})
+        assert updated == 66
+        assert table.count(filters=[Filter("Status", "archived")]) == 66
+
+        # Step 4: Compute the values per row, skipping rows the function returns None for
+        updated = table.update_where(
+            [Filter("Status", "archived")],
+            lambda row: (
+                {"Name": row["Name"].upper()} if int(row["Count"]) % 2 else None
+            ),
+            include=["Name", "Count"],
+        )
+        assert updated == 33
+        assert table.get_row(2)["Name"] == "ROW 1"
+
+        # Step 5: Filters are required, and failed batches are reported with their offsets
+        with pytest.raises(ValueError):
+            table.delete_where([])
+
+        make_api_request = client.make_api_request
+
+        def failing_request(endpoint, method="GET", data=None, **kwargs):
+            if "batch-delete" in endpoint and 500 in data["items"]:
+                raise BaserowHTTPError(500, "Server error")
+            return make_api_request(endpoint, method=method, data=data, **kwargs)
+
+        monkeypatch.setattr(client, "make_api_request", failing_request)
+        with pytest.raises(RowDeleteError) as error:
+            table.delete_where([Filter("Status", "active")], max_workers=1)
+        assert error.value.failed_offset == 250
+        assert error.value.completed_offsets == [0, 50, 100, 150, 200]
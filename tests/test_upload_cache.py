@@ -0,0 +1,36 @@
+import os
+
+from baserowapi import UploadCache
+from baserowapi.mock_server import MockBaserowServer
+
+
+def test_upload_cache_reuses_descriptors_across_clients(tmp_path):
+    bike = os.path.join(os.path.dirname(__file__), "bike.jpg")
+    cache_path = tmp_path / "uploads.jsonl"
+
+    with MockBaserowServer() as server:
+        # Step 1: Upload the same content twice under different names
+        client = server.client(upload_cache=UploadCache(cache_path))
+        first = client.upload_file(bike)
+        requests_after_first = server.request_count
+        with open(bike, "rb") as f:
+            second = client.upload_file(f.read(), file_name="copy.jpg")
+
+        # Step 2: Verify the second upload was answered from the cache
+        assert server.request_count == requests_after_first
+        assert second["name"] == first["name"]
+        assert second["visible_name"] == "copy.jpg"
+        assert client.upload_cache.hits == 1
+
+        # Step 3: Verify a new client with the same cache file does not upload again
+        other = server.client(upload_cache=UploadCache(cache_path))
+        assert other.upload_file(bike)["name"] == first["name"]
+        assert server.request_count == requests_after_first
+
+        # Step 4: Verify the least recently used entry is evicted
+        small = server.client(upload_cache=UploadCache(max_entries=1))
+        small.upload_file(b"a", file_name="a.txt")
+        small.upload_file(b"b", file_name="b.txt")
+        small.upload_file(b"a", file_name="a.txt")
+        assert small.upload_cache.hits == 0
+        assert len(small.upload_cache) == 1